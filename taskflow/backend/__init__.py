@@ -4,11 +4,14 @@ from flask import Flask, Blueprint
 from flask_login import LoginManager
 from flask_cors import CORS
 from sqlalchemy.orm import declarative_base
-from backend.extensions import db, migrate, bcrypt, csrf
+from backend.extensions import (
+    db, migrate, bcrypt, csrf, password_hasher, response_cache, user_cache)
 from backend.config import Config, TestConfig
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from backend.utils.error_handlers import register_error_handlers
+from backend.utils.unit_of_work import register_unit_of_work
+from backend.utils.json_provider import FastJSONProvider
 from flasgger import Swagger
 import os
 
@@ -32,6 +35,7 @@ else:
 def create_app(config_name=None):
     """Creates Flask application."""
     app = Flask(__name__)
+    app.json = FastJSONProvider(app)
     if config_name == "testing":
         app.config.from_object(TestConfig)
     else:
@@ -39,10 +43,14 @@ def create_app(config_name=None):
     db.init_app(app)
     migrate.init_app(app, db)
     bcrypt.init_app(app)
+    password_hasher.init_app(app)
+    user_cache.init_app(app)
+    response_cache.init_app(app)
     limiter.init_app(app)
     csrf.init_app(app)
     Swagger(app, template_file="docs/api_overview.yml")
     register_error_handlers(app)
+    register_unit_of_work(app)
 
     CORS(app, supports_credentials=True)
     login_manager = LoginManager()
@@ -52,13 +60,16 @@ def create_app(config_name=None):
     from backend.models.user import User
     from backend.models.task import Task
     from backend.models.habit import Habit
+    from backend.models.habit_completion import HabitCompletion
     from backend.models.budget import Budget
     from backend.models.transaction import Transaction
     from backend.models.note import Note
+    from backend.models.tombstone import Tombstone
+    from backend.models.user_stats import UserStats
 
     @login_manager.user_loader
     def load_user(id):
-        return User.query.get(str(id))
+        return user_cache.load(User, str(id))
 
     @login_manager.unauthorized_handler
     def unauthorized():
@@ -70,6 +81,10 @@ def create_app(config_name=None):
     from .routes.budget_routes import budget_bp
     from .routes.transaction_routes import transaction_bp
     from .routes.note_routes import note_bp
+    from .routes.sync_routes import sync_bp
+    from .routes.dashboard_routes import dashboard_bp
+    from .routes.export_routes import export_bp
+    from .routes.search_routes import search_bp
 
     api_v1 = Blueprint("api_v1", __name__, url_prefix="/api/v1")
 
@@ -79,6 +94,10 @@ def create_app(config_name=None):
     api_v1.register_blueprint(budget_bp, url_prefix='/budgets')
     api_v1.register_blueprint(transaction_bp, url_prefix='/transactions')
     api_v1.register_blueprint(note_bp, url_prefix='/notes')
+    api_v1.register_blueprint(sync_bp, url_prefix='/sync')
+    api_v1.register_blueprint(dashboard_bp, url_prefix='/dashboard')
+    api_v1.register_blueprint(export_bp, url_prefix='/export')
+    api_v1.register_blueprint(search_bp, url_prefix='/search')
 
     app.register_blueprint(api_v1, strict_slashes=False)
 
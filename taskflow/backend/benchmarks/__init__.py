@@ -0,0 +1,6 @@
+"""
+Package that contains TaskFlow benchmarks.
+
+Benchmarks run against the testing configuration and are started from the
+`taskflow` directory, e.g. `python -m backend.benchmarks.write_queries`.
+"""
@@ -0,0 +1,49 @@
+"""
+Benchmark that calibrates the bcrypt cost for this host.
+
+Times one hash at each cost from `MIN_ROUNDS` up, stopping once a cost
+takes longer than the target, and prints the highest cost that stays
+under it. Use the result as BCRYPT_LOG_ROUNDS. The target defaults to
+250 ms and is read from BCRYPT_TARGET_MS.
+"""
+import os
+import time
+from flask_bcrypt import Bcrypt
+
+MIN_ROUNDS = 4
+MAX_ROUNDS = 16
+REPEAT = 3
+TARGET_MS = float(os.environ.get("BCRYPT_TARGET_MS", 250))
+
+
+def hash_ms(bcrypt: Bcrypt, rounds: int) -> float:
+    """Returns the best of `REPEAT` hash timings at a cost, in ms."""
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        bcrypt.generate_password_hash("bench-password", rounds=rounds)
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def calibrate(target_ms: float) -> int:
+    """Prints the timing of each cost and returns the one to use."""
+    bcrypt = Bcrypt()
+    chosen = MIN_ROUNDS
+    for rounds in range(MIN_ROUNDS, MAX_ROUNDS + 1):
+        elapsed = hash_ms(bcrypt, rounds)
+        print(f"cost {rounds:2d}: {elapsed:9.1f} ms")
+        if elapsed > target_ms:
+            break
+        chosen = rounds
+    return chosen
+
+
+def main() -> None:
+    """Prints the bcrypt cost that fits the target latency."""
+    print(f"target: {TARGET_MS:.0f} ms per hash")
+    print(f"BCRYPT_LOG_ROUNDS={calibrate(TARGET_MS)}")
+
+
+if __name__ == "__main__":
+    main()
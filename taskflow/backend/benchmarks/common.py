@@ -0,0 +1,61 @@
+"""Module that contains shared benchmark helpers."""
+import time
+from contextlib import contextmanager
+from flask import Flask
+from flask.testing import FlaskClient
+from sqlalchemy import event
+from backend import create_app, db, limiter
+from backend.models import User
+
+BENCH_EMAIL = "bench@example.com"
+BENCH_PASSWORD = "bench-password"
+
+
+def create_bench_app() -> Flask:
+    """Creates a testing app with CSRF and rate limits disabled."""
+    app = create_app("testing")
+    app.config["WTF_CSRF_ENABLED"] = False
+    limiter.enabled = False
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def create_bench_user() -> User:
+    """Creates the benchmark user. Must run inside an app context."""
+    user = User(name="bench", email=BENCH_EMAIL)
+    user.password = BENCH_PASSWORD
+    return user.save()
+
+
+def login(client: FlaskClient) -> None:
+    """Logs the benchmark user in through the login route."""
+    response = client.post("/api/v1/auth/login", json={
+        "email": BENCH_EMAIL,
+        "password": BENCH_PASSWORD
+    })
+    assert response.status_code == 200, response.get_json()
+
+
+@contextmanager
+def count_queries():
+    """Counts the SQL statements executed inside the block."""
+    statements = []
+
+    def on_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db.engine
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+
+
+def timed(func, repeat: int) -> float:
+    """Returns the mean seconds per call of `func` over `repeat` calls."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
@@ -0,0 +1,94 @@
+"""
+Benchmark that compares the dashboard endpoint with six list calls.
+
+Seeds a user with objects of every kind, then times loading the front
+page with the six calls it used to make (tasks, task analytics, habits,
+budgets, transactions and notes) and with one dashboard call. The
+response cache is disabled so both sides query the database.
+"""
+from datetime import timedelta
+from backend import db
+from backend.extensions import response_cache
+from backend.models import Task, Habit, Budget, Transaction, Note, User
+from backend.utils.cache import LRUCache
+from backend.utils.dates import utc_today
+from backend.utils.enums import (
+    BackgroundColor, BudgetCategory, Category, Frequency, Priority,
+    TransactionType)
+from .common import (
+    BENCH_EMAIL, count_queries, create_bench_app, create_bench_user, login,
+    timed)
+
+OBJECTS = 100
+REPEAT = 50
+SIX_CALLS = [
+    "/api/v1/tasks/",
+    "/api/v1/tasks/analytics",
+    "/api/v1/habits/",
+    "/api/v1/budgets/",
+    "/api/v1/transactions/",
+    "/api/v1/notes/",
+]
+DASHBOARD = ["/api/v1/dashboard/"]
+
+
+def seed(user_id: str) -> None:
+    """Adds `OBJECTS` objects of every kind for the user."""
+    today = utc_today()
+    for i in range(OBJECTS):
+        db.session.add_all([
+            Task(title=f"task {i}", description="bench " * 20,
+                 priority=list(Priority)[i % len(Priority)],
+                 deadline=today + timedelta(days=i),
+                 category=list(Category)[i % len(Category)],
+                 completed=bool(i % 2), user_id=user_id),
+            Habit(title=f"habit {i}", frequency=Frequency.DAILY,
+                  target_count=1, current_streak=i % 7,
+                  longest_streak=i % 30, priority=Priority.LOW,
+                  category=Category.HEALTH, user_id=user_id),
+            Budget(category=list(BudgetCategory)[i % len(BudgetCategory)],
+                   amount=100.0, spent=10.0, period=Frequency.MONTHLY,
+                   start_date=today - timedelta(days=10),
+                   end_date=today + timedelta(days=20), user_id=user_id),
+            Transaction(title=f"expense {i}", amount=1.5,
+                        type=TransactionType.EXPENSE,
+                        date=today - timedelta(days=i % 30),
+                        category=BudgetCategory.FOOD, user_id=user_id),
+            Note(title=f"note {i}", content="bench " * 200,
+                 background_color=BackgroundColor.BLUE, user_id=user_id),
+        ])
+    db.session.commit()
+
+
+def load(client, urls: list[str]) -> None:
+    """Requests every URL, failing on any error."""
+    for url in urls:
+        response = client.get(url)
+        assert response.status_code == 200, response.get_json()
+
+
+def main() -> None:
+    """Prints the latency and statement count of both front page loads."""
+    app = create_bench_app()
+    with app.app_context():
+        response_cache.local = LRUCache(maxsize=0)
+        create_bench_user()
+        seed(User.query.filter_by(email=BENCH_EMAIL).one().id)
+        client = app.test_client()
+        login(client)
+
+        print(f"{OBJECTS} objects of each kind, mean of {REPEAT} loads")
+        for name, urls in (("six calls", SIX_CALLS),
+                           ("dashboard", DASHBOARD)):
+            load(client, urls)
+            with count_queries() as statements:
+                load(client, urls)
+            seconds = timed(lambda: load(client, urls), REPEAT)
+            print(f"{name:10s} {len(urls)} requests "
+                  f"{len(statements):3d} statements "
+                  f"{seconds * 1000:8.2f} ms")
+        db.drop_all()
+
+
+if __name__ == "__main__":
+    main()
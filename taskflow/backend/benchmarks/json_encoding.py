@@ -0,0 +1,63 @@
+"""
+Benchmark that encodes a 500 task page with each JSON encoder.
+
+Compares Flask's standard library provider with `FastJSONProvider`,
+which uses orjson when it is installed.
+"""
+from datetime import date, timedelta
+from flask.json.provider import DefaultJSONProvider
+from backend.models import Task
+from backend.utils.enums import Priority, Category
+from backend.utils.json_provider import FastJSONProvider
+from .common import create_bench_app, timed
+
+PAGE_SIZE = 500
+REPEAT = 200
+
+
+def build_page() -> dict:
+    """Builds a json_response payload with a page of serialized tasks."""
+    tasks = [
+        Task(
+            title=f"task {i}",
+            description="Write comprehensive API documentation " * 4,
+            priority=list(Priority)[i % len(Priority)],
+            deadline=date(2025, 1, 1) + timedelta(days=i),
+            category=list(Category)[i % len(Category)],
+            completed=bool(i % 2),
+            user_id="bench-user"
+        ).to_dict()
+        for i in range(PAGE_SIZE)
+    ]
+    return {
+        "status": "success",
+        "data": {"tasks": tasks, "total": PAGE_SIZE, "pages": 1,
+                 "current_page": 1, "per_page": PAGE_SIZE},
+        "message": ""
+    }
+
+
+def main() -> None:
+    """Prints the mean time to encode one page with each provider."""
+    app = create_bench_app()
+    page = build_page()
+    providers = {
+        "stdlib": DefaultJSONProvider(app),
+        "fast": FastJSONProvider(app),
+    }
+
+    with app.test_request_context():
+        results = {
+            name: timed(lambda: provider.response(page), REPEAT)
+            for name, provider in providers.items()
+        }
+
+    if not providers["fast"].fast:
+        print("orjson is not installed, the fast provider uses stdlib.")
+    for name, seconds in results.items():
+        print(f"{name:<8}{seconds * 1000:>8.2f} ms per {PAGE_SIZE} tasks")
+    print(f"speedup {results['stdlib'] / results['fast']:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark that measures login throughput under concurrent clients.
+
+Each client thread logs in repeatedly through the login route at the
+configured bcrypt cost, first without a limit on concurrent hashes and
+then with the `PasswordHasher` limit, and prints logins per second and the
+hashing metrics.
+"""
+import os
+import threading
+import time
+from flask import Flask
+from backend.extensions import bcrypt, password_hasher
+from .common import create_bench_app, create_bench_user, login
+
+CLIENTS = 16
+LOGINS_PER_CLIENT = 8
+LOG_ROUNDS = int(os.environ.get("BCRYPT_LOG_ROUNDS", 10))
+
+
+def run_clients(app: Flask) -> float:
+    """Logs every client in concurrently, returning logins per second."""
+    barrier = threading.Barrier(CLIENTS + 1)
+
+    def client_loop():
+        client = app.test_client()
+        barrier.wait()
+        for _ in range(LOGINS_PER_CLIENT):
+            login(client)
+
+    threads = [threading.Thread(target=client_loop) for _ in range(CLIENTS)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return CLIENTS * LOGINS_PER_CLIENT / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Prints login throughput with and without the hashing limit."""
+    app = create_bench_app()
+    app.config["BCRYPT_LOG_ROUNDS"] = LOG_ROUNDS
+    app.config["BCRYPT_POOL_SIZE"] = os.cpu_count()
+    bcrypt.init_app(app)
+    password_hasher.init_app(app)
+    with app.app_context():
+        create_bench_user()
+
+    print(f"{CLIENTS} clients x {LOGINS_PER_CLIENT} logins, "
+          f"cost {LOG_ROUNDS}, pool size {password_hasher.pool_size}")
+
+    slots, password_hasher.slots = password_hasher.slots, None
+    print(f"unbounded:       {run_clients(app):8.1f} logins/s")
+
+    password_hasher.slots = slots
+    print(f"bounded hashing: {run_clients(app):8.1f} logins/s")
+    for key, value in password_hasher.stats().items():
+        print(f"  {key}: {value:.4f}" if isinstance(value, float)
+              else f"  {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Benchmark that measures the throughput of the CSV transaction import.
+
+Imports growing numbers of expenses for the benchmark user and prints the
+rows per second reported by the import summary.
+"""
+import io
+from datetime import date, timedelta
+from backend import db
+from backend.models import User
+from backend.utils.transaction_import import import_transactions
+from .common import BENCH_EMAIL, create_bench_app, create_bench_user
+
+SIZES = [1000, 10000, 50000]
+HEADER = "title,description,amount,type,date,category\n"
+
+
+def make_csv(rows: int) -> io.StringIO:
+    """Returns a CSV stream of `rows` expenses."""
+    start = date(2025, 6, 1)
+    lines = [f"expense {i},,{i % 50 + 0.5},EXPENSE,"
+             f"{start + timedelta(days=i % 28)},FOOD\n"
+             for i in range(rows)]
+    return io.StringIO(HEADER + "".join(lines))
+
+
+def main() -> None:
+    """Prints the duration and throughput of each import."""
+    app = create_bench_app()
+    with app.app_context():
+        create_bench_user()
+        user_id = User.query.filter_by(email=BENCH_EMAIL).one().id
+
+        for size in SIZES:
+            summary, errors = import_transactions(make_csv(size), user_id)
+            assert errors == [], errors
+            print(f"{summary['rows']:6d} rows {summary['seconds']:8.3f} s "
+                  f"{summary['rows_per_second']:10.1f} rows/s")
+        db.drop_all()
+
+
+if __name__ == "__main__":
+    main()
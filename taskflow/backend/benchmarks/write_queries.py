@@ -0,0 +1,93 @@
+"""
+Benchmark that counts SQL statements per write request.
+
+Runs each write route once with the current save path and once with the
+previous one, which committed inside `save` and re-read the row with
+`refresh=True`, and prints the statement count of each request.
+"""
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from unittest import mock
+from backend import db
+from backend.models import BaseModel
+from .common import create_bench_app, create_bench_user, login, count_queries
+
+TASK = {
+    "title": "bench task",
+    "description": "bench",
+    "priority": "HIGH",
+    "deadline": "2025-06-30",
+    "category": "WORK"
+}
+TRANSACTION = {
+    "title": "bench expense",
+    "amount": 10.0,
+    "type": "EXPENSE",
+    "date": "2025-06-01",
+    "category": "FOOD"
+}
+
+
+def legacy_save(self, refresh: bool = True):
+    """The previous save: commit immediately, then re-read the row."""
+    self.updated_at = datetime.now(timezone.utc)
+    db.session.add(self)
+    db.session.commit()
+    db.session.refresh(self)
+    return self
+
+
+@contextmanager
+def save_strategy(legacy: bool):
+    """Uses the legacy save inside the block when `legacy` is set."""
+    if not legacy:
+        yield
+        return
+    with mock.patch.object(BaseModel, "save", legacy_save):
+        yield
+
+
+def measure(legacy: bool) -> dict:
+    """Returns the statement count of each write request."""
+    app = create_bench_app()
+    counts = {}
+    with app.app_context():
+        create_bench_user()
+        client = app.test_client()
+        login(client)
+
+        with save_strategy(legacy):
+            requests = [
+                ("create task", "post", "/api/v1/tasks/", TASK),
+                ("edit task", "patch", "/api/v1/tasks/{id}",
+                 {"title": "edited"}),
+                ("complete task", "patch", "/api/v1/tasks/{id}/complete",
+                 None),
+                ("create transaction", "post", "/api/v1/transactions/",
+                 TRANSACTION),
+            ]
+            task_id = None
+            for name, method, url, payload in requests:
+                with count_queries() as statements:
+                    response = getattr(client, method)(
+                        url.format(id=task_id), json=payload)
+                assert response.status_code < 300, response.get_json()
+                if task_id is None:
+                    task_id = response.get_json()["data"]["id"]
+                counts[name] = len(statements)
+        db.drop_all()
+    return counts
+
+
+def main() -> None:
+    """Prints statements per write request before and after."""
+    before = measure(legacy=True)
+    after = measure(legacy=False)
+
+    print(f"{'request':<22}{'before':>8}{'after':>8}")
+    for name in before:
+        print(f"{name:<22}{before[name]:>8}{after[name]:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -26,6 +26,20 @@ class Config():
                        "falling back to filesystem session storage.")
         SESSION_TYPE = "filesystem"
         SESSION_REDIS = None
+    USER_CACHE_TTL = int(os.environ.get("USER_CACHE_TTL", 60))
+    USER_CACHE_SIZE = int(os.environ.get("USER_CACHE_SIZE", 1024))
+    USER_CACHE_REDIS = SESSION_REDIS \
+        if os.environ.get("USER_CACHE_USE_REDIS") == "1" else None
+    BCRYPT_LOG_ROUNDS = int(os.environ.get("BCRYPT_LOG_ROUNDS", 12))
+    BCRYPT_POOL_SIZE = int(os.environ.get("BCRYPT_POOL_SIZE", 0)) or None
+    SYNC_LAG_SECONDS = int(os.environ.get("SYNC_LAG_SECONDS", 5))
+    TOMBSTONE_RETENTION_DAYS = int(
+        os.environ.get("TOMBSTONE_RETENTION_DAYS", 30))
+    RESPONSE_CACHE_TTL = int(os.environ.get("RESPONSE_CACHE_TTL", 60))
+    RESPONSE_CACHE_SIZE = int(os.environ.get("RESPONSE_CACHE_SIZE", 1024))
+    RESPONSE_CACHE_REDIS = SESSION_REDIS
+    EXPORT_BATCH_SIZE = int(os.environ.get("EXPORT_BATCH_SIZE", 1000))
+    IMPORT_CHUNK_SIZE = int(os.environ.get("IMPORT_CHUNK_SIZE", 1000))
 
 
 class TestConfig():
@@ -38,3 +52,15 @@ class TestConfig():
     SESSION_TYPE = "filesystem"
     SESSION_PERMANENT = False
     SESSION_KEY_PREFIX = "taskflow_test:"
+    USER_CACHE_TTL = 60
+    USER_CACHE_SIZE = 128
+    USER_CACHE_REDIS = None
+    BCRYPT_LOG_ROUNDS = 4
+    BCRYPT_POOL_SIZE = 2
+    SYNC_LAG_SECONDS = 0
+    TOMBSTONE_RETENTION_DAYS = 30
+    RESPONSE_CACHE_TTL = 60
+    RESPONSE_CACHE_SIZE = 128
+    RESPONSE_CACHE_REDIS = None
+    EXPORT_BATCH_SIZE = 2
+    IMPORT_CHUNK_SIZE = 2
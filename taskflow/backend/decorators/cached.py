@@ -0,0 +1,58 @@
+"""Module that contains the cached_response decorator."""
+from functools import wraps
+from typing import Callable
+from flask import current_app, make_response, request
+from flask_login import current_user
+from ..extensions import response_cache
+
+
+def is_first_page() -> bool:
+    """Checks if the request reads the first page of a list."""
+    return request.args.get("page", "1") == "1" \
+        and not request.args.get("cursor")
+
+
+def cached_response(model, *models: type,
+                    key: Callable[[], str] = None):
+    """
+    Decorator that serves a route's response from the response cache.
+
+    Only first pages are cached, since clients mostly read those. Entries
+    are keyed by the user's collection version, which every committed
+    write to the collection changes.
+
+    Args:
+        model (type): The model class of the collection the route reads.
+        *models (type): Other collections the response depends on. Their
+            versions are added to the entry key.
+        key (Callable[[], str]): Returns a value the response depends on
+            besides the request, added to the entry key.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if not is_first_page():
+                return f(*args, **kwargs)
+
+            request_key = request.full_path
+            for other in models:
+                version = response_cache.version(other, current_user.id)
+                if version is None:
+                    return f(*args, **kwargs)
+                request_key += f"|{other.__tablename__}:{version}"
+            if key is not None:
+                request_key += f"|{key()}"
+
+            entry_key, body = response_cache.get(
+                model, current_user.id, request_key)
+            if body is not None:
+                return current_app.response_class(
+                    body, mimetype="application/json")
+
+            response = make_response(f(*args, **kwargs))
+            if response.status_code == 200:
+                response_cache.set(entry_key, response.get_data())
+            return response
+
+        return decorated_function
+    return decorator
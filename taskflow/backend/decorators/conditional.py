@@ -0,0 +1,53 @@
+"""Module that contains the conditional_get decorator."""
+import hashlib
+from functools import wraps
+from flask import current_app, make_response, request
+from flask_login import current_user
+from ..utils.db_helpers import collection_version
+
+
+def not_modified(etag: str, last_modified) -> bool:
+    """Checks the request's validators against the collection's."""
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if request.if_modified_since and last_modified:
+        return last_modified.replace(microsecond=0) \
+            <= request.if_modified_since.replace(tzinfo=None)
+    return False
+
+
+def conditional_get(model):
+    """
+    Decorator that answers unchanged GET requests with 304 Not Modified.
+
+    The ETag is built from the user's collection version and the query
+    string, so a 304 skips both the route's query and its serialization.
+
+    Args:
+        model (type): The model class of the collection the route reads.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            last_modified, count = collection_version(model, current_user.id)
+            key = (f"{model.__tablename__}:{current_user.id}:"
+                   f"{last_modified}:{count}:{request.path}:"
+                   f"{request.query_string.decode()}")
+            etag = hashlib.sha1(key.encode()).hexdigest()
+
+            if not_modified(etag, last_modified):
+                response = current_app.response_class(status=304)
+            else:
+                response = make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag, weak=True)
+            if last_modified:
+                response.last_modified = last_modified
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+            return response
+
+        return decorated_function
+    return decorator
@@ -3,8 +3,14 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_bcrypt import Bcrypt
 from flask_wtf import CSRFProtect
+from backend.utils.password_hasher import PasswordHasher
+from backend.utils.response_cache import ResponseCache
+from backend.utils.user_cache import UserCache
 
 db = SQLAlchemy()
 migrate = Migrate()
 bcrypt = Bcrypt()
+password_hasher = PasswordHasher(bcrypt)
 csrf = CSRFProtect()
+user_cache = UserCache()
+response_cache = ResponseCache()
@@ -2,6 +2,10 @@ from .base_model import BaseModel
 from .user import User
 from .task import Task
 from .habit import Habit
+from .habit_completion import HabitCompletion
 from .budget import Budget
 from .transaction import Transaction
 from .note import Note
+from .tombstone import Tombstone
+from .user_stats import UserStats
+from . import search_index
@@ -1,16 +1,19 @@
 """Module that contains BaseModel."""
 from backend import Base, db
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, inspect
+from sqlalchemy.orm.attributes import set_committed_value
 from uuid import uuid4
-from datetime import datetime, date, timezone
-from enum import Enum
+from datetime import datetime, timezone
 from ..utils.logger import logger
+from ..utils.unit_of_work import commit_or_flush
+from ..utils.serializers import get_serializer
 from typing import Self
 
 
 class BaseModel(Base, db.Model):
     """Defines all common attributes and methods for all the other classes."""
     __abstract__ = True
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(String(36), nullable=False, primary_key=True,
                 default=lambda: str(uuid4()))
@@ -35,12 +38,27 @@ class BaseModel(Base, db.Model):
                 if key != "__class__":
                     setattr(self, key, value)
 
+        # Columns without a default are inserted as NULL. Record that now so
+        # serializing the object after the INSERT does not reload them.
+        for attr in inspect(type(self)).column_attrs:
+            column = attr.columns[0]
+            if (attr.key not in self.__dict__ and column.default is None
+                    and column.server_default is None):
+                set_committed_value(self, attr.key, None)
+
     def save(self, refresh: bool = False) -> Self:
-        """Saves the object to the database."""
+        """
+        Saves the object to the database.
+
+        Inside a request the change is only staged, and the request's unit
+        of work commits it. Server-generated values are returned by the
+        INSERT or UPDATE itself (eager defaults), so `refresh` is only
+        needed after a commit expired the object.
+        """
         self.updated_at = datetime.now(timezone.utc)
         try:
             db.session.add(self)
-            db.session.commit()
+            commit_or_flush()
             if refresh:
                 db.session.refresh(self)
             return self
@@ -52,10 +70,15 @@ class BaseModel(Base, db.Model):
             raise
 
     def delete(self) -> None:
-        """Deletes the object from the database."""
+        """
+        Deletes the object from the database.
+
+        Inside a request the deletion is only staged, and the request's unit
+        of work commits it.
+        """
         try:
             db.session.delete(self)
-            db.session.commit()
+            commit_or_flush()
         except Exception as e:
             db.session.rollback()
             logger.error(f"[{self.__class__.__name__}] Delete failed: "
@@ -65,17 +88,7 @@ class BaseModel(Base, db.Model):
 
     def to_dict(self) -> dict:
         """Returns a dict with object attributes."""
-        dict_rep = {}
-        for key, value in self.__dict__.items():
-            if not key.startswith("_") and key != "password":
-                if isinstance(value, datetime):
-                    value = value.strftime('%Y-%m-%d %H:%M:%S')
-                elif isinstance(value, date):
-                    value = value.strftime('%Y-%m-%d')
-                elif isinstance(value, Enum):
-                    value = value.name
-                dict_rep[key] = value
-        return dict_rep
+        return get_serializer(type(self))(self)
 
     def __str__(self) -> str:
         """Returns a string representation of the object."""
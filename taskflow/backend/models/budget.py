@@ -1,16 +1,28 @@
 """Module that contains the Budget class."""
 from .base_model import BaseModel
-from sqlalchemy import (Column, String, Float, Date,
-                        ForeignKey, Enum as SqlEnum)
+from backend import db
+from sqlalchemy import (Column, Index, String, Float, Date,
+                        ForeignKey, Enum as SqlEnum, func, select, update)
 from sqlalchemy.orm import relationship
+from sqlalchemy.orm.util import identity_key
 from ..utils.enums import BudgetCategory, Frequency, TransactionType
 from ..models.transaction import Transaction
-from datetime import date
+from ..utils.logger import logger
+from ..utils.unit_of_work import commit_or_flush, mark_changed
+from datetime import date, datetime, timezone
+
+# Session info key of the (user_id, category, start_date, end_date, delta)
+# rows `Budget.adjust_spent` changed in the current transaction.
+SPENT_CHANGES_KEY = "budget_spent_changes"
 
 
 class Budget(BaseModel):
     """Represents a budget in the application."""
     __tablename__ = "budgets"
+    __table_args__ = (
+        Index("ix_budgets_user_id_updated_at", "user_id", "updated_at", "id"),
+        Index("ix_budgets_user_id_category", "user_id", "category"),
+    )
     category = Column(SqlEnum(BudgetCategory, name="category_enum"),
                       nullable=False)
     amount = Column(Float, nullable=False)
@@ -24,14 +36,106 @@ class Budget(BaseModel):
 
     def recalculate_budget(self,):
         """Recalculates and updates the spent amount for the user's budget."""
-        expenses = Transaction.query.filter_by(
-            user_id=self.user_id,
-            category=self.category,
-            type=TransactionType.EXPENSE
+        self.spent = db.session.query(
+            func.coalesce(func.sum(Transaction.amount), 0.0)
         ).filter(
+            Transaction.user_id == self.user_id,
+            Transaction.category == self.category,
+            Transaction.type == TransactionType.EXPENSE,
             Transaction.date >= self.start_date,
             Transaction.date <= self.end_date
+        ).scalar()
+        self.save()
+
+    def spent_window(self) -> tuple:
+        """Returns the fields that decide which expenses the budget covers."""
+        return (self.id, self.user_id, self.category,
+                self.start_date, self.end_date)
+
+    @classmethod
+    def adjust_spent(
+        cls,
+        user_id: str,
+        category: BudgetCategory,
+        on_date: date,
+        delta: float
+    ) -> None:
+        """
+        Adds an expense delta to every budget that covers a date.
+
+        The change is applied with a single UPDATE, so its cost does not
+        depend on the user's transaction history. The changed budgets are
+        returned by the UPDATE and recorded under `SPENT_CHANGES_KEY`, so
+        the dashboard stats can apply the delta without a recount.
+
+        Args:
+            user_id (str): The id of the user that owns the budgets.
+            category (BudgetCategory): The category of the expense.
+            on_date (date): The date of the expense.
+            delta (float): The amount to add, negative to remove an expense.
+        """
+        windows = db.session.execute(
+            update(cls).where(
+                cls.user_id == user_id,
+                cls.category == category,
+                cls.start_date <= on_date,
+                cls.end_date >= on_date
+            ).values(
+                spent=cls.spent + delta,
+                updated_at=datetime.now(timezone.utc)
+            ).returning(cls.start_date, cls.end_date)
         ).all()
+        db.session.info.setdefault(SPENT_CHANGES_KEY, []).extend(
+            (user_id, category, start_date, end_date, delta)
+            for start_date, end_date in windows)
+        mark_changed(cls.__tablename__, user_id, tracked=True)
 
-        self.spent = sum(e.amount for e in expenses)
-        self.save()
+    @classmethod
+    def reconcile(cls, user_id: str = None,
+                  budget_ids: list[str] = None) -> None:
+        """
+        Recalculates the spent amount of budgets from their transactions.
+
+        Repairs any drift in the incrementally maintained `spent` values.
+        Only drifted budgets are written, and their `updated_at` is bumped
+        so clients see the change. Loaded budgets are expired so they read
+        the new values.
+
+        Args:
+            user_id (str): Only reconcile this user's budgets, all if None.
+            budget_ids (list[str]): Only reconcile these budgets, all if
+                None.
+        """
+        expenses = select(
+            func.coalesce(func.sum(Transaction.amount), 0.0)
+        ).where(
+            Transaction.user_id == cls.user_id,
+            Transaction.category == cls.category,
+            Transaction.type == TransactionType.EXPENSE,
+            Transaction.date >= cls.start_date,
+            Transaction.date <= cls.end_date
+        ).scalar_subquery()
+
+        statement = update(cls).where(cls.spent != expenses).values(
+            spent=expenses, updated_at=datetime.now(timezone.utc)
+        ).returning(cls.id, cls.user_id).execution_options(
+            synchronize_session=False)
+        if user_id:
+            statement = statement.where(cls.user_id == user_id)
+        if budget_ids is not None:
+            statement = statement.where(cls.id.in_(budget_ids))
+
+        try:
+            changed = db.session.execute(statement).all()
+            for budget_id, changed_user_id in changed:
+                mark_changed(cls.__tablename__, changed_user_id)
+                budget = db.session.identity_map.get(
+                    identity_key(cls, budget_id))
+                if budget is not None:
+                    db.session.expire(budget, ["spent", "updated_at"])
+            commit_or_flush()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"[{cls.__name__}] Reconcile failed: "
+                         f"{str(e.orig) if hasattr(e, 'orig') else e}")
+            raise
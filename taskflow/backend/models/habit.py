@@ -1,16 +1,35 @@
 """Module that contains the Habit class."""
 from .base_model import BaseModel
-from sqlalchemy import (Column, String, Integer, Date, Boolean, Text,
-                        ForeignKey, Enum as SqlEnum)
+from .habit_completion import (HabitCompletion, compute_streaks,
+                               period_index, period_start,
+                               required_completions)
+from sqlalchemy import (Column, Index, String, Integer, Date, Boolean, Text,
+                        ForeignKey, Enum as SqlEnum, and_, func, or_, select,
+                        update)
 from sqlalchemy.orm import relationship, validates
+from sqlalchemy.orm.util import identity_key
+from ..extensions import db
+from ..utils.dates import utc_today
 from ..utils.enums import BackgroundColor, Priority, Category, Frequency
+from ..utils.logger import logger
+from ..utils.unit_of_work import commit_or_flush, mark_changed
 from ..utils.validators import validate_string_field
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta, timezone
+from itertools import chain, groupby
 
 
 class Habit(BaseModel):
-    """Represents a habit in the application."""
+    """
+    Represents a habit in the application.
+
+    `current_streak` changes when a period meets its target, and is reset
+    to 0 in the database once a whole period passes without a completion,
+    see `reset_broken_streaks`.
+    """
     __tablename__ = "habits"
+    __table_args__ = (
+        Index("ix_habits_user_id_updated_at", "user_id", "updated_at", "id"),
+    )
 
     title = Column(String(30), nullable=False)
     description = Column(Text, nullable=True)
@@ -51,20 +70,231 @@ class Habit(BaseModel):
         )
         return value
 
-    def mark_complete(self) -> None:
-        """Marks the habit as completed for today."""
-        today = date.today()
-        if self.last_completed == today:
+    @property
+    def frequency_value(self) -> Frequency:
+        """Returns the frequency, converting a name set from request data."""
+        if isinstance(self.frequency, str):
+            return Frequency[self.frequency]
+        return self.frequency
+
+    def streak_rule(self) -> tuple:
+        """Returns the fields that decide how the habit's streak counts."""
+        return (self.id, self.frequency_value, self.target_count)
+
+    def count_completions(self, period: int) -> int:
+        """
+        Counts the habit's completions in one of its periods.
+
+        A period has at most 31 days, so this is a bounded range scan of the
+        (habit_id, day) index.
+        """
+        frequency = self.frequency_value
+        return db.session.scalar(
+            select(func.count()).where(
+                HabitCompletion.habit_id == self.id,
+                HabitCompletion.day >= period_start(frequency, period),
+                HabitCompletion.day < period_start(frequency, period + 1)
+            )
+        )
+
+    def mark_complete(self, day: date = None) -> None:
+        """
+        Records a completion of the habit and updates its streaks.
+
+        A period (a day, week or month, depending on the frequency) counts
+        toward the streak once it has `target_count` completions, and the
+        streak continues when the previous period counted too. The update
+        looks at the last completion and at most two periods of history, so
+        its cost does not grow with the habit's age.
+
+        Args:
+            day (date): The day the habit was completed, today by default.
+
+        Raises:
+            ValueError: If the habit was already completed that day or later.
+        """
+        day = day or utc_today()
+        last = self.last_completed
+        if last == day:
             raise ValueError("Habit already completed today.")
-        yesterday = today - timedelta(days=1)
-        if self.last_completed == yesterday:
-            self.current_streak += 1
-        else:
-            self.current_streak = 1
+        if last is not None and day < last:
+            raise ValueError("Habit completions must be recorded in order.")
 
-        self.last_completed = today
+        frequency = self.frequency_value
+        required = required_completions(frequency, self.target_count)
+        period = period_index(frequency, day)
+        in_period = 0
+        if last is not None and period_index(frequency, last) == period:
+            in_period = 1 if required == 1 else self.count_completions(period)
 
-        if self.current_streak > self.longest_streak:
-            self.longest_streak = self.current_streak
+        if in_period + 1 == required:
+            if required == 1:
+                continued = (last is not None
+                             and period_index(frequency, last) == period - 1)
+            else:
+                continued = self.count_completions(period - 1) >= required
+            self.current_streak = \
+                (self.current_streak or 0) + 1 if continued else 1
+            self.longest_streak = max(self.longest_streak or 0,
+                                      self.current_streak)
 
+        self.last_completed = day
+        db.session.add(HabitCompletion(
+            habit_id=self.id, user_id=self.user_id, day=day))
         self.save()
+
+    @classmethod
+    def completion_bitsets(cls, user_id: str, start: date,
+                           days: int) -> dict[str, int]:
+        """
+        Returns which days each of a user's habits was completed on.
+
+        The habits and their completions in the window are read with one
+        query, and every completion sets one bit of its habit's bitset.
+
+        Args:
+            user_id (str): The id of the user.
+            start (date): The first day of the window.
+            days (int): The number of days in the window.
+
+        Returns:
+            dict[str, int]: A bitset per habit id, where bit i is set when
+                the habit was completed on `start + i` days. Habits without
+                completions in the window have an empty bitset.
+        """
+        rows = db.session.execute(
+            select(cls.id, HabitCompletion.day).outerjoin(
+                HabitCompletion, and_(
+                    HabitCompletion.habit_id == cls.id,
+                    HabitCompletion.day >= start,
+                    HabitCompletion.day < start + timedelta(days=days)
+                )
+            ).where(cls.user_id == user_id)
+        )
+        bitsets = {}
+        for habit_id, day in rows:
+            bits = bitsets.get(habit_id, 0)
+            if day is not None:
+                bits |= 1 << (day - start).days
+            bitsets[habit_id] = bits
+        return bitsets
+
+    @classmethod
+    def reset_broken_streaks(cls, user_id: str = None) -> int:
+        """
+        Resets the current streak of habits that missed a whole period.
+
+        A streak is broken once the habit's last completion is before the
+        previous period, the same rule `is_streak_broken` applies. All of
+        them are reset with one UPDATE, and loaded habits among them are
+        expired so they read the new values.
+
+        Args:
+            user_id (str): Only reset this user's habits, all if None.
+
+        Returns:
+            int: The number of reset habits.
+        """
+        today = utc_today()
+        broken = [
+            and_(cls.frequency == frequency,
+                 cls.last_completed < period_start(
+                     frequency, period_index(frequency, today) - 1))
+            for frequency in Frequency
+        ]
+        statement = update(cls).where(
+            cls.current_streak > 0,
+            or_(cls.last_completed.is_(None), *broken)
+        ).values(
+            current_streak=0, updated_at=datetime.now(timezone.utc)
+        ).returning(cls.id, cls.user_id).execution_options(
+            synchronize_session=False)
+        if user_id:
+            statement = statement.where(cls.user_id == user_id)
+
+        try:
+            reset = db.session.execute(statement).all()
+            for habit_id, reset_user_id in reset:
+                mark_changed(cls.__tablename__, reset_user_id)
+                habit = db.session.identity_map.get(
+                    identity_key(cls, habit_id))
+                if habit is not None:
+                    db.session.expire(habit, ["current_streak", "updated_at"])
+            commit_or_flush()
+            return len(reset)
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"[{cls.__name__}] Streak reset failed: "
+                         f"{str(e.orig) if hasattr(e, 'orig') else e}")
+            raise
+
+    @classmethod
+    def rebuild_streaks(cls, user_id: str = None,
+                        habit_ids: list[str] = None) -> int:
+        """
+        Recomputes the streaks of habits from their completion history.
+
+        The completions of every habit are read with one query, ordered by
+        habit and day, and the streaks are computed in a single pass over
+        the rows. Streaks broken by today are reset. Only habits whose
+        values changed are written, with one bulk UPDATE, and loaded
+        habits among them are expired so they read the new values.
+
+        Args:
+            user_id (str): Only rebuild this user's habits, all if None.
+            habit_ids (list[str]): Only rebuild these habits, all if None.
+
+        Returns:
+            int: The number of habits whose streaks changed.
+        """
+        statement = select(
+            cls.id, cls.user_id, cls.frequency, cls.target_count,
+            cls.current_streak, cls.longest_streak, cls.last_completed,
+            HabitCompletion.day
+        ).outerjoin(
+            HabitCompletion, HabitCompletion.habit_id == cls.id
+        ).order_by(cls.id, HabitCompletion.day).execution_options(
+            yield_per=1000)
+        if user_id:
+            statement = statement.where(cls.user_id == user_id)
+        if habit_ids is not None:
+            statement = statement.where(cls.id.in_(habit_ids))
+
+        today = utc_today()
+        now = datetime.now(timezone.utc)
+        changes = []
+        changed_users = set()
+        try:
+            for _, rows in groupby(db.session.execute(statement),
+                                   key=lambda row: row.id):
+                first = next(rows)
+                days = (row.day for row in chain([first], rows)
+                        if row.day is not None)
+                streaks = compute_streaks(
+                    first.frequency, first.target_count, days, today)
+                if streaks == (first.current_streak, first.longest_streak,
+                               first.last_completed):
+                    continue
+                current, longest, last = streaks
+                changes.append({"id": first.id, "current_streak": current,
+                                "longest_streak": longest,
+                                "last_completed": last, "updated_at": now})
+                changed_users.add(first.user_id)
+
+            if changes:
+                db.session.execute(update(cls), changes)
+            for change in changes:
+                habit = db.session.identity_map.get(
+                    identity_key(cls, change["id"]))
+                if habit is not None:
+                    db.session.expire(habit)
+            for changed_user_id in changed_users:
+                mark_changed(cls.__tablename__, changed_user_id)
+            commit_or_flush()
+            return len(changes)
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"[{cls.__name__}] Streak rebuild failed: "
+                         f"{str(e.orig) if hasattr(e, 'orig') else e}")
+            raise
+
@@ -0,0 +1,137 @@
+"""Module that contains the HabitCompletion class."""
+from .base_model import BaseModel
+from datetime import date
+from typing import Iterable
+from sqlalchemy import Column, Date, ForeignKey, Index, String, delete, event
+from ..extensions import db
+from ..utils.enums import Frequency
+from ..utils.unit_of_work import mark_changed
+
+# The longest period of each frequency that always fits, in days. With at
+# most one completion per day, a period can't need more completions.
+PERIOD_DAYS = {
+    Frequency.DAILY: 1,
+    Frequency.WEEKLY: 7,
+    Frequency.MONTHLY: 28,
+}
+
+
+def period_index(frequency: Frequency, day: date) -> int:
+    """
+    Returns the number of the period a day falls in.
+
+    Consecutive periods have consecutive numbers: days for daily habits,
+    Monday to Sunday weeks for weekly habits and calendar months for
+    monthly habits.
+    """
+    if frequency == Frequency.DAILY:
+        return day.toordinal()
+    if frequency == Frequency.WEEKLY:
+        return (day.toordinal() - 1) // 7
+    return day.year * 12 + day.month - 1
+
+
+def period_start(frequency: Frequency, index: int) -> date:
+    """Returns the first day of a period numbered by `period_index`."""
+    if frequency == Frequency.DAILY:
+        return date.fromordinal(index)
+    if frequency == Frequency.WEEKLY:
+        return date.fromordinal(index * 7 + 1)
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def required_completions(frequency: Frequency, target_count: int) -> int:
+    """Returns the completions a period needs to count toward a streak."""
+    return max(1, min(target_count or 1, PERIOD_DAYS[frequency]))
+
+
+def is_streak_broken(frequency: Frequency, last_day: date | None,
+                     today: date) -> bool:
+    """
+    Checks if a whole period passed since a streak last counted.
+
+    The streak can still continue while `last_day` is in the current
+    period or the one before it.
+    """
+    if last_day is None:
+        return True
+    return period_index(frequency, today) \
+        - period_index(frequency, last_day) > 1
+
+
+def compute_streaks(
+    frequency: Frequency,
+    target_count: int,
+    days: Iterable[date],
+    today: date = None
+) -> tuple[int, int, date | None]:
+    """
+    Computes a habit's streaks from its completion days in one pass.
+
+    A period counts toward a streak once it has the required completions,
+    and the streak continues when the previous period counted too. This
+    gives the same result as applying `Habit.mark_complete` day by day.
+
+    Args:
+        frequency (Frequency): The habit's frequency.
+        target_count (int): The completions the habit asks for per period.
+        days (Iterable[date]): The completion days, in ascending order.
+        today (date): When given, the current streak is 0 if it is broken
+            on this day, instead of the streak as of the last completion.
+
+    Returns:
+        tuple[int, int, date | None]: The current streak, the longest
+            streak and the last completion day.
+    """
+    required = required_completions(frequency, target_count)
+    current = longest = 0
+    last_day = last_met = period = None
+    count = 0
+    for day in days:
+        index = period_index(frequency, day)
+        if index != period:
+            period, count = index, 0
+        count += 1
+        last_day = day
+        if count == required:
+            current = current + 1 if last_met == index - 1 else 1
+            last_met = index
+            longest = max(longest, current)
+    if today is not None and last_met is not None \
+            and period_index(frequency, today) - last_met > 1:
+        current = 0
+    return current, longest, last_day
+
+
+class HabitCompletion(BaseModel):
+    """
+    Records that a habit was completed on a day.
+
+    Completions are only appended. A habit can be completed once per day,
+    which the unique (habit_id, day) index enforces.
+    """
+    __tablename__ = "habit_completions"
+    __table_args__ = (
+        Index("ix_habit_completions_habit_id_day",
+              "habit_id", "day", unique=True),
+        Index("ix_habit_completions_user_id_day", "user_id", "day"),
+    )
+    habit_id = Column(String(36), ForeignKey('habits.id', ondelete="CASCADE"),
+                      nullable=False)
+    day = Column(Date, nullable=False)
+
+    user_id = Column(String(36), ForeignKey('users.id'), nullable=False)
+
+
+@event.listens_for(db.session, "before_flush")
+def delete_completions(session, flush_context, instances) -> None:
+    """Deletes the completions of habits deleted in the flush."""
+    habits = [obj for obj in session.deleted
+              if getattr(obj, "__tablename__", None) == "habits"]
+    if not habits:
+        return
+    session.execute(delete(HabitCompletion.__table__).where(
+        HabitCompletion.__table__.c.habit_id.in_(
+            [habit.id for habit in habits])))
+    for habit in habits:
+        mark_changed(HabitCompletion.__tablename__, habit.user_id)
@@ -1,6 +1,6 @@
 """Module that contains the Note class."""
 from .base_model import BaseModel
-from sqlalchemy import Column, String, Text, ForeignKey, Enum as SqlEnum
+from sqlalchemy import Column, Index, String, Text, ForeignKey, Enum as SqlEnum
 from sqlalchemy.orm import relationship, validates
 from ..utils.enums import BackgroundColor
 from ..utils.validators import validate_string_field
@@ -9,6 +9,9 @@ from ..utils.validators import validate_string_field
 class Note(BaseModel):
     """Represents a note in the application."""
     __tablename__ = "notes"
+    __table_args__ = (
+        Index("ix_notes_user_id_updated_at", "user_id", "updated_at", "id"),
+    )
     title = Column(String(30), nullable=False)
     content = Column(Text, nullable=False)
     background_color = Column(SqlEnum(BackgroundColor), nullable=False)
@@ -0,0 +1,203 @@
+"""
+Module that contains the full-text search index.
+
+On SQLite the index is an FTS5 table, `search_index`, kept in sync with
+notes and tasks by triggers. Its rows are keyed by rowid, which the
+`search_index_keys` table maps object ids to, so the triggers find the row
+of an object without a full-text lookup. On PostgreSQL each table gets a
+GIN index on a tsvector expression. The index is created with the tables,
+so inserts, updates and deletes keep it current whether they go through
+the ORM or through bulk statements.
+
+Other databases have no index, and fall back to unranked substring
+matching with LIKE.
+"""
+import re
+from sqlalchemy import (DDL, CompoundSelect, Select, and_, column, event,
+                        func, literal, literal_column, or_, select, table,
+                        union_all)
+from .note import Note
+from .task import Task
+from ..extensions import db
+
+SEARCH_SOURCES = {
+    "notes": (Note, "title", "content"),
+    "tasks": (Task, "title", "description"),
+}
+MAX_TERMS = 10
+
+# The user_id column is indexed so the user filter is answered by the
+# index, but has no weight in ranking.
+SQLITE_COLUMNS = ("title, body, user_id, object_id UNINDEXED, "
+                  "resource UNINDEXED")
+SQLITE_WEIGHTS = (2.0, 1.0, 0.0)
+SNIPPET_LENGTH = 80
+TSVECTOR = ("to_tsvector('english', coalesce({title}, '') || ' ' "
+            "|| coalesce({body}, ''))")
+
+search_index = table(
+    "search_index",
+    column("title"), column("body"), column("user_id"),
+    column("object_id"), column("resource"),
+)
+
+
+def sqlite_statements() -> list[str]:
+    """Returns the statements that create the FTS5 table and its triggers."""
+    statements = [
+        "CREATE TABLE IF NOT EXISTS search_index_keys ("
+        "id INTEGER PRIMARY KEY, object_id VARCHAR(36) NOT NULL UNIQUE)",
+        "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+        f"{SQLITE_COLUMNS}, tokenize='unicode61 remove_diacritics 2')",
+    ]
+    for resource, (model, title, body) in SEARCH_SOURCES.items():
+        table_name = model.__tablename__
+        old_rowid = ("(SELECT id FROM search_index_keys "
+                     "WHERE object_id = old.id)")
+        statements += [
+            f"CREATE TRIGGER IF NOT EXISTS {table_name}_search_insert "
+            f"AFTER INSERT ON {table_name} BEGIN "
+            "INSERT INTO search_index_keys (object_id) VALUES (new.id); "
+            "INSERT INTO search_index "
+            "(rowid, title, body, user_id, object_id, resource) "
+            "VALUES (last_insert_rowid(), "
+            f"new.{title}, new.{body}, new.user_id, new.id, "
+            f"'{resource}'); END",
+            f"CREATE TRIGGER IF NOT EXISTS {table_name}_search_update "
+            f"AFTER UPDATE OF {title}, {body}, user_id ON {table_name} "
+            "BEGIN UPDATE search_index SET "
+            f"title = new.{title}, body = new.{body}, "
+            f"user_id = new.user_id WHERE rowid = {old_rowid}; END",
+            f"CREATE TRIGGER IF NOT EXISTS {table_name}_search_delete "
+            f"AFTER DELETE ON {table_name} BEGIN "
+            f"DELETE FROM search_index WHERE rowid = {old_rowid}; "
+            "DELETE FROM search_index_keys WHERE object_id = old.id; END",
+        ]
+    return statements
+
+
+def postgresql_statements() -> list[str]:
+    """Returns the statements that create the GIN tsvector indexes."""
+    return [
+        f"CREATE INDEX IF NOT EXISTS ix_{model.__tablename__}_search "
+        f"ON {model.__tablename__} USING gin "
+        f"({TSVECTOR.format(title=title, body=body)})"
+        for model, title, body in SEARCH_SOURCES.values()
+    ]
+
+
+for statement in sqlite_statements():
+    event.listen(db.metadata, "after_create",
+                 DDL(statement).execute_if(dialect="sqlite"))
+for name in ("search_index", "search_index_keys"):
+    event.listen(db.metadata, "before_drop",
+                 DDL(f"DROP TABLE IF EXISTS {name}")
+                 .execute_if(dialect="sqlite"))
+for statement in postgresql_statements():
+    event.listen(db.metadata, "after_create",
+                 DDL(statement).execute_if(dialect="postgresql"))
+
+
+def search_terms(text: str) -> list[str]:
+    """Splits a search string into at most `MAX_TERMS` lowercase words."""
+    return re.findall(r"\w+", text.lower())[:MAX_TERMS]
+
+
+def sqlite_search(user_id: str, terms: list[str],
+                  resources: list[str]) -> Select:
+    """Builds the ranked FTS5 query, lower scores ranking first."""
+    words = " ".join(f'"{term}"*' for term in terms)
+    user = user_id.replace('"', '""')
+    query = f'user_id : "{user}" AND {{title body}} : ({words})'
+    index = literal_column("search_index")
+
+    return select(
+        search_index.c.resource,
+        search_index.c.object_id,
+        search_index.c.title,
+        func.snippet(index, -1, "", "", "…", 12).label("snippet"),
+        func.bm25(index, *SQLITE_WEIGHTS).label("score"),
+    ).where(
+        index.op("MATCH")(query),
+        search_index.c.resource.in_(resources),
+    )
+
+
+def postgresql_search(user_id: str, terms: list[str],
+                      resources: list[str]) -> CompoundSelect:
+    """Builds the ranked tsvector query, lower scores ranking first."""
+    query = func.to_tsquery(literal_column("'english'"),
+                            " & ".join(f"{term}:*" for term in terms))
+    selects = []
+    for resource in resources:
+        model, title, body = SEARCH_SOURCES[resource]
+        vector = literal_column(TSVECTOR.format(
+            title=f"{model.__tablename__}.{title}",
+            body=f"{model.__tablename__}.{body}"))
+        selects.append(select(
+            literal(resource).label("resource"),
+            model.id.label("object_id"),
+            model.title.label("title"),
+            func.ts_headline(literal_column("'english'"),
+                             getattr(model, body), query,
+                             'StartSel="", StopSel="", MaxWords=12')
+            .label("snippet"),
+            (-func.ts_rank(vector, query)).label("score"),
+        ).where(model.user_id == user_id, vector.op("@@")(query)))
+    return union_all(*selects)
+
+
+def like_search(user_id: str, terms: list[str],
+                resources: list[str]) -> CompoundSelect:
+    """Builds the unranked LIKE query, used on databases without an index."""
+    selects = []
+    for resource in resources:
+        model, title, body = SEARCH_SOURCES[resource]
+        title_column, body_column = getattr(model, title), getattr(model, body)
+        selects.append(select(
+            literal(resource).label("resource"),
+            model.id.label("object_id"),
+            model.title.label("title"),
+            func.substr(func.coalesce(body_column, ""), 1, SNIPPET_LENGTH)
+            .label("snippet"),
+            literal(0.0).label("score"),
+        ).where(model.user_id == user_id, and_(*(
+            or_(title_column.icontains(term, autoescape=True),
+                body_column.icontains(term, autoescape=True))
+            for term in terms))))
+    return union_all(*selects)
+
+
+SEARCH_BUILDERS = {
+    "sqlite": sqlite_search,
+    "postgresql": postgresql_search,
+}
+
+
+def search_query(user_id: str, text: str,
+                 resources: list[str]) -> Select | CompoundSelect:
+    """
+    Builds a ranked full-text search over a user's notes and tasks.
+
+    SQLite and PostgreSQL use their full-text index. Other databases fall
+    back to `like_search`, where every result has the same score.
+
+    Args:
+        user_id (str): The id of the user to search for.
+        text (str): The search string. Every word must match, as a prefix.
+        resources (list[str]): The tables to search, keys of
+            `SEARCH_SOURCES`.
+
+    Returns:
+        Select | CompoundSelect: A query with resource, object_id, title,
+            snippet and score columns. Lower scores are better matches.
+
+    Raises:
+        ValueError: If the search string has no words.
+    """
+    dialect = db.session.get_bind().dialect.name
+    terms = search_terms(text)
+    if not terms:
+        raise ValueError("The search query has no words")
+    return SEARCH_BUILDERS.get(dialect, like_search)(
+        user_id, terms, resources)
@@ -1,6 +1,7 @@
 """Module that contains the Task class."""
 from .base_model import BaseModel
-from sqlalchemy import (Column,
+from backend import db
+from sqlalchemy import (Column, Index, func,
                         String, Text, Date, DateTime, Boolean,
                         Enum as SqlEnum, ForeignKey)
 from sqlalchemy.orm import relationship, validates
@@ -12,6 +13,11 @@ from ..utils.validators import validate_string_field
 class Task(BaseModel):
     """Represents a task in the application."""
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_user_id_updated_at", "user_id", "updated_at", "id"),
+        Index("ix_tasks_user_id_stats",
+              "user_id", "priority", "category", "completed"),
+    )
     title = Column(String(30), nullable=False)
     description = Column(Text, nullable=False)
     priority = Column(SqlEnum(Priority, name="priority_enum"), nullable=False)
@@ -57,3 +63,70 @@ class Task(BaseModel):
         self.completed = False
         self.completed_at = None
         self.save()
+
+    @classmethod
+    def get_analytics(cls, user_id: str) -> dict:
+        """
+        Counts the user's tasks by completion, priority and category.
+
+        The counts come from a single grouped query, so no task rows are
+        loaded into memory.
+
+        Args:
+            user_id (str): The id of the user that owns the tasks.
+
+        Returns:
+            dict: The total, completed and unfinished counts, and the counts
+            per priority and per category.
+        """
+        return cls.analytics_by_user([user_id]).get(
+            user_id, cls.summarize_analytics([]))
+
+    @classmethod
+    def analytics_by_user(cls, user_ids: list[str] = None) -> dict:
+        """
+        Counts the tasks of several users with one grouped query.
+
+        Args:
+            user_ids (list[str]): The users to count, all if None.
+
+        Returns:
+            dict: The `get_analytics` result of each user with tasks, by
+            user id.
+        """
+        query = db.session.query(
+            cls.user_id, cls.priority, cls.category, cls.completed,
+            func.count()
+        )
+        if user_ids is not None:
+            query = query.filter(cls.user_id.in_(user_ids))
+        rows = query.group_by(
+            cls.user_id, cls.priority, cls.category, cls.completed
+        ).all()
+
+        rows_by_user = {}
+        for user_id, *row in rows:
+            rows_by_user.setdefault(user_id, []).append(row)
+        return {user_id: cls.summarize_analytics(user_rows)
+                for user_id, user_rows in rows_by_user.items()}
+
+    @staticmethod
+    def summarize_analytics(rows: list) -> dict:
+        """Turns (priority, category, completed, count) rows into counts."""
+        priorities = {p.name: 0 for p in Priority}
+        categories = {c.name: 0 for c in Category}
+        total = completed = 0
+        for priority, category, is_completed, count in rows:
+            priorities[priority.name] += count
+            categories[category.name] += count
+            total += count
+            if is_completed:
+                completed += count
+
+        return {
+            "total": total,
+            "completed": completed,
+            "unfinished": total - completed,
+            "priorities": priorities,
+            "categories": categories
+        }
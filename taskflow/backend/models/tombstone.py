@@ -0,0 +1,81 @@
+"""Module that contains the Tombstone class."""
+from .base_model import BaseModel
+from datetime import datetime, timedelta, timezone
+from flask import current_app
+from sqlalchemy import Column, ForeignKey, Index, String, delete, event
+from ..extensions import db
+from ..utils.logger import logger
+from ..utils.unit_of_work import commit_or_flush
+
+SYNC_TABLES = ("tasks", "habits", "notes", "budgets", "transactions")
+
+
+class Tombstone(BaseModel):
+    """
+    Records that a user's object was deleted, for delta sync.
+
+    Its `updated_at` is the deletion time, so clients syncing since an
+    earlier watermark learn which objects to drop. Tombstones are kept for
+    `TOMBSTONE_RETENTION_DAYS`, and clients with an older watermark have to
+    do a full sync.
+    """
+    __tablename__ = "tombstones"
+    __table_args__ = (
+        Index("ix_tombstones_user_id_updated_at",
+              "user_id", "updated_at", "id"),
+    )
+    resource = Column(String(20), nullable=False)
+    object_id = Column(String(36), nullable=False)
+
+    user_id = Column(String(36), ForeignKey('users.id'), nullable=False)
+
+    @classmethod
+    def record(cls, resource: str, user_id: str,
+               object_ids: list[str]) -> None:
+        """
+        Stages tombstones for deleted objects in the current session.
+
+        Args:
+            resource (str): The table the objects were deleted from.
+            user_id (str): The owner of the objects.
+            object_ids (list[str]): The IDs of the deleted objects.
+        """
+        db.session.add_all([
+            cls(resource=resource, object_id=object_id, user_id=user_id)
+            for object_id in object_ids
+        ])
+
+    @staticmethod
+    def retention_cutoff() -> datetime:
+        """Returns the naive UTC time older tombstones may be pruned before."""
+        days = current_app.config.get("TOMBSTONE_RETENTION_DAYS", 30)
+        return datetime.now(timezone.utc).replace(tzinfo=None) \
+            - timedelta(days=days)
+
+    @classmethod
+    def prune(cls) -> int:
+        """
+        Deletes the tombstones older than the retention window.
+
+        Returns:
+            int: The number of deleted tombstones.
+        """
+        try:
+            result = db.session.execute(
+                delete(cls).where(cls.updated_at < cls.retention_cutoff()))
+            commit_or_flush()
+            return result.rowcount
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"[{cls.__name__}] Tombstone pruning failed: "
+                         f"{str(e.orig) if hasattr(e, 'orig') else e}")
+            raise
+
+
+@event.listens_for(db.session, "before_flush")
+def record_deletions(session, flush_context, instances) -> None:
+    """Adds a tombstone for every synced object deleted in the flush."""
+    for obj in session.deleted:
+        if getattr(obj, "__tablename__", None) in SYNC_TABLES:
+            session.add(Tombstone(resource=obj.__tablename__,
+                                  object_id=obj.id, user_id=obj.user_id))
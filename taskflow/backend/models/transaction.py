@@ -1,15 +1,23 @@
 """Module that contains the Transaction class."""
 from .base_model import BaseModel
-from sqlalchemy import (Column, Text, String, Float, Date,
+from sqlalchemy import (Column, Index, Text, String, Float, Date,
                         ForeignKey, Enum as SqlEnum)
 from sqlalchemy.orm import relationship, validates
 from ..utils.enums import TransactionType, BudgetCategory
 from ..utils.validators import validate_string_field
+from datetime import date
 
 
 class Transaction(BaseModel):
     """Represents a transaction in the application."""
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index("ix_transactions_user_id_date", "user_id", "date", "id"),
+        Index("ix_transactions_user_id_category_type_date",
+              "user_id", "category", "type", "date"),
+        Index("ix_transactions_user_id_updated_at",
+              "user_id", "updated_at", "id"),
+    )
     title = Column(String(255), nullable=False)
     description = Column(Text)
     amount = Column(Float, nullable=False)
@@ -43,3 +51,29 @@ class Transaction(BaseModel):
             max_length=255
         )
         return value
+
+    def budget_entry(self) -> tuple | None:
+        """
+        Returns what this transaction contributes to the user's budgets.
+
+        Values set from request data may still be enum names or ISO date
+        strings, so they are converted before use.
+
+        Returns:
+            tuple | None: The (user_id, category, date, amount) of an expense,
+            or None for income.
+        """
+        transaction_type = self.type
+        if isinstance(transaction_type, str):
+            transaction_type = TransactionType[transaction_type]
+        if transaction_type != TransactionType.EXPENSE:
+            return None
+
+        category = self.category
+        if isinstance(category, str):
+            category = BudgetCategory[category]
+        on_date = self.date
+        if isinstance(on_date, str):
+            on_date = date.fromisoformat(on_date)
+
+        return (self.user_id, category, on_date, float(self.amount))
@@ -1,9 +1,9 @@
 """Module that contains the User class."""
 from .base_model import BaseModel
 from flask_login import UserMixin
-from sqlalchemy import Column, String
+from sqlalchemy import Column, String, event
 from sqlalchemy.orm import relationship, validates
-from ..extensions import bcrypt
+from ..extensions import password_hasher, user_cache
 from ..utils.validators import validate_string_field, validate_email
 
 
@@ -30,12 +30,28 @@ class User(BaseModel, UserMixin):
         """Hashes and sets the password."""
         if not plain_password or not isinstance(plain_password, str):
             raise ValueError("Password must be a non-empty string.")
-        self._password = bcrypt.generate_password_hash(
-            plain_password).decode('utf-8')
+        self._password = password_hasher.hash(plain_password)
 
     def check_password(self, input_password: str) -> bool:
         """Checks the user's password."""
-        return bcrypt.check_password_hash(self._password, input_password)
+        return password_hasher.check(self._password, input_password)
+
+    def rehash_password(self, input_password: str) -> bool:
+        """
+        Rehashes the password if its hash uses an outdated bcrypt cost.
+
+        Must be called with a password that passed `check_password`.
+
+        Parameters:
+            input_password (str): The user's verified plain password.
+
+        Returns:
+            bool: True if the password was rehashed.
+        """
+        if not password_hasher.needs_rehash(self._password):
+            return False
+        self.password = input_password
+        return True
 
     @validates("name")
     def validate_name(self, key: str, value: str) -> str:
@@ -76,3 +92,10 @@ class User(BaseModel, UserMixin):
             ValueError: If the email format is invalid.
         """
         return validate_email(key, value)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def invalidate_cached_user(mapper, connection, target: User) -> None:
+    """Drops a changed or deleted user from the user cache."""
+    user_cache.invalidate(target.id)
@@ -0,0 +1,508 @@
+"""Module that contains the UserStats class."""
+from .base_model import BaseModel
+from .budget import SPENT_CHANGES_KEY, Budget
+from .habit import Habit
+from .task import Task
+from .user import User
+from collections import defaultdict
+from copy import deepcopy
+from datetime import date, datetime, timezone
+from sqlalchemy import (Column, Date, ForeignKey, Index, JSON, String, case,
+                        delete, event, func, insert, inspect, select, update)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from uuid import uuid4
+from ..extensions import db
+from ..utils.dates import utc_today
+from ..utils.logger import logger
+from ..utils.unit_of_work import UNTRACKED_CHANGES_KEY, commit_or_flush
+
+SECTIONS = ("tasks", "habits", "spending")
+
+SECTIONS_BY_TABLE = {
+    "tasks": "tasks",
+    "habits": "habits",
+    "budgets": "spending",
+    "transactions": "spending",
+}
+
+# The fields each model's contribution to the stats depends on.
+TRACKED_FIELDS = {
+    Task: ("priority", "category", "completed"),
+    Habit: ("is_active", "current_streak", "longest_streak"),
+    Budget: ("category", "amount", "spent", "start_date", "end_date"),
+}
+
+# Session info key of the pending stats deltas, by user id.
+DELTAS_KEY = "user_stats_deltas"
+
+UPSERTS = {
+    "sqlite": sqlite_insert,
+    "postgresql": postgresql_insert,
+}
+
+
+def habit_stats(user_ids: list[str] = None) -> dict:
+    """Returns the habit counts and best streaks of each user, by id."""
+    query = db.session.query(
+        Habit.user_id,
+        func.count(),
+        func.sum(case((Habit.is_active.is_(True), 1), else_=0)),
+        func.max(Habit.current_streak),
+        func.max(Habit.longest_streak)
+    )
+    if user_ids is not None:
+        query = query.filter(Habit.user_id.in_(user_ids))
+
+    return {
+        user_id: {
+            "total": total,
+            "active": active or 0,
+            "best_current_streak": best_current or 0,
+            "best_longest_streak": best_longest or 0,
+        }
+        for user_id, total, active, best_current, best_longest
+        in query.group_by(Habit.user_id)
+    }
+
+
+def spending_stats(user_ids: list[str] = None, on_date: date = None) -> dict:
+    """Returns the budgeted and spent amount per category of each user."""
+    on_date = on_date or utc_today()
+    query = db.session.query(
+        Budget.user_id, Budget.category,
+        func.sum(Budget.amount), func.sum(Budget.spent)
+    ).filter(
+        Budget.start_date <= on_date,
+        Budget.end_date >= on_date
+    )
+    if user_ids is not None:
+        query = query.filter(Budget.user_id.in_(user_ids))
+
+    stats = defaultdict(dict)
+    for user_id, category, amount, spent in query.group_by(
+            Budget.user_id, Budget.category):
+        stats[user_id][category.name] = {"amount": amount, "spent": spent}
+    return dict(stats)
+
+
+EMPTY_HABITS = {"total": 0, "active": 0,
+                "best_current_streak": 0, "best_longest_streak": 0}
+
+
+EMPTY_DELTA = {"tasks": {}, "habits": {}, "streaks": [], "spending": {},
+               "spending_date": None, "recount": set()}
+
+
+def add_counts(target: dict, delta: dict, sign: int = 1) -> dict:
+    """Adds nested numeric counts into `target`, in place."""
+    for key, value in delta.items():
+        if isinstance(value, dict):
+            add_counts(target.setdefault(key, {}), value, sign)
+        else:
+            target[key] = target.get(key, 0) + sign * value
+    return target
+
+
+def field_value(value: object) -> object:
+    """Turns enum names and ISO date strings set from requests into values."""
+    if hasattr(value, "name"):
+        return value.name
+    if isinstance(value, str) and len(value) == 10 and value[4] == "-":
+        return date.fromisoformat(value)
+    return value
+
+
+def current_state(obj: object) -> tuple:
+    """Returns the tracked fields of an object as they are now."""
+    return tuple(field_value(getattr(obj, field))
+                 for field in TRACKED_FIELDS[type(obj)])
+
+
+def committed_state(obj: object) -> tuple | None:
+    """
+    Returns the tracked fields of an object as the database has them.
+
+    Returns None when a field was assigned without its old value loaded,
+    so the object's old contribution is unknown.
+    """
+    attrs = inspect(obj).attrs
+    values = []
+    for field in TRACKED_FIELDS[type(obj)]:
+        history = attrs[field].history
+        if history.deleted:
+            values.append(history.deleted[0])
+        elif history.unchanged:
+            values.append(history.unchanged[0])
+        elif history.added:
+            return None
+        else:
+            values.append(getattr(obj, field))
+    return tuple(field_value(value) for value in values)
+
+
+def task_counts(state: tuple) -> dict:
+    """Returns what a task contributes to the tasks section."""
+    priority, category, completed = state
+    return {"total": 1, "completed": int(bool(completed)),
+            "priorities": {priority: 1}, "categories": {category: 1}}
+
+
+def habit_counts(state: tuple) -> dict:
+    """Returns what a habit contributes to the habit counts."""
+    return {"total": 1, "active": int(bool(state[0]))}
+
+
+def budget_spending(state: tuple, on_date: date) -> dict:
+    """Returns what a budget contributes to the spending on a date."""
+    category, amount, spent, start_date, end_date = state
+    if not start_date <= on_date <= end_date:
+        return {}
+    return {category: {"amount": amount or 0.0, "spent": spent or 0.0}}
+
+
+def pending_delta(session, user_id: str) -> dict:
+    """Returns the stats delta of a user pending in the session."""
+    deltas = session.info.setdefault(DELTAS_KEY, {})
+    if user_id not in deltas:
+        deltas[user_id] = deepcopy(EMPTY_DELTA)
+    return deltas[user_id]
+
+
+def record_change(session, obj: object, old: tuple | None,
+                  new: tuple | None) -> None:
+    """
+    Adds the change of one object to its user's pending stats delta.
+
+    Args:
+        session (Session): The session the object was flushed in.
+        obj (object): The task, habit or budget.
+        old (tuple | None): Its committed state, None when created.
+        new (tuple | None): Its new state, None when deleted.
+    """
+    if old == new:
+        return
+    delta = pending_delta(session, obj.user_id)
+    if isinstance(obj, Task):
+        for state, sign in ((old, -1), (new, 1)):
+            if state:
+                add_counts(delta["tasks"], task_counts(state), sign)
+    elif isinstance(obj, Habit):
+        for state, sign in ((old, -1), (new, 1)):
+            if state:
+                add_counts(delta["habits"], habit_counts(state), sign)
+        delta["streaks"].append((old, new))
+    else:
+        today = utc_today()
+        if delta["spending_date"] not in (None, today):
+            delta["recount"].add("spending")
+        delta["spending_date"] = today
+        for state, sign in ((old, -1), (new, 1)):
+            if state:
+                add_counts(delta["spending"],
+                           budget_spending(state, today), sign)
+
+
+def apply_tasks(stored: dict, delta: dict) -> dict:
+    """Returns the tasks section with a delta applied."""
+    tasks = add_counts(deepcopy(stored), delta)
+    tasks["unfinished"] = tasks["total"] - tasks["completed"]
+    return tasks
+
+
+def apply_habits(stored: dict, delta: dict, streaks: list) -> dict | None:
+    """
+    Returns the habits section with a delta applied.
+
+    The best streaks are maxima, so they can only be raised in place.
+    Returns None when any habit's streak went down, and the section has to
+    be recomputed from the habit rows.
+    """
+    habits = add_counts(deepcopy(stored), delta)
+    for key, index in (("best_current_streak", 1),
+                       ("best_longest_streak", 2)):
+        best = habits[key]
+        for old, new in streaks:
+            old_value = (old[index] or 0) if old else 0
+            new_value = (new[index] or 0) if new else 0
+            if new_value < old_value:
+                return None
+            best = max(best, new_value)
+        habits[key] = best
+    return habits
+
+
+def apply_spending(stored: dict, delta: dict) -> dict | None:
+    """
+    Returns the spending section with a delta applied.
+
+    Returns None when a category's sums drop to zero, since only a recount
+    can tell if budgets still cover it, or when the stored section misses
+    a category the delta changes.
+    """
+    spending = add_counts(deepcopy(stored), delta)
+    for category in delta:
+        sums = spending[category]
+        if "amount" not in sums or (abs(sums["amount"]) < 1e-9
+                                    and abs(sums["spent"]) < 1e-9):
+            return None
+    return spending
+
+
+class UserStats(BaseModel):
+    """
+    Dashboard statistics of a user, kept up to date on every write.
+
+    ORM writes to tasks, habits and budgets are applied as per-row deltas
+    in the same transaction, so a write costs one read and one update of
+    the user's row. Sections touched by bulk statements are recomputed
+    with an aggregate query. Reading the dashboard is a single indexed
+    lookup.
+    """
+    __tablename__ = "user_stats"
+    __table_args__ = (
+        Index("ix_user_stats_user_id", "user_id", unique=True),
+    )
+    tasks = Column(JSON, nullable=False)
+    habits = Column(JSON, nullable=False)
+    spending = Column(JSON, nullable=False)
+    spending_date = Column(Date, nullable=False)
+
+    user_id = Column(String(36), ForeignKey('users.id'), nullable=False)
+
+    @staticmethod
+    def compute(sections: set[str], user_ids: list[str] = None) -> dict:
+        """
+        Computes sections of the stats of several users.
+
+        Args:
+            sections (set[str]): The sections to compute.
+            user_ids (list[str]): The users to compute them for, all if None.
+
+        Returns:
+            dict: The column values of each section, by user id. Users
+            without rows in a section get its empty value.
+        """
+        if user_ids is None:
+            user_ids = db.session.scalars(select(User.id)).all()
+        values = {user_id: {} for user_id in user_ids}
+
+        if "tasks" in sections:
+            tasks = Task.analytics_by_user(user_ids)
+            for user_id in user_ids:
+                values[user_id]["tasks"] = tasks.get(
+                    user_id, Task.summarize_analytics([]))
+        if "habits" in sections:
+            habits = habit_stats(user_ids)
+            for user_id in user_ids:
+                values[user_id]["habits"] = habits.get(
+                    user_id, dict(EMPTY_HABITS))
+        if "spending" in sections:
+            today = utc_today()
+            spending = spending_stats(user_ids, today)
+            for user_id in user_ids:
+                values[user_id]["spending"] = spending.get(user_id, {})
+                values[user_id]["spending_date"] = today
+        return values
+
+    @classmethod
+    def refresh(cls, user_id: str, sections: set[str]) -> None:
+        """
+        Recomputes sections of a user's stats, creating the row if needed.
+
+        Args:
+            user_id (str): The id of the user.
+            sections (set[str]): The sections to recompute.
+        """
+        delta = deepcopy(EMPTY_DELTA)
+        delta["recount"] = set(sections)
+        cls.apply_delta(user_id, delta)
+
+    @classmethod
+    def apply_delta(cls, user_id: str, delta: dict) -> None:
+        """
+        Applies a pending delta to a user's stats row.
+
+        Sections are recounted when the delta asks for it, when the delta
+        can't be applied in place, or when the stored spending is from an
+        earlier day. A missing row is built from scratch.
+
+        Args:
+            user_id (str): The id of the user.
+            delta (dict): The delta, shaped like `EMPTY_DELTA`.
+        """
+        stored = db.session.execute(
+            select(cls.tasks, cls.habits, cls.spending, cls.spending_date)
+            .where(cls.user_id == user_id)
+        ).one_or_none()
+        if stored is None:
+            cls.create(user_id)
+            return
+
+        recount = set(delta["recount"])
+        today = utc_today()
+        if (delta["spending"] or "spending" in recount) and (
+                stored.spending_date != today
+                or delta["spending_date"] not in (None, today)):
+            recount.add("spending")
+
+        values = {}
+        if delta["tasks"] and "tasks" not in recount:
+            values["tasks"] = apply_tasks(stored.tasks, delta["tasks"])
+        if (delta["habits"] or delta["streaks"]) and "habits" not in recount:
+            values["habits"] = apply_habits(
+                stored.habits, delta["habits"], delta["streaks"])
+        if delta["spending"] and "spending" not in recount:
+            values["spending"] = apply_spending(
+                stored.spending, delta["spending"])
+        for section, value in list(values.items()):
+            if value is None:
+                del values[section]
+                recount.add(section)
+        if recount:
+            values.update(cls.compute(recount, [user_id])[user_id])
+        if values:
+            db.session.execute(
+                update(cls).where(cls.user_id == user_id)
+                .values(updated_at=datetime.now(timezone.utc), **values))
+
+    @classmethod
+    def create(cls, user_id: str) -> None:
+        """
+        Builds a user's stats row from scratch.
+
+        Two transactions may build the same missing row at once. The
+        insert skips a row that already exists, and this transaction's
+        values are then written over it.
+
+        Args:
+            user_id (str): The id of the user.
+        """
+        now = datetime.now(timezone.utc)
+        values = cls.compute(set(SECTIONS), [user_id])[user_id]
+        dialect = db.session.get_bind().dialect.name
+        statement = UPSERTS.get(dialect, insert)(cls).values(
+            id=str(uuid4()), user_id=user_id, created_at=now,
+            updated_at=now, **values)
+        if dialect in UPSERTS:
+            statement = statement.on_conflict_do_nothing(
+                index_elements=["user_id"])
+        if db.session.execute(statement).rowcount:
+            return
+        db.session.execute(update(cls).where(cls.user_id == user_id)
+                           .values(updated_at=now, **values))
+
+    @classmethod
+    def rebuild(cls, user_id: str = None) -> int:
+        """
+        Recomputes the stats of one or every user from scratch.
+
+        Every section is computed with one grouped query over all the
+        users, so the backfill cost does not grow with one query per user.
+
+        Args:
+            user_id (str): Only rebuild this user's stats, all if None.
+
+        Returns:
+            int: The number of rebuilt users.
+        """
+        user_ids = [user_id] if user_id else None
+        now = datetime.now(timezone.utc)
+        try:
+            values = cls.compute(set(SECTIONS), user_ids)
+            statement = delete(cls)
+            if user_id:
+                statement = statement.where(cls.user_id == user_id)
+            db.session.execute(statement)
+            if values:
+                db.session.execute(insert(cls), [
+                    {"id": str(uuid4()), "user_id": stats_user_id,
+                     "created_at": now, "updated_at": now, **user_values}
+                    for stats_user_id, user_values in values.items()
+                ])
+            commit_or_flush()
+            return len(values)
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"[{cls.__name__}] Rebuild failed: "
+                         f"{str(e.orig) if hasattr(e, 'orig') else e}")
+            raise
+
+    @classmethod
+    def for_user(cls, user_id: str) -> dict:
+        """
+        Returns a user's stats with one indexed read.
+
+        Missing stats are built on the spot, and the spending section is
+        recomputed when the current budget period may have changed since
+        it was stored.
+
+        Args:
+            user_id (str): The id of the user.
+
+        Returns:
+            dict: The tasks, habits and spending sections.
+        """
+        stats = db.session.execute(
+            select(cls.tasks, cls.habits, cls.spending, cls.spending_date)
+            .where(cls.user_id == user_id)
+        ).one_or_none()
+        if stats is None or stats.spending_date != utc_today():
+            cls.refresh(user_id, {"spending"})
+            return cls.for_user(user_id)
+
+        return {section: getattr(stats, section) for section in SECTIONS}
+
+
+@event.listens_for(db.session, "before_flush")
+def record_deleted_stats(session, flush_context, instances) -> None:
+    """Records the deleted objects' stats, while they can still be loaded."""
+    for obj in session.deleted:
+        if type(obj) in TRACKED_FIELDS:
+            record_change(session, obj, committed_state(obj), None)
+
+
+@event.listens_for(db.session, "after_flush")
+def record_flushed_stats(session, flush_context) -> None:
+    """Records the stats deltas of the created and updated objects."""
+    for obj in session.new:
+        if type(obj) in TRACKED_FIELDS:
+            record_change(session, obj, None, current_state(obj))
+    for obj in session.dirty:
+        if type(obj) in TRACKED_FIELDS and session.is_modified(obj):
+            old = committed_state(obj)
+            if old is None:
+                pending_delta(session, obj.user_id)["recount"].add(
+                    SECTIONS_BY_TABLE[obj.__tablename__])
+            else:
+                record_change(session, obj, old, current_state(obj))
+
+
+@event.listens_for(db.session, "before_commit")
+def apply_stats_deltas(session) -> None:
+    """Applies the stats deltas of the committing writes."""
+    session.flush()
+    for user_id, category, start_date, end_date, spent in session.info.pop(
+            SPENT_CHANGES_KEY, []):
+        today = utc_today()
+        if start_date <= today <= end_date:
+            delta = pending_delta(session, user_id)
+            if delta["spending_date"] not in (None, today):
+                delta["recount"].add("spending")
+            delta["spending_date"] = today
+            add_counts(delta["spending"],
+                       {field_value(category): {"spent": spent}})
+    for table, user_id in session.info.pop(UNTRACKED_CHANGES_KEY, set()):
+        if table in SECTIONS_BY_TABLE:
+            pending_delta(session, user_id)["recount"].add(
+                SECTIONS_BY_TABLE[table])
+
+    for user_id, delta in session.info.pop(DELTAS_KEY, {}).items():
+        UserStats.apply_delta(user_id, delta)
+
+
+@event.listens_for(db.session, "after_rollback")
+def discard_stats_deltas(session) -> None:
+    """Forgets the stats deltas of a rolled back transaction."""
+    session.info.pop(DELTAS_KEY, None)
+    session.info.pop(SPENT_CHANGES_KEY, None)
@@ -96,6 +96,9 @@ def login():
             message="Invalid credentials"
         ), 401
 
+    if user.rehash_password(password):
+        user.save()
+
     login_user(user, remember=remember)
     logger.info(f"User logged in: {email} IP: {request.remote_addr}")
 
@@ -9,16 +9,21 @@ All routes require authentication, and most require ownership validation.
 """
 
 
-from flask import Blueprint, request
+from flask import Blueprint
 from flask_login import current_user, login_required
 from backend import limiter
 from ..models.budget import Budget
+from ..models.user_stats import TRACKED_FIELDS
+from ..utils.batch import apply_batch
 from ..utils.db_helpers import build_object, edit_object
+from ..utils.pagination import paginate
 from ..utils.response import json_response
 from ..utils.logger import logger
 from flasgger import swag_from
 from ..utils.doc_path import doc_path
 from ..schemas.budget_schema import BudgetSchema
+from ..decorators.cached import cached_response
+from ..decorators.conditional import conditional_get
 from ..decorators.ownership import ownership_required
 
 
@@ -27,28 +32,41 @@ budget_schema = BudgetSchema()
 BUDGET_KEYS = ["category", "amount", "period", "start_date", "end_date"]
 
 
+def recalculate_spent_for_budget(
+    old_window: tuple | None,
+    new_window: tuple | None
+) -> None:
+    """
+    Helper function that recalculates a budget's spent amount.
+
+    Transactions only move their own amount between budgets, so a budget
+    that is created or whose category or dates change is summed again.
+
+    Args:
+        old_window (tuple | None): The budget's window before the change,
+            None when it is created.
+        new_window (tuple | None): The budget's window after the change,
+            None when it is deleted.
+    """
+    if new_window is None or old_window == new_window:
+        return
+    budget_id, user_id = new_window[:2]
+    Budget.reconcile(user_id, budget_ids=[budget_id])
+
+
 @budget_bp.route("/", methods=["GET"])
 @swag_from(doc_path("budget/get_budgets.yml"))
 @limiter.limit("20 per minute")
 @login_required
+@conditional_get(Budget)
+@cached_response(Budget)
 def get_budgets():
     """Gets paginated budgets for the current user."""
-    page = request.args.get("page", 1, type=int)
-    per_page = request.args.get("per_page", 12, type=int)
-
-    pagination = Budget.query.filter_by(user_id=current_user.id) \
-        .order_by(Budget.updated_at.desc()) \
-        .paginate(page=page, per_page=per_page, error_out=False)
+    query = Budget.query.filter_by(user_id=current_user.id)
 
     return json_response(
         status="success",
-        data={
-            "budgets": [budget.to_dict() for budget in pagination.items],
-            "total": pagination.total,
-            "pages": pagination.pages,
-            "current_page": pagination.page,
-            "per_page": pagination.per_page
-        }
+        data=paginate(query, [Budget.updated_at, Budget.id], "budgets")
     ), 200
 
 
@@ -59,7 +77,8 @@ def get_budgets():
 def create_budget():
     """Creates a new budget."""
     new_budget = build_object(Budget, BUDGET_KEYS, schema=budget_schema)
-    new_budget.save(refresh=True)
+    new_budget.save()
+    recalculate_spent_for_budget(None, new_budget.spent_window())
     logger.info(f"User {current_user.id} created budget {new_budget.id}")
 
     return json_response(
@@ -69,6 +88,33 @@ def create_budget():
     ), 201
 
 
+@budget_bp.route("/batch", methods=["POST"])
+@swag_from(doc_path("budget/batch_budgets.yml"))
+@limiter.limit("10 per minute")
+@login_required
+def batch_budgets():
+    """Creates, updates and deletes budgets in one request."""
+    results, applied = apply_batch(
+        Budget, BUDGET_KEYS, budget_schema,
+        snapshot=Budget.spent_window,
+        on_change=recalculate_spent_for_budget
+    )
+    if not applied:
+        return json_response(
+            status="error",
+            message="Batch validation failed",
+            data=results
+        ), 400
+    logger.info(f"User {current_user.id} applied {len(results)} "
+                "budget operations")
+
+    return json_response(
+        status="success",
+        message="Budgets batch applied successfully",
+        data=results
+    ), 200
+
+
 @budget_bp.route("/<string:budget_id>", methods=["PATCH"])
 @swag_from(doc_path("budget/edit_budget.yml"))
 @limiter.limit("10 per minute")
@@ -76,8 +122,10 @@ def create_budget():
 @ownership_required(Budget)
 def edit_budget(budget):
     """Edits a budget."""
+    old_window = budget.spent_window()
     edit_object(budget, BUDGET_KEYS, schema=budget_schema)
-    budget.save(refresh=True)
+    budget.save()
+    recalculate_spent_for_budget(old_window, budget.spent_window())
     logger.info(f"User {current_user.id} edited budget {budget.id}")
 
     return json_response(
@@ -91,7 +139,7 @@ def edit_budget(budget):
 @swag_from(doc_path("budget/delete_budget.yml"))
 @limiter.limit("5 per minute")
 @login_required
-@ownership_required(Budget)
+@ownership_required(Budget, columns=["user_id", *TRACKED_FIELDS[Budget]])
 def delete_budget(budget):
     """Deletes a budget."""
     budget.delete()
@@ -0,0 +1,91 @@
+"""
+Module that contains the dashboard routes.
+
+This module defines the dashboard endpoint, which returns everything the
+front page shows in one request:
+- The user's task, habit and spending statistics
+- The latest tasks, habits, budgets, transactions and notes
+"""
+
+
+from flask import Blueprint, abort, request
+from flask_login import current_user, login_required
+from backend import limiter
+from ..models import Task, Habit, Budget, Transaction, Note
+from ..models.user_stats import SECTIONS as STATS_SECTIONS, UserStats
+from ..utils.fields import load_fields, parse_fields
+from ..utils.response import json_response
+from ..utils.serializers import get_serializer
+from flasgger import swag_from
+from ..utils.doc_path import doc_path
+from ..utils.streaks import reset_current_user_streaks
+
+
+dashboard_bp = Blueprint('dashboard_bp', __name__)
+dashboard_bp.before_request(reset_current_user_streaks)
+DASHBOARD_LISTS = {
+    "tasks": (Task, [Task.updated_at, Task.id]),
+    "habits": (Habit, [Habit.updated_at, Habit.id]),
+    "budgets": (Budget, [Budget.updated_at, Budget.id]),
+    "transactions": (Transaction, [Transaction.date, Transaction.id]),
+    "notes": (Note, [Note.updated_at, Note.id]),
+}
+DASHBOARD_SECTIONS = ("stats", *DASHBOARD_LISTS)
+MAX_LIMIT = 100
+
+
+def parse_sections(value: str | None) -> list[str]:
+    """Parses the requested sections, defaulting to all of them."""
+    if not value:
+        return list(DASHBOARD_SECTIONS)
+    sections = [section.strip() for section in value.split(",")
+                if section.strip()]
+    unknown = [section for section in sections
+               if section not in DASHBOARD_SECTIONS]
+    if unknown:
+        abort(400, description=f"Unknown sections: {', '.join(unknown)}")
+    return sections
+
+
+def get_stats(user_id: str) -> dict:
+    """Returns the user's stats, limited to the requested stats fields."""
+    stats = UserStats.for_user(user_id)
+    value = request.args.get("fields[stats]")
+    if not value:
+        return stats
+
+    fields = [field.strip() for field in value.split(",") if field.strip()]
+    unknown = [field for field in fields if field not in STATS_SECTIONS]
+    if unknown:
+        abort(400, description=f"Unknown fields: {', '.join(unknown)}")
+    return {field: stats[field] for field in fields}
+
+
+def get_latest(name: str, user_id: str, limit: int) -> list[dict]:
+    """Returns the user's latest objects of a list section."""
+    model, order_by = DASHBOARD_LISTS[name]
+    fields = parse_fields(model, request.args.get(f"fields[{name}]"))
+    query = model.query.filter(model.user_id == user_id).order_by(
+        *[column.desc() for column in order_by]).limit(limit)
+
+    serialize = get_serializer(model, fields)
+    return [serialize(obj) for obj in load_fields(query, model, fields)]
+
+
+@dashboard_bp.route("/", methods=["GET"])
+@swag_from(doc_path("dashboard/get_dashboard.yml"))
+@limiter.limit("20 per minute")
+@login_required
+def get_dashboard():
+    """Gets the current user's dashboard in one request."""
+    sections = parse_sections(request.args.get("sections"))
+    limit = min(max(request.args.get("limit", 12, type=int), 1), MAX_LIMIT)
+
+    data = {}
+    for section in sections:
+        if section == "stats":
+            data["stats"] = get_stats(current_user.id)
+        else:
+            data[section] = get_latest(section, current_user.id, limit)
+
+    return json_response(status="success", data=data), 200
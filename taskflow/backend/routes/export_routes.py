@@ -0,0 +1,57 @@
+"""
+Module that contains the export routes.
+
+This module defines the export endpoint, which streams every task, habit,
+note, budget and transaction of the current user as NDJSON or CSV.
+"""
+
+
+from flask import (Blueprint, Response, abort, current_app, request,
+                   stream_with_context)
+from flask_login import current_user, login_required
+from backend import limiter
+from ..models import Task, Habit, Note, Budget, Transaction
+from ..utils.export import (
+    EXPORT_FORMATS, chunked, csv_lines, export_rows, gzipped, ndjson_lines)
+from flasgger import swag_from
+from ..utils.doc_path import doc_path
+from ..utils.dates import utc_today
+from ..utils.streaks import reset_current_user_streaks
+
+
+export_bp = Blueprint('export_bp', __name__)
+export_bp.before_request(reset_current_user_streaks)
+EXPORT_MODELS = [Task, Habit, Note, Budget, Transaction]
+
+
+@export_bp.route("/", methods=["GET"])
+@swag_from(doc_path("export/export_data.yml"))
+@limiter.limit("5 per minute")
+@login_required
+def export_data():
+    """Streams all of the current user's data."""
+    export_format = request.args.get("format", "ndjson")
+    if export_format not in EXPORT_FORMATS:
+        abort(400, description="Format must be one of: "
+                               f"{', '.join(EXPORT_FORMATS)}")
+
+    rows = export_rows(EXPORT_MODELS, current_user.id,
+                       current_app.config.get("EXPORT_BATCH_SIZE", 1000))
+    if export_format == "csv":
+        lines = csv_lines(rows, EXPORT_MODELS)
+    else:
+        lines = ndjson_lines(rows, current_app.json.dumps)
+    body = chunked(lines)
+
+    filename = f"taskflow-export-{utc_today()}.{export_format}"
+    headers = {
+        "Content-Disposition": f"attachment; filename={filename}",
+        "Cache-Control": "no-store",
+        "Vary": "Accept-Encoding",
+    }
+    if request.accept_encodings["gzip"]:
+        body = gzipped(body)
+        headers["Content-Encoding"] = "gzip"
+
+    return Response(stream_with_context(body),
+                    mimetype=EXPORT_FORMATS[export_format], headers=headers)
@@ -5,54 +5,119 @@ This module defines all HTTP endpoints for managing habits:
 - Listing habits with pagination
 - Creating, editing, and deleting habits
 - Marking habits as complete to track streaks
+- Returning a year of completions for every habit as a heatmap
 - Returning habit data for the authenticated user
 
 All routes require authentication, and most require ownership validation.
 """
 
-from flask import Blueprint, request
+from datetime import date, timedelta
+from flask import Blueprint, abort, request
 from flask_login import current_user, login_required
 from backend import limiter
 from ..models.habit import Habit
+from ..models.habit_completion import HabitCompletion
+from ..models.user_stats import TRACKED_FIELDS
+from ..utils.batch import apply_batch
+from ..utils.dates import utc_today
 from ..utils.db_helpers import build_object, edit_object
+from ..utils.heatmap import HEATMAP_ENCODINGS
+from ..utils.pagination import paginate
 from ..utils.response import json_response
 from ..utils.logger import logger
 from flasgger import swag_from
 from ..utils.doc_path import doc_path
+from ..utils.streaks import reset_current_user_streaks
 from ..schemas.habit_schema import HabitSchema
+from ..decorators.cached import cached_response
+from ..decorators.conditional import conditional_get
 from ..decorators.ownership import ownership_required
 
 habit_bp = Blueprint('habit_bp', __name__)
+habit_bp.before_request(reset_current_user_streaks)
 habit_schema = HabitSchema()
 HABIT_KEYS = ["title", "description", "frequency", "target_count",
               "priority", "category", "background_color"]
+MAX_HEATMAP_DAYS = 366
+
+
+def heatmap_today() -> str:
+    """Returns the day the default heatmap window ends on."""
+    return utc_today().isoformat()
+
+
+def rebuild_streaks_for_habit(
+    old_rule: tuple | None,
+    new_rule: tuple | None
+) -> None:
+    """
+    Helper function that recomputes a habit's streaks after an edit.
+
+    Streaks are measured in the habit's periods, so changing its frequency
+    or target_count recomputes them from the completion history.
+
+    Args:
+        old_rule (tuple | None): The habit's streak rule before the change,
+            None when it is created.
+        new_rule (tuple | None): The habit's streak rule after the change,
+            None when it is deleted.
+    """
+    if old_rule is None or new_rule is None or old_rule == new_rule:
+        return
+    Habit.rebuild_streaks(habit_ids=[new_rule[0]])
 
 
 @habit_bp.route("/", methods=["GET"])
 @swag_from(doc_path("habit/get_habits.yml"))
 @limiter.limit("20 per minute")
 @login_required
+@conditional_get(Habit)
+@cached_response(Habit)
 def get_habits():
     """Gets paginated habits for the current user."""
-    page = request.args.get("page", 1, type=int)
-    per_page = request.args.get("per_page", 12, type=int)
-
-    pagination = Habit.query.filter_by(user_id=current_user.id) \
-        .order_by(Habit.updated_at.desc()) \
-        .paginate(page=page, per_page=per_page, error_out=False)
+    query = Habit.query.filter_by(user_id=current_user.id)
 
     return json_response(
         status="success",
-        data={
-            "habits": [habit.to_dict() for habit in pagination.items],
-            "total": pagination.total,
-            "pages": pagination.pages,
-            "current_page": pagination.page,
-            "per_page": pagination.per_page
-        }
+        data=paginate(query, [Habit.updated_at, Habit.id], "habits")
     ), 200
 
 
+@habit_bp.route("/heatmap", methods=["GET"])
+@swag_from(doc_path("habit/habit_heatmap.yml"))
+@limiter.limit("20 per minute")
+@login_required
+@cached_response(HabitCompletion, Habit, key=heatmap_today)
+def habit_heatmap():
+    """Gets the completions of every habit over a window of days."""
+    days = request.args.get("days", 365, type=int)
+    if not 1 <= days <= MAX_HEATMAP_DAYS:
+        abort(400, description=f"days must be between 1 and "
+                               f"{MAX_HEATMAP_DAYS}")
+    encoding = request.args.get("encoding", "bitset")
+    if encoding not in HEATMAP_ENCODINGS:
+        abort(400, description="encoding must be one of: "
+                               f"{', '.join(HEATMAP_ENCODINGS)}")
+    try:
+        end = date.fromisoformat(request.args.get("end")) \
+            if request.args.get("end") else utc_today()
+    except ValueError:
+        abort(400, description="end must be a date in YYYY-MM-DD format")
+
+    start = end - timedelta(days=days - 1)
+    encode = HEATMAP_ENCODINGS[encoding]
+    bitsets = Habit.completion_bitsets(current_user.id, start, days)
+
+    return json_response(status="success", data={
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "days": days,
+        "encoding": encoding,
+        "habits": {habit_id: encode(bits, days)
+                   for habit_id, bits in bitsets.items()},
+    }), 200
+
+
 @habit_bp.route("/", methods=["POST"])
 @swag_from(doc_path("habit/create_habit.yml"))
 @limiter.limit("10 per minute")
@@ -60,7 +125,7 @@ def get_habits():
 def create_habit():
     """Creates a new habit."""
     new_habit = build_object(Habit, HABIT_KEYS, schema=habit_schema)
-    new_habit.save(refresh=True)
+    new_habit.save()
     logger.info(f"User {current_user.id} created habit {new_habit.id}")
 
     return json_response(
@@ -70,6 +135,33 @@ def create_habit():
     ), 201
 
 
+@habit_bp.route("/batch", methods=["POST"])
+@swag_from(doc_path("habit/batch_habits.yml"))
+@limiter.limit("10 per minute")
+@login_required
+def batch_habits():
+    """Creates, updates and deletes habits in one request."""
+    results, applied = apply_batch(
+        Habit, HABIT_KEYS, habit_schema,
+        snapshot=Habit.streak_rule,
+        on_change=rebuild_streaks_for_habit
+    )
+    if not applied:
+        return json_response(
+            status="error",
+            message="Batch validation failed",
+            data=results
+        ), 400
+    logger.info(f"User {current_user.id} applied {len(results)} "
+                "habit operations")
+
+    return json_response(
+        status="success",
+        message="Habits batch applied successfully",
+        data=results
+    ), 200
+
+
 @habit_bp.route("/<string:habit_id>/complete", methods=["PATCH"])
 @swag_from(doc_path("habit/complete_habit.yml"))
 @limiter.limit("20 per minute")
@@ -93,8 +185,10 @@ def complete_habit(habit):
 @ownership_required(Habit)
 def edit_habit(habit):
     """Edits a habit's fields."""
+    old_rule = habit.streak_rule()
     edit_object(habit, HABIT_KEYS)
-    habit.save(refresh=True)
+    habit.save()
+    rebuild_streaks_for_habit(old_rule, habit.streak_rule())
     logger.info(f"User {current_user.id} edited habit {habit.id}")
 
     return json_response(
@@ -108,7 +202,7 @@ def edit_habit(habit):
 @swag_from(doc_path("habit/delete_habit.yml"))
 @limiter.limit("20 per minute")
 @login_required
-@ownership_required(Habit)
+@ownership_required(Habit, columns=["user_id", *TRACKED_FIELDS[Habit]])
 def delete_habit(habit):
     """Deletes a habit from the database."""
     habit.delete()
@@ -9,16 +9,20 @@ All routes require authentication, and most require ownership validation.
 """
 
 
-from flask import Blueprint, request
+from flask import Blueprint
 from flask_login import current_user, login_required
 from backend import limiter
 from ..models.note import Note
+from ..utils.batch import apply_batch
 from ..utils.db_helpers import build_object, edit_object
+from ..utils.pagination import paginate
 from ..utils.response import json_response
 from ..utils.logger import logger
 from flasgger import swag_from
 from ..utils.doc_path import doc_path
 from ..schemas.note_schema import NoteSchema
+from ..decorators.cached import cached_response
+from ..decorators.conditional import conditional_get
 from ..decorators.ownership import ownership_required
 
 
@@ -31,23 +35,15 @@ NOTE_KEYS = ["title", "content", "background_color"]
 @swag_from(doc_path("note/get_notes.yml"))
 @limiter.limit("20 per minute")
 @login_required
+@conditional_get(Note)
+@cached_response(Note)
 def get_notes():
     """Gets paginated notes for the current user."""
-    page = request.args.get("page", 1, type=int)
-    per_page = request.args.get("per_page", 12, type=int)
-    pagination = Note.query.filter_by(user_id=current_user.id) \
-        .order_by(Note.updated_at.desc()) \
-        .paginate(page=page, per_page=per_page, error_out=False)
+    query = Note.query.filter_by(user_id=current_user.id)
 
     return json_response(
         status="success",
-        data={
-            "notes": [note.to_dict() for note in pagination.items],
-            "total": pagination.total,
-            "pages": pagination.pages,
-            "current_page": pagination.page,
-            "per_page": pagination.per_page
-        }
+        data=paginate(query, [Note.updated_at, Note.id], "notes")
     ), 200
 
 
@@ -58,7 +54,7 @@ def get_notes():
 def create_note():
     """Creates a new note."""
     new_note = build_object(Note, NOTE_KEYS, schema=note_schema)
-    new_note.save(refresh=True)
+    new_note.save()
     logger.info(f"User {current_user.id} created note {new_note.id}")
 
     return json_response(
@@ -68,6 +64,29 @@ def create_note():
     ), 201
 
 
+@note_bp.route("/batch", methods=["POST"])
+@swag_from(doc_path("note/batch_notes.yml"))
+@limiter.limit("10 per minute")
+@login_required
+def batch_notes():
+    """Creates, updates and deletes notes in one request."""
+    results, applied = apply_batch(Note, NOTE_KEYS, note_schema)
+    if not applied:
+        return json_response(
+            status="error",
+            message="Batch validation failed",
+            data=results
+        ), 400
+    logger.info(f"User {current_user.id} applied {len(results)} "
+                "note operations")
+
+    return json_response(
+        status="success",
+        message="Notes batch applied successfully",
+        data=results
+    ), 200
+
+
 @note_bp.route("/<string:note_id>", methods=["PATCH"])
 @swag_from(doc_path("note/edit_note.yml"))
 @limiter.limit("10 per minute")
@@ -76,7 +95,7 @@ def create_note():
 def edit_note(note):
     """Edits a note."""
     edit_object(note, NOTE_KEYS, schema=note_schema)
-    note.save(refresh=True)
+    note.save()
     logger.info(f"User {current_user.id} edited note {note.id}")
 
     return json_response(
@@ -90,7 +109,7 @@ def edit_note(note):
 @swag_from(doc_path("note/delete_note.yml"))
 @limiter.limit("5 per minute")
 @login_required
-@ownership_required(Note)
+@ownership_required(Note, columns=["user_id"])
 def delete_note(note):
     """Deletes a note."""
     note.delete()
@@ -0,0 +1,71 @@
+"""
+Module that contains the search routes.
+
+This module defines the full-text search endpoint over the current user's
+notes and tasks, ranked by relevance and paged with a keyset cursor.
+"""
+
+
+from flask import Blueprint, abort, request
+from flask_login import current_user, login_required
+from sqlalchemy import select, tuple_
+from backend import db, limiter
+from ..models.search_index import SEARCH_SOURCES, search_query
+from ..utils.pagination import decode_cursor, encode_cursor
+from ..utils.response import json_response
+from flasgger import swag_from
+from ..utils.doc_path import doc_path
+
+
+search_bp = Blueprint('search_bp', __name__)
+MAX_PER_PAGE = 50
+
+
+def parse_types(value: str | None) -> list[str]:
+    """Parses the requested resources, defaulting to all of them."""
+    if not value:
+        return list(SEARCH_SOURCES)
+    types = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in types if name not in SEARCH_SOURCES]
+    if unknown:
+        abort(400, description=f"Unknown types: {', '.join(unknown)}")
+    return types
+
+
+@search_bp.route("/", methods=["GET"])
+@swag_from(doc_path("search/search.yml"))
+@limiter.limit("30 per minute")
+@login_required
+def search():
+    """Searches the current user's notes and tasks."""
+    types = parse_types(request.args.get("types"))
+    per_page = min(max(request.args.get("per_page", 12, type=int), 1),
+                   MAX_PER_PAGE)
+    try:
+        results = search_query(
+            current_user.id, request.args.get("q", ""), types).subquery()
+    except ValueError as e:
+        abort(400, description=str(e))
+
+    order_by = [results.c.score, results.c.object_id]
+    statement = select(results).order_by(*order_by).limit(per_page + 1)
+    cursor = request.args.get("cursor")
+    if cursor:
+        values = decode_cursor(cursor, order_by)
+        statement = statement.where(tuple_(*order_by) > tuple_(*values))
+
+    rows = db.session.execute(statement).all()
+    next_cursor = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        next_cursor = encode_cursor([rows[-1].score, rows[-1].object_id])
+
+    return json_response(status="success", data={
+        "results": [
+            {"resource": row.resource, "id": row.object_id,
+             "title": row.title, "snippet": row.snippet}
+            for row in rows
+        ],
+        "next_cursor": next_cursor,
+        "per_page": per_page,
+    }), 200
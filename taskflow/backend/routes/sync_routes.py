@@ -0,0 +1,92 @@
+"""
+Module that contains the sync routes.
+
+This module defines the delta sync endpoint, which returns every object
+of the current user that changed since a watermark, plus tombstones for
+the ones that were deleted. Watermarks older than the tombstone retention
+window are rejected, since deletions before it may have been pruned.
+"""
+
+
+from datetime import datetime, timedelta, timezone
+from flask import Blueprint, abort, current_app, request
+from flask_login import current_user, login_required
+from backend import limiter
+from ..models import Task, Habit, Note, Budget, Transaction, Tombstone
+from ..utils.response import json_response
+from flasgger import swag_from
+from ..utils.doc_path import doc_path
+from ..utils.streaks import reset_current_user_streaks
+
+
+sync_bp = Blueprint('sync_bp', __name__)
+sync_bp.before_request(reset_current_user_streaks)
+SYNC_MODELS = [Task, Habit, Note, Budget, Transaction]
+
+
+def parse_watermark(value: str | None) -> datetime | None:
+    """
+    Parses a sync watermark into a naive UTC datetime.
+
+    Args:
+        value (str | None): An ISO 8601 timestamp, None for a full sync.
+
+    Returns:
+        datetime | None: The watermark, None when no value was given.
+    """
+    if not value:
+        return None
+    try:
+        watermark = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        abort(400, description="Invalid since timestamp")
+    if watermark.tzinfo is not None:
+        watermark = watermark.astimezone(timezone.utc).replace(tzinfo=None)
+    return watermark
+
+
+def changed_since(model: type, user_id: str, since: datetime | None,
+                  until: datetime) -> list:
+    """
+    Returns the user's objects updated after `since` and up to `until`.
+
+    Filters and orders on (user_id, updated_at), which every synced table
+    has an index for.
+    """
+    query = model.query.filter(
+        model.user_id == user_id, model.updated_at <= until)
+    if since is not None:
+        query = query.filter(model.updated_at > since)
+    return query.order_by(model.updated_at, model.id).all()
+
+
+@sync_bp.route("/", methods=["GET"])
+@swag_from(doc_path("sync/get_changes.yml"))
+@limiter.limit("20 per minute")
+@login_required
+def get_changes():
+    """Gets the current user's changes since a watermark."""
+    since = parse_watermark(request.args.get("since"))
+    if since is not None and since < Tombstone.retention_cutoff():
+        abort(410, description="Watermark expired, do a full sync")
+    lag = current_app.config.get("SYNC_LAG_SECONDS", 5)
+    until = datetime.now(timezone.utc).replace(tzinfo=None) \
+        - timedelta(seconds=lag)
+    if since is not None and since >= until:
+        until = since
+
+    data = {
+        model.__tablename__: [
+            obj.to_dict()
+            for obj in changed_since(model, current_user.id, since, until)
+        ]
+        for model in SYNC_MODELS
+    }
+    data["deleted"] = [] if since is None else [
+        {"resource": tombstone.resource, "id": tombstone.object_id}
+        for tombstone in changed_since(
+            Tombstone, current_user.id, since, until)
+    ]
+    data["watermark"] = until.isoformat(" ")
+
+    return json_response(status="success", data=data), 200
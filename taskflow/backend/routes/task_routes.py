@@ -11,18 +11,21 @@ All routes require authentication, and most require ownership validation.
 """
 
 
-from flask import Blueprint, request
+from flask import Blueprint
 from flask_login import current_user, login_required
 from backend import limiter
 from ..models.task import Task
-from ..utils.enums import Priority, Category
-from collections import Counter
-from ..utils.db_helpers import get_object, build_object, edit_object
+from ..models.user_stats import TRACKED_FIELDS
+from ..utils.batch import apply_batch
+from ..utils.db_helpers import build_object, edit_object, bulk_delete
+from ..utils.pagination import paginate
 from ..utils.response import json_response
 from ..utils.logger import logger
 from flasgger import swag_from
 from ..utils.doc_path import doc_path
 from ..schemas.task_schema import TaskSchema
+from ..decorators.cached import cached_response
+from ..decorators.conditional import conditional_get
 from ..decorators.ownership import ownership_required
 
 
@@ -35,24 +38,15 @@ TASK_KEYS = ["title", "description", "priority", "deadline", "category"]
 @swag_from(doc_path("task/get_tasks.yml"))
 @limiter.limit("20 per minute")
 @login_required
+@conditional_get(Task)
+@cached_response(Task)
 def get_tasks():
     """Gets paginated tasks for the current user."""
-    page = request.args.get("page", 1, type=int)
-    per_page = request.args.get("per_page", 12, type=int)
-
-    pagination = Task.query.filter_by(user_id=current_user.id) \
-        .order_by(Task.updated_at.desc()) \
-        .paginate(page=page, per_page=per_page, error_out=False)
+    query = Task.query.filter_by(user_id=current_user.id)
 
     return json_response(
         status="success",
-        data={
-            "tasks": [task.to_dict() for task in pagination.items],
-            "total": pagination.total,
-            "pages": pagination.pages,
-            "current_page": pagination.page,
-            "per_page": pagination.per_page
-        }
+        data=paginate(query, [Task.updated_at, Task.id], "tasks")
     ), 200
 
 
@@ -60,32 +54,13 @@ def get_tasks():
 @swag_from(doc_path("task/tasks_analytics.yml"))
 @limiter.limit("20 per minute")
 @login_required
+@conditional_get(Task)
+@cached_response(Task)
 def get_tasks_analytics():
     """Gets current user task analytics data."""
-    tasks = Task.query.filter_by(user_id=current_user.id).all()
-
-    num_tasks = len(tasks)
-    num_completed = sum(task.completed for task in tasks)
-    num_unfinished = num_tasks - num_completed
-
-    priority_counts = Counter(task.priority.name for task in tasks)
-    category_counts = Counter(task.category.name for task in tasks)
-
-    priorities = [p.name for p in Priority]
-    categories = [c.name for c in Category]
-
-    priority_data = {p: priority_counts.get(p, 0) for p in priorities}
-    category_data = {c: category_counts.get(c, 0) for c in categories}
-
     return json_response(
         status="success",
-        data={
-            "total": num_tasks,
-            "completed": num_completed,
-            "unfinished": num_unfinished,
-            "priorities": priority_data,
-            "categories": category_data
-        }
+        data=Task.get_analytics(current_user.id)
     ), 200
 
 
@@ -96,7 +71,7 @@ def get_tasks_analytics():
 def create_task():
     """Creates a new task."""
     new_task = build_object(Task, TASK_KEYS, schema=task_schema)
-    new_task.save(refresh=True)
+    new_task.save()
     logger.info(f"User {current_user.id} created task {new_task.id}")
 
     return json_response(
@@ -106,6 +81,29 @@ def create_task():
     ), 201
 
 
+@task_bp.route("/batch", methods=["POST"])
+@swag_from(doc_path("task/batch_tasks.yml"))
+@limiter.limit("10 per minute")
+@login_required
+def batch_tasks():
+    """Creates, updates and deletes tasks in one request."""
+    results, applied = apply_batch(Task, TASK_KEYS, task_schema)
+    if not applied:
+        return json_response(
+            status="error",
+            message="Batch validation failed",
+            data=results
+        ), 400
+    logger.info(f"User {current_user.id} applied {len(results)} "
+                "task operations")
+
+    return json_response(
+        status="success",
+        message="Tasks batch applied successfully",
+        data=results
+    ), 200
+
+
 @task_bp.route("/<string:task_id>/complete", methods=["PATCH"])
 @swag_from(doc_path("task/complete_task.yml"))
 @limiter.limit("20 per minute")
@@ -146,7 +144,7 @@ def incomplete_task(task):
 def edit_task(task):
     """Edits a task's fields."""
     edit_object(task, TASK_KEYS)
-    task.save(refresh=True)
+    task.save()
     logger.info(f"User {current_user.id} edited task {task.id}")
 
     return json_response(
@@ -160,7 +158,7 @@ def edit_task(task):
 @swag_from(doc_path("task/delete_task.yml"))
 @limiter.limit("20 per minute")
 @login_required
-@ownership_required(Task)
+@ownership_required(Task, columns=["user_id", *TRACKED_FIELDS[Task]])
 def delete_task(task):
     """Deletes a task from the database."""
     task.delete()
@@ -176,22 +174,21 @@ def delete_task(task):
 @swag_from(doc_path("task/delete_completed_tasks.yml"))
 @limiter.limit("20 per minute")
 @login_required
-@ownership_required(Task)
 def delete_completed_tasks():
     """Deletes all completed tasks for the current user."""
-    completed_tasks = Task.query.filter_by(
-        user_id=current_user.id, completed=True).all()
+    deleted = bulk_delete(Task, Task.completed.is_(True))
 
-    if not completed_tasks:
+    if not deleted:
         return json_response(
             status="error",
             message="No completed tasks found"
         ), 404
 
-    for task in completed_tasks:
-        task.delete()
+    logger.info(f"User ({current_user.id}) has deleted {deleted} "
+                "completed tasks.")
 
     return json_response(
         status="success",
-        message="All completed tasks deleted successfully"
+        message="All completed tasks deleted successfully",
+        data={"deleted": deleted}
     ), 200
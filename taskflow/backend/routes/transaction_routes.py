@@ -4,20 +4,27 @@ This module defines API endpoints for:
 - Listing user transactions
 - Creating new transactions
 - Editing and deleting transactions
+- Importing transactions from a CSV file
 
 All routes require authentication, and most require ownership validation.
 """
 
-from flask import Blueprint, request
+import io
+from flask import Blueprint, abort, current_app, request
 from flask_login import current_user, login_required
 from backend import limiter
 from ..models import Budget, Transaction
+from ..utils.batch import apply_batch
 from ..utils.db_helpers import build_object, edit_object
+from ..utils.pagination import paginate
 from ..utils.response import json_response
+from ..utils.transaction_import import import_transactions
 from ..utils.logger import logger
 from flasgger import swag_from
 from ..utils.doc_path import doc_path
 from ..schemas.transaction_schema import TransactionSchema
+from ..decorators.cached import cached_response
+from ..decorators.conditional import conditional_get
 from ..decorators.ownership import ownership_required
 
 
@@ -27,40 +34,42 @@ TRANSACTION_KEYS = ["title", "description", "amount",
                     "type", "date", "category"]
 
 
-def update_budget_spent_for_transaction(transaction: Transaction) -> None:
-    """Helper function that updates the budget based on a transaction."""
-    budget = Budget.query.filter_by(
-        user_id=transaction.user_id,
-        category=transaction.category
-    ).first()
-    if budget:
-        budget.recalculate_budget()
+def update_budget_spent_for_transaction(
+    old_entry: tuple | None,
+    new_entry: tuple | None
+) -> None:
+    """
+    Helper function that moves a transaction's amount between budgets.
+
+    Args:
+        old_entry (tuple | None): The transaction's budget entry before the
+            change, None when it is created or was income.
+        new_entry (tuple | None): The transaction's budget entry after the
+            change, None when it is deleted or is income.
+    """
+    if old_entry == new_entry:
+        return
+    if old_entry:
+        user_id, category, on_date, amount = old_entry
+        Budget.adjust_spent(user_id, category, on_date, -amount)
+    if new_entry:
+        user_id, category, on_date, amount = new_entry
+        Budget.adjust_spent(user_id, category, on_date, amount)
 
 
 @transaction_bp.route("/", methods=["GET"])
 @swag_from(doc_path("transaction/get_transactions.yml"))
 @limiter.limit("20 per minute")
 @login_required
+@conditional_get(Transaction)
+@cached_response(Transaction)
 def get_transactions():
     """Gets paginated transactions for the current user."""
-    page = request.args.get("page", 1, type=int)
-    per_page = request.args.get("per_page", 12, type=int)
-
-    pagination = Transaction.query.filter_by(user_id=current_user.id) \
-        .order_by(Transaction.date.desc()) \
-        .paginate(page=page, per_page=per_page, error_out=False)
+    query = Transaction.query.filter_by(user_id=current_user.id)
 
     return json_response(
         status="success",
-        data={
-            "transactions": [
-                transaction.to_dict() for transaction in pagination.items
-            ],
-            "total": pagination.total,
-            "pages": pagination.pages,
-            "current_page": pagination.page,
-            "per_page": pagination.per_page
-        }
+        data=paginate(query, [Transaction.date, Transaction.id], "transactions")
     ), 200
 
 
@@ -73,12 +82,11 @@ def create_transaction():
     new_transaction = build_object(
         Transaction, TRANSACTION_KEYS, schema=transaction_schema
     )
-    new_transaction.save(refresh=True)
+    update_budget_spent_for_transaction(None, new_transaction.budget_entry())
+    new_transaction.save()
     logger.info(f"User {current_user.id} created transaction "
                 f"{new_transaction.id}")
 
-    update_budget_spent_for_transaction(new_transaction)
-
     return json_response(
         status="success",
         message="Transaction created successfully",
@@ -86,6 +94,64 @@ def create_transaction():
     ), 201
 
 
+@transaction_bp.route("/batch", methods=["POST"])
+@swag_from(doc_path("transaction/batch_transactions.yml"))
+@limiter.limit("10 per minute")
+@login_required
+def batch_transactions():
+    """Creates, updates and deletes transactions in one request."""
+    results, applied = apply_batch(
+        Transaction, TRANSACTION_KEYS, transaction_schema,
+        snapshot=Transaction.budget_entry,
+        on_change=update_budget_spent_for_transaction
+    )
+    if not applied:
+        return json_response(
+            status="error",
+            message="Batch validation failed",
+            data=results
+        ), 400
+    logger.info(f"User {current_user.id} applied {len(results)} "
+                "transaction operations")
+
+    return json_response(
+        status="success",
+        message="Transactions batch applied successfully",
+        data=results
+    ), 200
+
+
+@transaction_bp.route("/import", methods=["POST"])
+@swag_from(doc_path("transaction/import_transactions.yml"))
+@limiter.limit("5 per minute")
+@login_required
+def import_transactions_csv():
+    """Imports transactions from an uploaded CSV file."""
+    upload = request.files.get("file")
+    if upload is None:
+        abort(400, description="Missing CSV file")
+
+    stream = io.TextIOWrapper(upload.stream, encoding="utf-8-sig", newline="")
+    try:
+        summary, errors = import_transactions(
+            stream, current_user.id,
+            current_app.config.get("IMPORT_CHUNK_SIZE", 1000))
+    except ValueError as e:
+        abort(400, description=str(e))
+    if errors:
+        return json_response(
+            status="error",
+            message="Import validation failed",
+            data=errors
+        ), 400
+
+    return json_response(
+        status="success",
+        message="Transactions imported successfully",
+        data=summary
+    ), 201
+
+
 @transaction_bp.route("/<string:transaction_id>", methods=["PATCH"])
 @swag_from(doc_path("transaction/edit_transaction.yml"))
 @limiter.limit("10 per minute")
@@ -93,12 +159,12 @@ def create_transaction():
 @ownership_required(Transaction)
 def edit_transaction(transaction):
     """Edits a transaction."""
+    old_entry = transaction.budget_entry()
     edit_object(transaction, TRANSACTION_KEYS, schema=transaction_schema)
-    transaction.save(refresh=True)
+    update_budget_spent_for_transaction(old_entry, transaction.budget_entry())
+    transaction.save()
     logger.info(f"User {current_user.id} edited transaction {transaction.id}")
 
-    update_budget_spent_for_transaction(transaction)
-
     return json_response(
         status="success",
         message="Transaction updated successfully",
@@ -110,14 +176,14 @@ def edit_transaction(transaction):
 @swag_from(doc_path("transaction/delete_transaction.yml"))
 @limiter.limit("5 per minute")
 @login_required
-@ownership_required(Transaction)
+@ownership_required(
+    Transaction, columns=["user_id", "amount", "type", "date", "category"])
 def delete_transaction(transaction):
     """Deletes a transaction."""
+    update_budget_spent_for_transaction(transaction.budget_entry(), None)
     transaction.delete()
     logger.info(f"User {current_user.id} deleted transaction {transaction.id}")
 
-    update_budget_spent_for_transaction(transaction)
-
     return json_response(
         status="success",
         message="Transaction deleted successfully."
@@ -1,7 +1,7 @@
 """Moudle that contains shared fixtures, hooks, and config for pytest."""
 
 import pytest
-from backend import create_app, db
+from backend import create_app, db, limiter
 from backend.models import User, Task, Habit, Budget, Transaction, Note
 from backend.utils.enums import (
     Frequency, Priority, Category,
@@ -29,10 +29,32 @@ def client(app):
 
 
 @pytest.fixture
-def logged_in_client(client, user):
+def logged_in_client(app, client, user):
     """Returns a Flask test client with a logged in user."""
-    with client:
+    with app.test_request_context():
         login_user(user)
+        yield client
+
+
+@pytest.fixture
+def auth_client(client, user):
+    """
+    Returns a Flask test client logged in through the login route.
+
+    Rate limits are turned off while the test runs, and restored after.
+    """
+    client.application.config["WTF_CSRF_ENABLED"] = False
+    limiter_enabled = limiter.enabled
+    limiter.enabled = False
+    try:
+        response = client.post("/api/v1/auth/login", json={
+            "email": "testemail@example.com",
+            "password": "123456"
+        })
+        assert response.status_code == 200
+        yield client
+    finally:
+        limiter.enabled = limiter_enabled
 
 
 @pytest.fixture
@@ -79,3 +79,33 @@ def test_str_method():
     user = User(name="test", email="test@example.com")
     expected_str = f"[{user.__class__.__name__}] ({user.id}) {user.to_dict()}"
     assert expected_str == str(user)
+
+
+def test_flushed_object_serializes_without_reload(app, user):
+    """Tests a flushed object is fully loaded without a refresh."""
+    from backend.models import Task
+    from datetime import date
+    from sqlalchemy import event
+
+    task = Task(
+        title="test",
+        description="test",
+        priority="HIGH",
+        deadline=date(2025, 6, 30),
+        category="WORK",
+        user_id=user.id
+    )
+    db.session.add(task)
+    db.session.flush()
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db.engine, "before_cursor_execute", listener)
+    try:
+        d = task.to_dict()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", listener)
+
+    assert statements == []
+    assert d["completed"] is False
+    assert d["completed_at"] is None
@@ -98,3 +98,59 @@ def test_recalculate_budget_updates_spent(app, user):
     budget.recalculate_budget()
 
     assert budget.spent == 750.5
+
+
+def test_adjust_spent_updates_covering_budgets(app, user):
+    """Tests adjust_spent only changes budgets whose window has the date."""
+    covering = Budget(
+        category=BudgetCategory.FOOD,
+        amount=500.0,
+        spent=10.0,
+        period=Frequency.MONTHLY,
+        start_date=date(2025, 1, 1),
+        end_date=date(2025, 1, 31),
+        user_id=user.id
+    )
+    covering.save()
+    other = Budget(
+        category=BudgetCategory.FOOD,
+        amount=500.0,
+        spent=0.0,
+        period=Frequency.MONTHLY,
+        start_date=date(2025, 2, 1),
+        end_date=date(2025, 2, 28),
+        user_id=user.id
+    )
+    other.save()
+
+    Budget.adjust_spent(user.id, BudgetCategory.FOOD, date(2025, 1, 15), 5.5)
+    Budget.adjust_spent(user.id, BudgetCategory.FOOD, date(2025, 1, 20), -2.0)
+
+    assert covering.spent == 13.5
+    assert other.spent == 0.0
+
+
+def test_reconcile_repairs_drift(app, user, budget):
+    """Tests reconcile recalculates spent from the user's expenses."""
+    Transaction(
+        title="test",
+        category=BudgetCategory.SALARY,
+        amount=20.0,
+        date=date(2025, 6, 1),
+        type=TransactionType.EXPENSE,
+        user_id=user.id
+    ).save()
+    Transaction(
+        title="test",
+        category=BudgetCategory.SALARY,
+        amount=99.0,
+        date=date(2025, 6, 1),
+        type=TransactionType.INCOME,
+        user_id=user.id
+    ).save()
+    budget.spent = 1000.0
+    budget.save()
+
+    Budget.reconcile(user.id)
+
+    assert budget.spent == 20.0
@@ -0,0 +1,199 @@
+"""Module that contains HabitCompletion class and streak tests."""
+import pytest
+from backend import db
+from backend.models import Habit, HabitCompletion
+from backend.models.habit_completion import (
+    compute_streaks, is_streak_broken, period_index, period_start)
+from backend.utils.dates import utc_today
+from backend.utils.enums import Category, Frequency, Priority
+from datetime import date, timedelta
+from sqlalchemy import event, select
+
+
+def make_habit(user, frequency, target_count=1):
+    """Saves a habit without completions."""
+    habit = Habit(title="habit", frequency=frequency,
+                  target_count=target_count, current_streak=0,
+                  longest_streak=0, priority=Priority.LOW,
+                  category=Category.HEALTH, user_id=user.id)
+    habit.save()
+    return habit
+
+
+def complete_days(habit, days):
+    """Completes a habit on each day, in order."""
+    for day in days:
+        habit.mark_complete(day)
+
+
+def stored_streaks(habit):
+    """Returns the streaks stored as of the habit's last completion."""
+    return tuple(db.session.execute(
+        select(Habit.current_streak, Habit.longest_streak)
+        .where(Habit.id == habit.id)).one())
+
+
+def weeks_ago(count):
+    """Returns the Monday `count` weeks before this week's Monday."""
+    today = utc_today()
+    return today - timedelta(days=today.weekday(), weeks=count)
+
+
+def months_ago(count, day):
+    """Returns a day of the month `count` months before this one."""
+    index = utc_today().year * 12 + utc_today().month - 1 - count
+    return date(index // 12, index % 12 + 1, day)
+
+
+@pytest.mark.parametrize("frequency, day, start", [
+    (Frequency.DAILY, date(2025, 6, 4), date(2025, 6, 4)),
+    (Frequency.WEEKLY, date(2025, 6, 4), date(2025, 6, 2)),
+    (Frequency.WEEKLY, date(2025, 6, 1), date(2025, 5, 26)),
+    (Frequency.MONTHLY, date(2025, 12, 31), date(2025, 12, 1)),
+])
+def test_periods(frequency, day, start):
+    """Tests days map to consecutive periods starting on the right day."""
+    index = period_index(frequency, day)
+    assert period_start(frequency, index) == start
+    assert period_index(frequency, start - timedelta(days=1)) == index - 1
+
+
+def test_mark_complete_records_history(habit):
+    """Tests a completion is appended and a second one the same day fails."""
+    habit.mark_complete()
+
+    assert [c.day for c in HabitCompletion.query.filter_by(
+        habit_id=habit.id)] == [utc_today()]
+    with pytest.raises(ValueError, match="already completed"):
+        habit.mark_complete()
+
+
+def test_daily_streak_breaks_on_gap(user):
+    """Tests a missed day restarts a daily streak."""
+    habit = make_habit(user, Frequency.DAILY)
+    start = utc_today() - timedelta(days=3)
+    complete_days(habit, [start, start + timedelta(days=1),
+                          start + timedelta(days=3)])
+
+    assert (habit.current_streak, habit.longest_streak) == (1, 2)
+
+
+def test_weekly_streak_needs_target(user):
+    """Tests a week only counts once it has target_count completions."""
+    habit = make_habit(user, Frequency.WEEKLY, target_count=2)
+    week = weeks_ago(5)
+    complete_days(habit, [week, week + timedelta(days=3)])
+    assert stored_streaks(habit)[0] == 1
+
+    complete_days(habit, [week + timedelta(days=7)])
+    assert stored_streaks(habit)[0] == 1
+    complete_days(habit, [week + timedelta(days=13)])
+    assert stored_streaks(habit)[0] == 2
+
+    complete_days(habit, [week + timedelta(days=21)])
+    complete_days(habit, [week + timedelta(days=28),
+                          week + timedelta(days=29)])
+    assert (habit.current_streak, habit.longest_streak) == (1, 2)
+
+
+def test_mark_complete_is_constant_time(user):
+    """Tests a completion runs the same statements however long the history."""
+    habit = make_habit(user, Frequency.WEEKLY, target_count=3)
+    day = weeks_ago(12)
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    counts = []
+    for week in range(12):
+        event.listen(db.engine, "before_cursor_execute", capture)
+        habit.mark_complete(day + timedelta(weeks=week, days=2))
+        event.remove(db.engine, "before_cursor_execute", capture)
+        counts.append(len(statements))
+        statements.clear()
+        complete_days(habit, [day + timedelta(weeks=week, days=3),
+                              day + timedelta(weeks=week, days=4)])
+
+    assert len(set(counts[1:])) == 1
+    assert habit.current_streak == 12
+
+
+def test_compute_streaks_matches_mark_complete(user):
+    """Tests the rebuild pass gives the same streaks as the updates."""
+    habit = make_habit(user, Frequency.MONTHLY, target_count=2)
+    days = [months_ago(4, 3), months_ago(4, 9), months_ago(3, 1),
+            months_ago(3, 27), months_ago(2, 5), months_ago(1, 1),
+            months_ago(1, 2)]
+    complete_days(habit, days)
+
+    assert compute_streaks(Frequency.MONTHLY, 2, days) == (
+        habit.current_streak, habit.longest_streak, habit.last_completed)
+
+
+def test_rebuild_streaks(user, habit):
+    """Tests a rebuild restores drifted streaks from the history only."""
+    other = make_habit(user, Frequency.DAILY)
+    start = utc_today() - timedelta(days=3)
+    complete_days(other, [start + timedelta(days=i) for i in range(4)])
+    other.current_streak = 9
+    other.longest_streak = 9
+    other.save()
+
+    assert Habit.rebuild_streaks(user.id) == 2
+    db.session.expire_all()
+    assert (other.current_streak, other.longest_streak) == (4, 4)
+    assert other.last_completed == start + timedelta(days=3)
+    assert (habit.current_streak, habit.last_completed) == (0, None)
+    assert Habit.rebuild_streaks() == 0
+
+
+@pytest.mark.parametrize("frequency, last_day, today, broken", [
+    (Frequency.DAILY, date(2025, 6, 4), date(2025, 6, 5), False),
+    (Frequency.DAILY, date(2025, 6, 4), date(2025, 6, 6), True),
+    (Frequency.WEEKLY, date(2025, 6, 2), date(2025, 6, 15), False),
+    (Frequency.WEEKLY, date(2025, 6, 8), date(2025, 6, 16), True),
+    (Frequency.MONTHLY, date(2025, 5, 1), date(2025, 6, 30), False),
+    (Frequency.MONTHLY, date(2025, 4, 30), date(2025, 6, 1), True),
+    (Frequency.DAILY, None, date(2025, 6, 1), True),
+])
+def test_is_streak_broken(frequency, last_day, today, broken):
+    """Tests a streak breaks once a whole period passes without it."""
+    assert is_streak_broken(frequency, last_day, today) == broken
+
+
+def test_reset_broken_streaks(user):
+    """Tests broken streaks are reset in the database, and restart."""
+    habit = make_habit(user, Frequency.WEEKLY)
+    complete_days(habit, [weeks_ago(4), weeks_ago(3)])
+    current = make_habit(user, Frequency.DAILY)
+    complete_days(current, [utc_today() - timedelta(days=1)])
+
+    assert Habit.reset_broken_streaks(user.id) == 1
+    assert (habit.current_streak, habit.longest_streak) == (0, 2)
+    assert stored_streaks(habit) == (0, 2)
+    assert stored_streaks(current) == (1, 1)
+    assert Habit.reset_broken_streaks(user.id) == 0
+
+    habit.mark_complete()
+    assert habit.current_streak == 1
+
+
+def test_compute_streaks_resets_broken_streak():
+    """Tests the rebuild pass resets streaks broken by today."""
+    days = [date(2025, 6, 2), date(2025, 6, 3)]
+
+    assert compute_streaks(Frequency.DAILY, 1, days) == (2, 2, days[-1])
+    assert compute_streaks(Frequency.DAILY, 1, days, date(2025, 6, 4)) \
+        == (2, 2, days[-1])
+    assert compute_streaks(Frequency.DAILY, 1, days, date(2025, 6, 5)) \
+        == (0, 2, days[-1])
+
+
+def test_deleting_habit_deletes_completions(user):
+    """Tests a habit's completions are deleted with it."""
+    habit = make_habit(user, Frequency.DAILY)
+    habit.mark_complete()
+    habit.delete()
+
+    assert HabitCompletion.query.count() == 0
@@ -0,0 +1,122 @@
+"""Module that contains index usage tests for the hot queries."""
+import pytest
+from backend import db
+from backend.models import Task, Habit, Budget, Transaction, Note, Tombstone
+from backend.utils.enums import BudgetCategory, TransactionType
+from datetime import date, datetime
+from sqlalchemy import event, func, text
+from backend.utils.pagination import encode_cursor
+
+
+def query_plan(query) -> list[str]:
+    """Returns the SQLite query plan details of a query."""
+    sql = str(query.statement.compile(
+        db.engine, compile_kwargs={"literal_binds": True}))
+    rows = db.session.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+    return [row[-1] for row in rows]
+
+
+def assert_uses_index(plan: list[str]) -> None:
+    """Asserts a query plan searches an index without a table scan."""
+    assert plan, "empty query plan"
+    for detail in plan:
+        assert "TEMP B-TREE" not in detail, plan
+        assert detail.startswith("SEARCH"), plan
+        assert "INDEX" in detail, plan
+
+
+@pytest.mark.parametrize("model, sort_column", [
+    (Task, "updated_at"),
+    (Habit, "updated_at"),
+    (Budget, "updated_at"),
+    (Note, "updated_at"),
+    (Transaction, "date"),
+])
+def test_list_queries_use_index(app, model, sort_column):
+    """Tests the paginated list queries use the per-user index."""
+    column = getattr(model, sort_column)
+    query = model.query.filter_by(user_id="user") \
+        .order_by(column.desc(), model.id.desc())
+    assert_uses_index(query_plan(query))
+
+    keyset = query.filter(column < date(2025, 1, 1))
+    assert_uses_index(query_plan(keyset))
+
+
+@pytest.mark.parametrize("resource, model, sort_column", [
+    ("tasks", Task, "updated_at"),
+    ("notes", Note, "updated_at"),
+    ("transactions", Transaction, "date"),
+])
+def test_keyset_cursor_query_uses_composite_index(
+        auth_client, user, resource, model, sort_column):
+    """Tests the row value cursor predicate is a range on the index."""
+    cursor = encode_cursor([date(2025, 1, 1), "id"])
+    statements = []
+
+    def capture(conn, db_cursor, statement, parameters, *args):
+        if f"({model.__tablename__}.{sort_column}, " in statement:
+            statements.append((statement, parameters))
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        response = auth_client.get(f"/api/v1/{resource}/?cursor={cursor}")
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+    assert response.status_code == 200
+
+    [(statement, parameters)] = statements
+    plan = [row[-1] for row in db.session.connection().exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {statement}", parameters)]
+    assert_uses_index(plan)
+    index = f"ix_{model.__tablename__}_user_id_{sort_column}"
+    assert f"INDEX {index} (user_id=? AND ({sort_column},id)<(?,?))" \
+        in plan[0], plan
+
+
+def test_task_analytics_query_uses_index(app):
+    """Tests the task analytics query uses an index."""
+    query = db.session.query(
+        Task.priority, Task.category, Task.completed, func.count()
+    ).filter(
+        Task.user_id == "user"
+    ).group_by(Task.priority, Task.category, Task.completed)
+    plan = query_plan(query)
+
+    assert_uses_index(plan)
+    assert "COVERING INDEX" in plan[0]
+
+
+def test_completed_tasks_query_uses_index(app):
+    """Tests the completed tasks query uses an index."""
+    query = Task.query.filter_by(user_id="user", completed=True)
+    assert_uses_index(query_plan(query))
+
+
+def test_budget_queries_use_index(app):
+    """Tests budget lookup and recalculation queries use indexes."""
+    lookup = Budget.query.filter_by(
+        user_id="user", category=BudgetCategory.FOOD)
+    assert_uses_index(query_plan(lookup))
+
+    expenses = Transaction.query.filter_by(
+        user_id="user",
+        category=BudgetCategory.FOOD,
+        type=TransactionType.EXPENSE
+    ).filter(
+        Transaction.date >= date(2025, 1, 1),
+        Transaction.date <= date(2025, 12, 31)
+    )
+    assert_uses_index(query_plan(expenses))
+
+
+@pytest.mark.parametrize("model", [
+    Task, Habit, Budget, Note, Transaction, Tombstone])
+def test_sync_queries_use_index(app, model):
+    """Tests the delta sync queries use the per-user updated_at index."""
+    since = datetime(2025, 1, 1)
+    query = model.query.filter(
+        model.user_id == "user", model.updated_at <= datetime(2025, 2, 1),
+        model.updated_at > since).order_by(model.updated_at, model.id)
+
+    assert_uses_index(query_plan(query))
@@ -119,3 +119,37 @@ def test_task_title_too_short(app):
             category=Category.WORK,
             user_id="some-user-id"
         )
+
+
+def test_get_analytics_counts_tasks(app, user, task):
+    """Tests get_analytics groups tasks by priority, category and status."""
+    Task(
+        title="second",
+        description="test",
+        priority=Priority.LOW,
+        deadline=date(2025, 6, 30),
+        category=Category.STUDY,
+        user_id=user.id
+    ).save()
+
+    data = Task.get_analytics(user.id)
+
+    assert data["total"] == 2
+    assert data["completed"] == 1
+    assert data["unfinished"] == 1
+    assert data["priorities"] == {
+        "LOW": 1, "MEDIUM": 0, "HIGH": 1, "CRITICAL": 0}
+    assert data["categories"] == {
+        "WORK": 1, "PERSONAL": 0, "STUDY": 1,
+        "HEALTH": 0, "HOBBY": 0, "OTHER": 0}
+
+
+def test_get_analytics_without_tasks(app, user):
+    """Tests get_analytics returns zeroed counts for a user with no tasks."""
+    data = Task.get_analytics(user.id)
+
+    assert data["total"] == 0
+    assert data["completed"] == 0
+    assert data["unfinished"] == 0
+    assert set(data["priorities"].values()) == {0}
+    assert set(data["categories"].values()) == {0}
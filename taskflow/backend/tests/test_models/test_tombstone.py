@@ -0,0 +1,17 @@
+"""Module that contains Tombstone tests."""
+from datetime import timedelta
+from backend import db
+from backend.models import Tombstone
+
+
+def test_prune_keeps_tombstones_in_the_retention_window(app, user):
+    """Tests only tombstones older than the retention window are pruned."""
+    Tombstone.record("notes", user.id, ["old", "recent"])
+    old, recent = sorted(Tombstone.query.all(), key=lambda t: t.object_id)
+    old.updated_at = Tombstone.retention_cutoff() - timedelta(seconds=1)
+    recent.updated_at = Tombstone.retention_cutoff() + timedelta(hours=1)
+    db.session.commit()
+
+    assert Tombstone.prune() == 1
+    assert [t.object_id for t in Tombstone.query.all()] == ["recent"]
+    assert Tombstone.prune() == 0
@@ -1,5 +1,6 @@
 """Module that contains User class tests."""
 import pytest
+from backend.extensions import bcrypt
 from backend.models import User
 from sqlalchemy.exc import IntegrityError
 from marshmallow import ValidationError
@@ -159,6 +160,28 @@ def test_check_password_with_wrong_password():
     assert not user.check_password("wrong_password")
 
 
+def test_rehash_password_with_outdated_cost(app):
+    """Tests rehash_password replaces a hash made with another cost."""
+    user = User(name="test", email="test@example.com")
+    user._password = bcrypt.generate_password_hash(
+        "123456", rounds=5).decode("utf-8")
+
+    assert user.rehash_password("123456")
+    rounds = app.config["BCRYPT_LOG_ROUNDS"]
+    assert user._password.startswith(f"$2b${rounds:02d}$")
+    assert user.check_password("123456")
+
+
+def test_rehash_password_with_current_cost(app):
+    """Tests rehash_password keeps a hash made with the current cost."""
+    user = User(name="test", email="test@example.com")
+    user.password = "123456"
+    old_hash = user._password
+
+    assert not user.rehash_password("123456")
+    assert user._password == old_hash
+
+
 def test_user_relationships_are_accessible():
     """Tests user relationships are present and accessible."""
     user = User(name="test", email="test@example.com")
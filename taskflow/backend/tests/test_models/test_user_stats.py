@@ -0,0 +1,225 @@
+"""Module that contains UserStats class tests."""
+from datetime import date, timedelta
+from sqlalchemy import event
+from backend import db
+from backend.models import Budget, Habit, Task, Transaction, User, UserStats
+from backend.models.user_stats import SECTIONS
+from backend.utils.dates import utc_today
+from backend.utils.enums import (BudgetCategory, Category, Frequency,
+                                 Priority, TransactionType)
+
+
+def stats_row(user_id):
+    """Returns the stored stats row of a user."""
+    db.session.expire_all()
+    return UserStats.query.filter_by(user_id=user_id).one_or_none()
+
+
+def current_budget(user, category=BudgetCategory.FOOD, amount=100.0,
+                   spent=25.0):
+    """Saves a budget covering today."""
+    return Budget(
+        category=category,
+        amount=amount,
+        spent=spent,
+        period=Frequency.MONTHLY,
+        start_date=utc_today() - timedelta(days=1),
+        end_date=utc_today() + timedelta(days=1),
+        user_id=user.id
+    ).save()
+
+
+def test_stats_follow_writes(user, task, habit):
+    """Tests committed writes refresh the matching sections."""
+    stats = stats_row(user.id)
+    assert stats.tasks["total"] == 1
+    assert stats.tasks["priorities"]["HIGH"] == 1
+    assert stats.habits == {"total": 1, "active": 1,
+                            "best_current_streak": 1,
+                            "best_longest_streak": 1}
+
+    task.mark_incomplete()
+    assert stats_row(user.id).tasks["unfinished"] == 1
+
+    task.delete()
+    assert stats_row(user.id).tasks["total"] == 0
+
+
+def test_spending_covers_current_budgets(user, budget):
+    """Tests spending only counts budgets covering today."""
+    current_budget(user)
+    current_budget(user, amount=50.0, spent=5.0)
+
+    spending = stats_row(user.id).spending
+    assert spending == {"FOOD": {"amount": 150.0, "spent": 30.0}}
+
+
+def test_uncommitted_writes_do_not_refresh(user):
+    """Tests rolled back writes leave the stats untouched."""
+    Task.query.delete()
+    db.session.rollback()
+
+    assert stats_row(user.id) is None
+
+
+def test_rebuild(user, task, habit):
+    """Tests rebuild recomputes every user's stats."""
+    other = User(name="other", email="other@example.com")
+    other.password = "123456"
+    other.save()
+    UserStats.query.delete()
+    db.session.commit()
+
+    assert UserStats.rebuild() == 2
+    assert stats_row(user.id).tasks["total"] == 1
+    assert stats_row(other.id).tasks["total"] == 0
+    assert stats_row(other.id).habits["total"] == 0
+
+    assert UserStats.rebuild(user.id) == 1
+    assert UserStats.query.count() == 2
+
+
+def test_for_user_builds_missing_stats(user, task):
+    """Tests the first read builds stats that were never stored."""
+    UserStats.query.delete()
+    db.session.commit()
+
+    assert UserStats.for_user(user.id)["tasks"]["total"] == 1
+    assert stats_row(user.id) is not None
+
+
+def test_for_user_refreshes_past_spending(user):
+    """Tests spending stored on an earlier day is recomputed."""
+    current_budget(user)
+    stats = stats_row(user.id)
+    stats.spending = {}
+    stats.spending_date = utc_today() - timedelta(days=1)
+    db.session.commit()
+
+    assert UserStats.for_user(user.id)["spending"]["FOOD"]["spent"] == 25.0
+    assert stats_row(user.id).spending_date == utc_today()
+
+
+def add_tasks(user, count):
+    """Saves `count` unfinished tasks in one commit."""
+    db.session.add_all([
+        Task(title="task", description="test", priority=Priority.LOW,
+             deadline=date(2025, 6, 30), category=Category.PERSONAL,
+             user_id=user.id)
+        for _ in range(count)
+    ])
+    db.session.commit()
+
+
+def assert_matches_recount(user_id):
+    """Asserts the stored stats equal a full recount."""
+    stats = stats_row(user_id)
+    expected = UserStats.compute(set(SECTIONS), [user_id])[user_id]
+    for section in SECTIONS:
+        assert getattr(stats, section) == expected[section], section
+
+
+def test_deltas_match_recount(user, task, habit):
+    """Tests stats kept with per-row deltas equal a full recount."""
+    add_tasks(user, 3)
+    task.priority = Priority.LOW
+    task.mark_incomplete()
+    Task.query.filter_by(priority=Priority.LOW).first().delete()
+    assert_matches_recount(user.id)
+
+    habit.mark_complete()
+    Habit(title="other", frequency=Frequency.WEEKLY, target_count=2,
+          priority=Priority.LOW, category=Category.PERSONAL,
+          is_active=False, user_id=user.id).save()
+    assert_matches_recount(user.id)
+
+    budget = current_budget(user, spent=0.0)
+    current_budget(user, category=BudgetCategory.SALARY, amount=10.0)
+    Budget.adjust_spent(user.id, BudgetCategory.FOOD, utc_today(), 12.5)
+    db.session.commit()
+    budget.amount = 80.0
+    budget.save()
+    assert_matches_recount(user.id)
+    assert stats_row(user.id).spending["FOOD"] == {"amount": 80.0,
+                                                   "spent": 12.5}
+
+    budget.delete()
+    assert_matches_recount(user.id)
+    assert "FOOD" not in stats_row(user.id).spending
+
+
+def test_lost_best_streak_is_recounted(user, habit):
+    """Tests lowering the best streak recomputes the habit section."""
+    other = Habit(title="other", frequency=Frequency.DAILY, target_count=1,
+                  current_streak=3, longest_streak=5, priority=Priority.LOW,
+                  category=Category.PERSONAL, user_id=user.id).save()
+    assert stats_row(user.id).habits["best_longest_streak"] == 5
+
+    other.delete()
+    assert stats_row(user.id).habits["best_longest_streak"] == 1
+    assert stats_row(user.id).habits["best_current_streak"] == 1
+
+
+def test_restarted_streak_lowers_best_streak(user):
+    """Tests a completion that restarts a streak recounts the best one."""
+    habit = Habit(title="other", frequency=Frequency.DAILY, target_count=1,
+                  current_streak=5, longest_streak=5,
+                  last_completed=utc_today() - timedelta(days=3),
+                  priority=Priority.LOW, category=Category.PERSONAL,
+                  user_id=user.id).save()
+    assert stats_row(user.id).habits["best_current_streak"] == 5
+
+    habit.mark_complete()
+    assert stats_row(user.id).habits["best_current_streak"] == 1
+    assert_matches_recount(user.id)
+
+
+def test_write_cost_does_not_grow_with_history(user, task):
+    """Tests a write updates the stats without aggregate queries."""
+    def write_statements():
+        statements = []
+        db.session.expire_all()
+
+        def capture(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", capture)
+        try:
+            Task.query.filter_by(id=task.id).one().mark_incomplete()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", capture)
+        task.mark_complete()
+        return statements
+
+    few = write_statements()
+    add_tasks(user, 50)
+    many = write_statements()
+
+    assert len(few) == len(many)
+    assert not any("GROUP BY" in statement for statement in many)
+    assert stats_row(user.id).tasks["total"] == 51
+
+
+def test_transaction_write_applies_spent_delta(user):
+    """Tests an expense updates spending through the budget's delta."""
+    current_budget(user, spent=0.0)
+    transaction = Transaction(
+        title="lunch", amount=7.5, type=TransactionType.EXPENSE,
+        date=utc_today(), category=BudgetCategory.FOOD, user_id=user.id)
+    Budget.adjust_spent(*transaction.budget_entry())
+    transaction.save()
+
+    assert stats_row(user.id).spending["FOOD"]["spent"] == 7.5
+    assert_matches_recount(user.id)
+
+
+def test_create_skips_existing_row(user, task):
+    """Tests building a row another transaction created does not fail."""
+    stats_row(user.id).tasks = {}
+    db.session.commit()
+
+    UserStats.create(user.id)
+    db.session.commit()
+
+    assert UserStats.query.filter_by(user_id=user.id).count() == 1
+    assert stats_row(user.id).tasks["total"] == 1
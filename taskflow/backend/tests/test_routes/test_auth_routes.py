@@ -0,0 +1,51 @@
+"""Module that contains auth routes tests."""
+from backend import db, limiter
+from backend.extensions import bcrypt
+from backend.models import User
+
+
+def login(client, password="123456"):
+    """Logs the test user in through the login route."""
+    client.application.config["WTF_CSRF_ENABLED"] = False
+    limiter.enabled = False
+    return client.post("/api/v1/auth/login", json={
+        "email": "testemail@example.com",
+        "password": password
+    })
+
+
+def test_login_rehashes_outdated_hash(client, user):
+    """Tests a login upgrades a hash made with another cost."""
+    user._password = bcrypt.generate_password_hash(
+        "123456", rounds=5).decode("utf-8")
+    user.save()
+
+    assert login(client).status_code == 200
+
+    db.session.expire_all()
+    stored = db.session.get(User, user.id)._password
+    assert stored.startswith("$2b$04$")
+    assert db.session.get(User, user.id).check_password("123456")
+
+
+def test_login_keeps_current_hash(client, user):
+    """Tests a login does not rehash a hash with the current cost."""
+    old_hash = user._password
+
+    assert login(client).status_code == 200
+
+    db.session.expire_all()
+    assert db.session.get(User, user.id)._password == old_hash
+
+
+def test_failed_login_does_not_rehash(client, user):
+    """Tests a wrong password never replaces the hash."""
+    old_hash = bcrypt.generate_password_hash(
+        "123456", rounds=5).decode("utf-8")
+    user._password = old_hash
+    user.save()
+
+    assert login(client, "wrong-password").status_code == 401
+
+    db.session.expire_all()
+    assert db.session.get(User, user.id)._password == old_hash
@@ -0,0 +1,97 @@
+"""Module that contains Budget routes tests."""
+from sqlalchemy import event
+from backend import db
+from backend.models import Budget
+
+
+def create_expense(client, amount, day, category="FOOD"):
+    """Creates an expense through the API."""
+    response = client.post("/api/v1/transactions/", json={
+        "title": "test",
+        "amount": amount,
+        "type": "EXPENSE",
+        "date": day,
+        "category": category
+    })
+    assert response.status_code == 201
+
+
+def create_budget(client, start_date, end_date, category="FOOD"):
+    """Creates a budget through the API and returns its data."""
+    response = client.post("/api/v1/budgets/", json={
+        "category": category,
+        "amount": 200.0,
+        "period": "MONTHLY",
+        "start_date": start_date,
+        "end_date": end_date
+    })
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()["data"]
+
+
+def test_create_budget_counts_existing_expenses(auth_client):
+    """Tests a new budget starts with the expenses already in its window."""
+    create_expense(auth_client, 50.0, "2026-10-10")
+    create_expense(auth_client, 20.0, "2026-11-02")
+
+    data = create_budget(auth_client, "2026-10-01", "2026-10-31")
+
+    assert data["spent"] == 50.0
+    assert db.session.get(Budget, data["id"]).spent == 50.0
+
+
+def test_edit_budget_window_recalculates_spent(auth_client):
+    """Tests moving a budget's window or category sums it again."""
+    create_expense(auth_client, 50.0, "2026-10-10")
+    create_expense(auth_client, 20.0, "2026-11-02")
+    create_expense(auth_client, 5.0, "2026-11-03", category="SALARY")
+    budget_id = create_budget(auth_client, "2026-10-01", "2026-10-31")["id"]
+
+    response = auth_client.patch(f"/api/v1/budgets/{budget_id}",
+                                 json={"end_date": "2026-11-30"})
+    assert response.status_code == 200
+    assert response.get_json()["data"]["spent"] == 70.0
+
+    response = auth_client.patch(f"/api/v1/budgets/{budget_id}",
+                                 json={"category": "SALARY"})
+    assert response.status_code == 200
+    assert response.get_json()["data"]["spent"] == 5.0
+
+
+def test_batch_budgets_recalculate_spent(auth_client):
+    """Tests batch creates and window updates sum their expenses."""
+    create_expense(auth_client, 50.0, "2026-10-10")
+    create_expense(auth_client, 20.0, "2026-11-02")
+    budget_id = create_budget(auth_client, "2026-10-01", "2026-10-31")["id"]
+
+    response = auth_client.post("/api/v1/budgets/batch", json=[
+        {"op": "update", "id": budget_id,
+         "data": {"start_date": "2026-11-01", "end_date": "2026-11-30"}},
+        {"op": "create", "data": {
+            "category": "FOOD", "amount": 100.0, "period": "MONTHLY",
+            "start_date": "2026-01-01", "end_date": "2026-12-31"}},
+    ])
+    assert response.status_code == 200, response.get_json()
+
+    updated, created = response.get_json()["data"]
+    assert updated["data"]["spent"] == 20.0
+    assert created["data"]["spent"] == 70.0
+
+
+def test_delete_budget_loads_it_once(auth_client, budget):
+    """Tests deleting a budget reads its stats fields with the owner check."""
+    db.session.expunge(budget)
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        if statement.startswith("SELECT") and "WHERE budgets.id" in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        response = auth_client.delete(f"/api/v1/budgets/{budget.id}")
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+
+    assert response.status_code == 200
+    assert len(statements) == 1
@@ -0,0 +1,61 @@
+"""Module that contains dashboard routes tests."""
+
+
+def test_get_dashboard(auth_client, task, habit, note):
+    """Tests the dashboard returns every section by default."""
+    response = auth_client.get("/api/v1/dashboard/")
+
+    assert response.status_code == 200
+    data = response.get_json()["data"]
+    assert set(data) == {"stats", "tasks", "habits", "budgets",
+                         "transactions", "notes"}
+    assert data["stats"]["tasks"]["total"] == 1
+    assert data["stats"]["habits"]["active"] == 1
+    assert data["stats"]["spending"] == {}
+    assert [t["id"] for t in data["tasks"]] == [task.id]
+    assert data["notes"][0] == note.to_dict()
+    assert data["budgets"] == data["transactions"] == []
+
+
+def test_get_dashboard_after_write(auth_client, task):
+    """Tests the dashboard reflects writes made through the API."""
+    response = auth_client.patch(f"/api/v1/tasks/{task.id}/incomplete")
+    assert response.status_code == 200
+
+    data = auth_client.get("/api/v1/dashboard/").get_json()["data"]
+    assert data["stats"]["tasks"]["completed"] == 0
+    assert data["stats"]["tasks"]["unfinished"] == 1
+    assert data["tasks"][0]["completed"] is False
+
+
+def test_get_dashboard_sections_and_fields(auth_client, task, note):
+    """Tests sections and their fields can be selected."""
+    response = auth_client.get(
+        "/api/v1/dashboard/?sections=stats,notes"
+        "&fields[notes]=id,title&fields[stats]=tasks")
+
+    assert response.status_code == 200
+    data = response.get_json()["data"]
+    assert set(data) == {"stats", "notes"}
+    assert set(data["stats"]) == {"tasks"}
+    assert data["notes"] == [{"id": note.id, "title": note.title}]
+
+
+def test_get_dashboard_limit(auth_client, user, note):
+    """Tests the list sections hold at most `limit` objects."""
+    for title in ("second", "third"):
+        response = auth_client.post("/api/v1/notes/", json={
+            "title": title, "content": "test", "background_color": "BLUE"})
+        assert response.status_code == 201
+
+    data = auth_client.get(
+        "/api/v1/dashboard/?sections=notes&limit=2").get_json()["data"]
+    assert [n["title"] for n in data["notes"]] == ["third", "second"]
+
+
+def test_get_dashboard_rejects_unknown_names(auth_client):
+    """Tests unknown sections and fields are rejected."""
+    for query in ("sections=stats,users", "fields[notes]=_password",
+                  "fields[tasks]=title,secret", "fields[stats]=users"):
+        response = auth_client.get(f"/api/v1/dashboard/?{query}")
+        assert response.status_code == 400, query
@@ -0,0 +1,69 @@
+"""Module that contains export routes tests."""
+import csv
+import gzip
+import io
+import json
+from backend import db
+from backend.models import Note
+from backend.utils.enums import BackgroundColor
+
+
+def test_export_ndjson(auth_client, task, habit, note):
+    """Tests the NDJSON export has one line per object."""
+    response = auth_client.get("/api/v1/export/")
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == "application/x-ndjson"
+    assert "attachment" in response.headers["Content-Disposition"]
+    lines = [json.loads(line) for line in response.data.splitlines()]
+    assert [(line["resource"], line["data"]["id"]) for line in lines] == [
+        ("tasks", task.id), ("habits", habit.id), ("notes", note.id)]
+
+
+def test_export_streams_in_batches(auth_client, user):
+    """Tests every row is exported when there are more than one batch."""
+    db.session.add_all(
+        Note(title=f"note {i}", content="test",
+             background_color=BackgroundColor.BLUE, user_id=user.id)
+        for i in range(5))
+    db.session.commit()
+
+    response = auth_client.get("/api/v1/export/")
+    titles = [json.loads(line)["data"]["title"]
+              for line in response.data.splitlines()]
+    assert sorted(titles) == [f"note {i}" for i in range(5)]
+
+
+def test_export_csv(auth_client, task, note):
+    """Tests the CSV export has a shared header and a row per object."""
+    response = auth_client.get("/api/v1/export/?format=csv")
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/csv"
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert [(row["resource"], row["id"]) for row in rows] == [
+        ("tasks", task.id), ("notes", note.id)]
+    assert rows[0]["title"] == task.title
+    assert rows[0]["content"] == ""
+
+
+def test_export_gzip(auth_client, task):
+    """Tests the export is gzip compressed when the client accepts it."""
+    response = auth_client.get(
+        "/api/v1/export/", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    line = json.loads(gzip.decompress(response.data))
+    assert line["data"]["id"] == task.id
+
+
+def test_export_invalid_format(auth_client):
+    """Tests an unknown format is rejected with 400."""
+    response = auth_client.get("/api/v1/export/?format=xml")
+    assert response.status_code == 400
+
+
+def test_export_requires_login(client):
+    """Tests the export requires authentication."""
+    assert client.get("/api/v1/export/").status_code == 401
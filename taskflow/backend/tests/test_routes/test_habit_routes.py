@@ -0,0 +1,162 @@
+"""Module that contains habit routes tests."""
+from base64 import b64decode
+from datetime import date, timedelta
+from sqlalchemy import event, select
+from backend import db
+from backend.models import Habit
+from backend.routes import habit_routes
+from backend.utils.dates import utc_today
+from backend.utils.enums import Category, Frequency, Priority
+
+
+def make_habit(user, title):
+    """Saves a daily habit without completions."""
+    habit = Habit(title=title, frequency=Frequency.DAILY, target_count=1,
+                  current_streak=0, longest_streak=0, priority=Priority.LOW,
+                  category=Category.HEALTH, user_id=user.id)
+    habit.save()
+    return habit
+
+
+def heatmap(client, **query):
+    """Calls the heatmap route and returns its data."""
+    response = client.get("/api/v1/habits/heatmap", query_string=query)
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()["data"]
+
+
+def test_heatmap_encodes_completions(auth_client, user):
+    """Tests each habit's completions come back in both encodings."""
+    end = date(2025, 6, 30)
+    reading = make_habit(user, "reading")
+    for offset in (364, 1, 0):
+        reading.mark_complete(end - timedelta(days=offset))
+    idle = make_habit(user, "idle")
+    idle.mark_complete(end - timedelta(days=365))
+
+    data = heatmap(auth_client, end=end.isoformat())
+    assert (data["start"], data["days"]) == ("2024-07-01", 365)
+    assert set(data["habits"]) == {reading.id, idle.id}
+    bits = int.from_bytes(b64decode(data["habits"][reading.id]), "little")
+    assert bits == 1 << 0 | 1 << 363 | 1 << 364
+    assert b64decode(data["habits"][idle.id]) == bytes(46)
+
+    data = heatmap(auth_client, end=end.isoformat(), encoding="rle")
+    assert data["habits"][reading.id] == [0, 1, 362, 2]
+    assert data["habits"][idle.id] == [365]
+
+
+def test_heatmap_uses_one_query(auth_client, user):
+    """Tests the completions of all habits are read in a single query."""
+    for title in ("reading", "running", "writing"):
+        make_habit(user, title).mark_complete()
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        if "habit_completions.day" in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        data = heatmap(auth_client)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+
+    assert len(data["habits"]) == 3
+    assert len(statements) == 1
+
+
+def test_heatmap_cache_follows_writes(auth_client, user):
+    """Tests a cached heatmap is refreshed by habit and completion writes."""
+    assert heatmap(auth_client, encoding="rle")["habits"] == {}
+
+    habit = make_habit(user, "reading")
+    assert heatmap(auth_client, encoding="rle")["habits"] == {
+        habit.id: [365]}
+
+    auth_client.patch(f"/api/v1/habits/{habit.id}/complete")
+    assert heatmap(auth_client, encoding="rle")["habits"] == {
+        habit.id: [364, 1]}
+
+    auth_client.delete(f"/api/v1/habits/{habit.id}")
+    assert heatmap(auth_client, encoding="rle")["habits"] == {}
+
+
+def test_heatmap_cache_follows_the_day(auth_client, user, monkeypatch):
+    """Tests a cached default window is not served after the day ends."""
+    today = utc_today()
+    assert heatmap(auth_client)["end"] == today.isoformat()
+
+    monkeypatch.setattr(habit_routes, "utc_today",
+                        lambda: today + timedelta(days=1))
+    data = heatmap(auth_client)
+    assert data["end"] == (today + timedelta(days=1)).isoformat()
+    assert data["start"] == (today - timedelta(days=363)).isoformat()
+
+
+def test_heatmap_rejects_bad_params(auth_client):
+    """Tests invalid windows and encodings are rejected."""
+    for query in ({"days": 0}, {"days": 400}, {"encoding": "png"},
+                  {"end": "yesterday"}):
+        response = auth_client.get("/api/v1/habits/heatmap",
+                                   query_string=query)
+        assert response.status_code == 400
+
+
+def test_edit_streak_rule_recomputes_streaks(auth_client, user):
+    """Tests changing frequency or target_count recomputes the streaks."""
+    habit = make_habit(user, "reading")
+    for offset in (2, 1, 0):
+        habit.mark_complete(utc_today() - timedelta(days=offset))
+    assert habit.current_streak == 3
+
+    response = auth_client.patch(f"/api/v1/habits/{habit.id}", json={
+        "frequency": "MONTHLY", "target_count": 5})
+    assert response.status_code == 200
+    data = response.get_json()["data"]
+    assert (data["current_streak"], data["longest_streak"]) == (0, 0)
+
+    response = auth_client.post("/api/v1/habits/batch", json=[
+        {"op": "update", "id": habit.id,
+         "data": {"frequency": "DAILY", "target_count": 1}}])
+    assert response.status_code == 200
+    data = response.get_json()["data"][0]["data"]
+    assert (data["current_streak"], data["longest_streak"]) == (3, 3)
+
+
+def test_reads_persist_broken_streak_resets(auth_client, user):
+    """Tests a broken streak is reset for the list and the dashboard."""
+    habit = make_habit(user, "reading")
+    for offset in (12, 11, 10):
+        habit.mark_complete(utc_today() - timedelta(days=offset))
+    assert habit.current_streak == 3
+
+    response = auth_client.get("/api/v1/habits/")
+    assert response.status_code == 200
+    data = response.get_json()["data"]["habits"][0]
+    assert (data["current_streak"], data["longest_streak"]) == (0, 3)
+    assert db.session.scalar(select(Habit.current_streak)) == 0
+
+    stats = auth_client.get(
+        "/api/v1/dashboard/?sections=stats").get_json()["data"]["stats"]
+    assert stats["habits"]["best_current_streak"] == 0
+    assert stats["habits"]["best_longest_streak"] == 3
+
+
+def test_delete_habit_loads_it_once(auth_client, habit):
+    """Tests deleting a habit reads its stats fields with the owner check."""
+    db.session.expunge(habit)
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        if statement.startswith("SELECT") and "WHERE habits.id" in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        response = auth_client.delete(f"/api/v1/habits/{habit.id}")
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+
+    assert response.status_code == 200
+    assert len(statements) == 1
@@ -0,0 +1,140 @@
+"""Module that contains search routes tests."""
+from datetime import date
+from sqlalchemy import text
+from backend import db
+from backend.models import Note, Task, User, search_index
+from backend.utils.enums import BackgroundColor, Category, Priority
+
+
+def add_note(user_id, title, content):
+    """Saves a note and returns it."""
+    note = Note(title=title, content=content,
+                background_color=BackgroundColor.BLUE, user_id=user_id)
+    db.session.add(note)
+    db.session.commit()
+    return note
+
+
+def add_task(user_id, title, description, completed=False):
+    """Saves a task and returns it."""
+    task = Task(title=title, description=description,
+                priority=Priority.LOW, deadline=date(2025, 6, 30),
+                category=Category.WORK, completed=completed, user_id=user_id)
+    db.session.add(task)
+    db.session.commit()
+    return task
+
+
+def search(client, **query):
+    """Calls the search route and returns its data."""
+    response = client.get("/api/v1/search/", query_string=query)
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()["data"]
+
+
+def test_search_ranks_notes_and_tasks(auth_client, user):
+    """Tests matches from both resources come back, title matches first."""
+    body_match = add_note(user.id, "groceries", "buy oat milk")
+    title_match = add_task(user.id, "milk run", "corner shop")
+    add_note(user.id, "unrelated", "nothing here")
+
+    results = search(auth_client, q="milk")["results"]
+
+    assert [(r["resource"], r["id"]) for r in results] == [
+        ("tasks", title_match.id), ("notes", body_match.id)]
+    assert results[1]["snippet"] == "buy oat milk"
+
+
+def test_search_matches_prefixes_and_all_words(auth_client, user):
+    """Tests every word must match, as a prefix, ignoring accents."""
+    note = add_note(user.id, "Café plans", "meet the team on friday")
+    add_note(user.id, "cafe", "alone")
+
+    results = search(auth_client, q="cafe tea")["results"]
+    assert [r["id"] for r in results] == [note.id]
+
+
+def test_search_only_returns_own_objects(auth_client, user):
+    """Tests another user's matches are not returned."""
+    other = User(name="otheruser", email="other@example.com")
+    other.password = "123456"
+    other.save()
+    add_note(other.id, "secret milk", "milk")
+
+    assert search(auth_client, q="milk")["results"] == []
+
+
+def test_search_index_follows_updates_and_deletes(auth_client, user):
+    """Tests edits and deletes, including bulk deletes, reach the index."""
+    note = add_note(user.id, "draft", "old words")
+    add_task(user.id, "done thing", "old words", completed=True)
+
+    response = auth_client.patch(
+        f"/api/v1/notes/{note.id}", json={"content": "fresh words"})
+    assert response.status_code == 200
+    assert [r["resource"] for r in search(auth_client, q="old")["results"]] \
+        == ["tasks"]
+    assert [r["id"] for r in search(auth_client, q="fresh")["results"]] \
+        == [note.id]
+
+    assert auth_client.delete(f"/api/v1/notes/{note.id}").status_code == 200
+    assert auth_client.delete("/api/v1/tasks/completed").status_code == 200
+    assert search(auth_client, q="words")["results"] == []
+    for name in ("search_index", "search_index_keys"):
+        assert db.session.scalar(text(f"SELECT count(*) FROM {name}")) == 0
+
+
+def test_search_index_rows_are_keyed_by_rowid(app, user):
+    """Tests each indexed object's row is found through its key."""
+    note = add_note(user.id, "draft", "words")
+    task = add_task(user.id, "chore", "words")
+
+    rows = db.session.execute(text(
+        "SELECT search_index.object_id FROM search_index_keys "
+        "JOIN search_index ON search_index.rowid = search_index_keys.id "
+        "WHERE search_index_keys.object_id = search_index.object_id"
+    )).scalars().all()
+    assert sorted(rows) == sorted([note.id, task.id])
+
+
+def test_search_falls_back_to_like(auth_client, user, monkeypatch):
+    """Tests databases without a full-text index match with LIKE."""
+    monkeypatch.setattr(search_index, "SEARCH_BUILDERS", {})
+    note = add_note(user.id, "Groceries", "buy oat MILK")
+    task = add_task(user.id, "milkshake", "with bananas")
+    add_note(user.id, "100% sure", "nothing here")
+
+    results = search(auth_client, q="milk")["results"]
+    assert {(r["resource"], r["id"]) for r in results} == {
+        ("notes", note.id), ("tasks", task.id)}
+    assert search(auth_client, q="oat buy", types="notes")["results"][0][
+        "snippet"] == "buy oat MILK"
+    assert search(auth_client, q="100_")["results"] == []
+
+
+def test_search_keyset_pagination(auth_client, user):
+    """Tests following next_cursor returns every match once."""
+    ids = {add_note(user.id, f"note {i}", "milk " * (i + 1)).id
+           for i in range(5)}
+
+    seen = []
+    cursor = None
+    while True:
+        query = {"q": "milk", "per_page": 2, "types": "notes"}
+        if cursor:
+            query["cursor"] = cursor
+        data = search(auth_client, **query)
+        seen.extend(r["id"] for r in data["results"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == 5
+    assert set(seen) == ids
+
+
+def test_search_rejects_bad_queries(auth_client):
+    """Tests a query without words or with an unknown type is rejected."""
+    assert auth_client.get("/api/v1/search/?q=%20!").status_code == 400
+    assert auth_client.get(
+        "/api/v1/search/?q=milk&types=habits").status_code == 400
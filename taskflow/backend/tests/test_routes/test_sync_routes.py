@@ -0,0 +1,90 @@
+"""Module that contains sync routes tests."""
+from datetime import datetime, timedelta, timezone
+from backend.models import Note, Task, Tombstone
+
+
+def sync(client, since=None):
+    """Calls the sync route and returns its data."""
+    query = {"since": since} if since is not None else {}
+    response = client.get("/api/v1/sync/", query_string=query)
+    assert response.status_code == 200
+    return response.get_json()["data"]
+
+
+def test_full_sync(auth_client, task, note):
+    """Tests a sync without a watermark returns every object."""
+    data = sync(auth_client)
+
+    assert [t["id"] for t in data["tasks"]] == [task.id]
+    assert [n["id"] for n in data["notes"]] == [note.id]
+    assert data["habits"] == data["budgets"] == data["transactions"] == []
+    assert data["deleted"] == []
+    assert data["watermark"]
+
+
+def test_incremental_sync(auth_client, task, note):
+    """Tests a sync only returns changes after the watermark."""
+    watermark = sync(auth_client)["watermark"]
+    assert sync(auth_client, watermark)["tasks"] == []
+
+    response = auth_client.patch(
+        f"/api/v1/tasks/{task.id}", json={"title": "changed"})
+    assert response.status_code == 200
+    response = auth_client.delete(f"/api/v1/notes/{note.id}")
+    assert response.status_code == 200
+
+    data = sync(auth_client, watermark)
+    assert [t["title"] for t in data["tasks"]] == ["changed"]
+    assert data["notes"] == []
+    assert data["deleted"] == [{"resource": "notes", "id": note.id}]
+
+    assert sync(auth_client, data["watermark"])["deleted"] == []
+
+
+def test_bulk_and_batch_deletes_leave_tombstones(auth_client, task, note):
+    """Tests set-based and batch deletes also record tombstones."""
+    watermark = sync(auth_client)["watermark"]
+    task_id, note_id = task.id, note.id
+
+    assert auth_client.delete("/api/v1/tasks/completed").status_code == 200
+    response = auth_client.post(
+        "/api/v1/notes/batch", json=[{"op": "delete", "id": note_id}])
+    assert response.status_code == 200
+
+    deleted = sync(auth_client, watermark)["deleted"]
+    assert {(d["resource"], d["id"]) for d in deleted} == {
+        ("tasks", task_id), ("notes", note_id)}
+    assert Tombstone.query.count() == 2
+
+
+def test_sync_lag_holds_back_recent_changes(app, auth_client, task):
+    """Tests changes newer than the lag wait for the next sync."""
+    app.config["SYNC_LAG_SECONDS"] = 60
+
+    assert sync(auth_client)["tasks"] == []
+
+
+def test_sync_accepts_timezones(auth_client, task):
+    """Tests watermarks with an offset are converted to UTC."""
+    yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+    assert sync(auth_client, yesterday.strftime("%Y-%m-%dT%H:%M:%SZ"))["tasks"]
+    offset = yesterday.astimezone(timezone(timedelta(hours=2)))
+    assert sync(auth_client, offset.isoformat())["tasks"]
+
+
+def test_sync_invalid_watermark(auth_client):
+    """Tests an unparsable watermark is rejected."""
+    response = auth_client.get("/api/v1/sync/?since=yesterday")
+
+    assert response.status_code == 400
+
+
+def test_sync_rejects_expired_watermark(app, auth_client):
+    """Tests a watermark older than the tombstone retention is rejected."""
+    days = app.config["TOMBSTONE_RETENTION_DAYS"]
+    expired = datetime.now(timezone.utc) - timedelta(days=days + 1)
+    response = auth_client.get(
+        "/api/v1/sync/", query_string={"since": expired.isoformat()})
+
+    assert response.status_code == 410
+    assert sync(auth_client)["watermark"]
@@ -0,0 +1,109 @@
+"""Module that contains Task routes tests."""
+from sqlalchemy import event
+from backend import db
+
+
+def test_get_tasks_analytics(auth_client, task):
+    """Tests the analytics route response shape."""
+    response = auth_client.get("/api/v1/tasks/analytics")
+
+    assert response.status_code == 200
+    data = response.get_json()["data"]
+    assert data["total"] == 1
+    assert data["completed"] == 1
+    assert data["unfinished"] == 0
+    assert data["priorities"]["HIGH"] == 1
+    assert data["categories"]["WORK"] == 1
+
+
+def test_delete_completed_tasks(auth_client, task):
+    """Tests deleting completed tasks returns the deleted count."""
+    response = auth_client.delete("/api/v1/tasks/completed")
+
+    assert response.status_code == 200
+    assert response.get_json()["data"] == {"deleted": 1}
+
+    response = auth_client.delete("/api/v1/tasks/completed")
+    assert response.status_code == 404
+
+
+def test_get_tasks_not_modified(auth_client, task):
+    """Tests an unchanged list answers 304 without running the query."""
+    response = auth_client.get("/api/v1/tasks/")
+    etag = response.headers["ETag"]
+    assert response.status_code == 200
+    assert response.headers["Last-Modified"]
+
+    response = auth_client.get(
+        "/api/v1/tasks/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
+
+    response = auth_client.get(
+        "/api/v1/tasks/?per_page=5", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+def test_get_tasks_etag_changes_on_write(auth_client, task):
+    """Tests updates and deletes change the list's ETag."""
+    task_id = task.id
+    etag = auth_client.get("/api/v1/tasks/").headers["ETag"]
+
+    auth_client.patch(f"/api/v1/tasks/{task_id}/incomplete")
+    response = auth_client.get(
+        "/api/v1/tasks/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    auth_client.delete(f"/api/v1/tasks/{task_id}")
+    response = auth_client.get(
+        "/api/v1/tasks/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.get_json()["data"]["tasks"] == []
+
+
+def test_get_tasks_analytics_if_modified_since(auth_client, task):
+    """Tests If-Modified-Since is honoured without an ETag."""
+    response = auth_client.get("/api/v1/tasks/analytics")
+    last_modified = response.headers["Last-Modified"]
+
+    response = auth_client.get(
+        "/api/v1/tasks/analytics",
+        headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+    response = auth_client.get(
+        "/api/v1/tasks/analytics",
+        headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"})
+    assert response.status_code == 200
+
+
+def test_get_tasks_sparse_fields(auth_client, task):
+    """Tests ?fields= returns only the requested task fields."""
+    response = auth_client.get("/api/v1/tasks/?fields=id,title,completed")
+
+    assert response.status_code == 200
+    tasks = response.get_json()["data"]["tasks"]
+    assert tasks == [{"id": task.id, "title": task.title, "completed": True}]
+
+    response = auth_client.get("/api/v1/tasks/?fields=title,nope")
+    assert response.status_code == 400
+
+
+def test_delete_task_loads_it_once(auth_client, task):
+    """Tests deleting a task reads its stats fields with the owner check."""
+    db.session.expunge(task)
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        if statement.startswith("SELECT") and "WHERE tasks.id" in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        response = auth_client.delete(f"/api/v1/tasks/{task.id}")
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+
+    assert response.status_code == 200
+    assert len(statements) == 1
@@ -0,0 +1,137 @@
+"""Module that contains Transaction routes tests."""
+import io
+from backend.models import Transaction
+
+
+def create_expense(client, amount, day="2025-06-01", category="SALARY"):
+    """Creates an expense through the API and returns its id."""
+    response = client.post("/api/v1/transactions/", json={
+        "title": "test",
+        "amount": amount,
+        "type": "EXPENSE",
+        "date": day,
+        "category": category
+    })
+    assert response.status_code == 201
+    return response.get_json()["data"]["id"]
+
+
+def test_create_transaction_adds_to_budget(auth_client, budget):
+    """Tests creating an expense adds its amount to the budget."""
+    create_expense(auth_client, 12.5)
+    create_expense(auth_client, 7.5)
+
+    assert budget.spent == 20.0
+
+
+def test_edit_transaction_moves_amount(auth_client, budget):
+    """Tests editing an expense moves its amount between budgets."""
+    transaction_id = create_expense(auth_client, 10.0)
+
+    response = auth_client.patch(
+        f"/api/v1/transactions/{transaction_id}", json={"amount": 4.0})
+    assert response.status_code == 200
+    assert budget.spent == 4.0
+
+    response = auth_client.patch(
+        f"/api/v1/transactions/{transaction_id}", json={"category": "FOOD"})
+    assert response.status_code == 200
+    assert budget.spent == 0.0
+
+    response = auth_client.patch(
+        f"/api/v1/transactions/{transaction_id}",
+        json={"category": "SALARY", "type": "INCOME"})
+    assert response.status_code == 200
+    assert budget.spent == 0.0
+
+
+def test_delete_transaction_removes_from_budget(auth_client, budget):
+    """Tests deleting an expense subtracts its amount from the budget."""
+    create_expense(auth_client, 10.0)
+    transaction_id = create_expense(auth_client, 5.0)
+
+    response = auth_client.delete(f"/api/v1/transactions/{transaction_id}")
+    assert response.status_code == 200
+    assert budget.spent == 10.0
+    assert Transaction.query.count() == 1
+
+
+def test_batch_transactions_update_budget(auth_client, budget):
+    """Tests a batch moves every expense's amount into the budget."""
+    transaction_id = create_expense(auth_client, 10.0)
+    expense = {"title": "test", "amount": 2.5, "type": "EXPENSE",
+               "date": "2025-06-01", "category": "SALARY"}
+
+    response = auth_client.post("/api/v1/transactions/batch", json=[
+        {"op": "create", "data": expense},
+        {"op": "create", "data": expense},
+        {"op": "update", "id": transaction_id, "data": {"amount": 4.0}},
+    ])
+
+    assert response.status_code == 200
+    assert budget.spent == 9.0
+
+    response = auth_client.post("/api/v1/transactions/batch", json=[
+        {"op": "delete", "id": transaction_id},
+    ])
+
+    assert response.status_code == 200
+    assert budget.spent == 5.0
+
+
+def test_import_transactions_updates_budget(auth_client, budget):
+    """Tests a CSV import adds every expense to the budget once."""
+    csv_text = (
+        "title,amount,type,date,category\n"
+        "groceries,12.5,EXPENSE,2025-06-01,SALARY\n"
+        "refund,3,INCOME,2025-06-02,SALARY\n"
+        "rent,7.5,EXPENSE,2025-06-03,SALARY\n"
+    )
+    response = auth_client.post("/api/v1/transactions/import", data={
+        "file": (io.BytesIO(csv_text.encode()), "bank.csv")})
+
+    assert response.status_code == 201
+    assert response.get_json()["data"]["rows"] == 3
+    assert Transaction.query.count() == 3
+    assert budget.spent == 20.0
+
+
+def test_import_transactions_rejects_invalid_rows(auth_client, budget):
+    """Tests an import with an invalid row keeps nothing."""
+    csv_text = (
+        "title,amount,type,date,category\n"
+        "groceries,12.5,EXPENSE,2025-06-01,SALARY\n"
+        "rent,7.5,EXPENSE,2025-06-03,SALARY\n"
+        "bad,abc,EXPENSE,2025-06-03,SALARY\n"
+    )
+    response = auth_client.post("/api/v1/transactions/import", data={
+        "file": (io.BytesIO(csv_text.encode()), "bank.csv")})
+
+    assert response.status_code == 400
+    errors = response.get_json()["data"]
+    assert [error["row"] for error in errors] == [3]
+    assert "amount" in errors[0]["errors"]
+    assert Transaction.query.count() == 0
+    assert budget.spent == 0.0
+
+
+def test_import_transactions_rejects_malformed_csv(auth_client, budget):
+    """Tests malformed CSV is rejected with its row number."""
+    csv_text = (
+        "title,amount,type,date,category\n"
+        "groceries,12.5,EXPENSE,2025-06-01,SALARY\n"
+        '"rent,7.5,EXPENSE,2025-06-03,SALARY\n'
+    )
+    response = auth_client.post("/api/v1/transactions/import", data={
+        "file": (io.BytesIO(csv_text.encode()), "bank.csv")})
+
+    assert response.status_code == 400
+    assert [error["row"] for error in response.get_json()["data"]] == [2]
+    assert Transaction.query.count() == 0
+    assert budget.spent == 0.0
+
+
+def test_import_transactions_requires_file(auth_client):
+    """Tests an import without a file is rejected."""
+    response = auth_client.post("/api/v1/transactions/import", data={})
+    assert response.status_code == 400
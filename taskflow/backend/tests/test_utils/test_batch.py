@@ -0,0 +1,101 @@
+"""Module that contains batch utils tests."""
+from sqlalchemy import event
+from backend import db
+from backend.models import Note
+
+
+def note_data(title="batch note"):
+    """Returns the data of a valid note."""
+    return {"title": title, "content": "test", "background_color": "BLUE"}
+
+
+def test_batch_applies_operations(auth_client, note):
+    """Tests a batch creates, updates and deletes notes."""
+    other = Note(title="other", content="test", background_color="BLUE",
+                 user_id=note.user_id).save()
+
+    response = auth_client.post("/api/v1/notes/batch", json=[
+        {"op": "create", "data": note_data("first")},
+        {"op": "create", "data": note_data("second")},
+        {"op": "update", "id": note.id, "data": {"title": "renamed"}},
+        {"op": "delete", "id": other.id},
+    ])
+
+    assert response.status_code == 200
+    results = response.get_json()["data"]
+    assert [result["status"] for result in results] == \
+        ["created", "created", "updated", "deleted"]
+    assert results[0]["data"]["title"] == "first"
+    assert results[2]["data"]["title"] == "renamed"
+    assert "data" not in results[3]
+
+    titles = {n.title for n in Note.query.all()}
+    assert titles == {"first", "second", "renamed"}
+
+
+def test_batch_is_all_or_nothing(auth_client, note):
+    """Tests one invalid operation rejects the whole batch."""
+    response = auth_client.post("/api/v1/notes/batch", json=[
+        {"op": "create", "data": note_data()},
+        {"op": "update", "id": note.id, "data": {"title": "x"}},
+        {"op": "delete", "id": "missing"},
+        {"op": "rename", "id": note.id},
+    ])
+
+    assert response.status_code == 400
+    results = response.get_json()["data"]
+    assert [result["status"] for result in results] == \
+        ["skipped", "error", "error", "error"]
+    assert "title" in results[1]["errors"]
+    assert "id" in results[2]["errors"]
+    assert "op" in results[3]["errors"]
+
+    db.session.expire_all()
+    assert Note.query.count() == 1
+    assert db.session.get(Note, note.id).title == "test"
+
+
+def test_batch_rejects_bad_shapes(auth_client, note):
+    """Tests malformed batches are rejected."""
+    assert auth_client.post(
+        "/api/v1/notes/batch", json=[]).status_code == 400
+    assert auth_client.post(
+        "/api/v1/notes/batch", json={"op": "create"}).status_code == 400
+
+    response = auth_client.post("/api/v1/notes/batch", json=[
+        {"op": "delete", "id": note.id},
+        {"op": "update", "id": note.id, "data": {"title": "twice"}},
+    ])
+    assert response.status_code == 400
+    assert "id" in response.get_json()["data"][1]["errors"]
+
+
+def test_batch_size_limit(app, auth_client):
+    """Tests batches over BATCH_MAX_SIZE are rejected."""
+    app.config["BATCH_MAX_SIZE"] = 2
+    response = auth_client.post("/api/v1/notes/batch", json=[
+        {"op": "create", "data": note_data()}] * 3)
+
+    assert response.status_code == 400
+    assert Note.query.count() == 0
+
+
+def test_batch_inserts_in_one_statement(auth_client):
+    """Tests created rows are written with a single INSERT."""
+    statements = []
+
+    def on_execute(conn, cursor, statement, parameters, context, many):
+        if statement.startswith("INSERT INTO notes"):
+            statements.append((statement, many))
+
+    event.listen(db.engine, "before_cursor_execute", on_execute)
+    try:
+        response = auth_client.post("/api/v1/notes/batch", json=[
+            {"op": "create", "data": note_data(f"note {i}")}
+            for i in range(20)])
+    finally:
+        event.remove(db.engine, "before_cursor_execute", on_execute)
+
+    assert response.status_code == 200
+    assert len(statements) == 1
+    assert Note.query.count() == 20
@@ -0,0 +1,42 @@
+"""Module that contains cache utils tests."""
+from backend.utils import cache
+from backend.utils.cache import LRUCache
+
+
+def test_get_and_set():
+    """Tests values are returned until deleted."""
+    lru = LRUCache(maxsize=2, ttl=60)
+    lru.set("a", 1)
+
+    assert lru.get("a") == 1
+    assert lru.get("missing", "default") == "default"
+
+    lru.delete("a")
+    assert lru.get("a") is None
+
+
+def test_evicts_least_recently_used():
+    """Tests the least recently used entry is evicted first."""
+    lru = LRUCache(maxsize=2, ttl=60)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    lru.get("a")
+    lru.set("c", 3)
+
+    assert lru.get("b") is None
+    assert lru.get("a") == 1
+    assert lru.get("c") == 3
+    assert len(lru) == 2
+
+
+def test_entries_expire(monkeypatch):
+    """Tests entries expire after their time to live."""
+    now = [100.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    lru = LRUCache(maxsize=2, ttl=10)
+    lru.set("a", 1)
+    lru.set("b", 2, ttl=30)
+
+    now[0] += 11
+    assert lru.get("a") is None
+    assert lru.get("b") == 2
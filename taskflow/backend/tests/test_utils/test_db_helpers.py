@@ -1,8 +1,12 @@
 """Module that contains database helpers tests."""
+import bleach
 import pytest
+from sqlalchemy import event
+from backend import db
 from backend.utils.db_helpers import (
-    check_model, sanitize_input, get_object, build_object, edit_object)
-from backend.models import BaseModel, User, Note
+    check_model, sanitize_input, get_object, build_object, edit_object,
+    bulk_delete, collection_version)
+from backend.models import BaseModel, User, Note, Task
 from backend.schemas.note_schema import NoteSchema
 from werkzeug.exceptions import NotFound, HTTPException
 
@@ -40,6 +44,15 @@ def test_sanitize_input():
     assert cleaned["safe"] == "Normal"
 
 
+def test_sanitize_input_matches_bleach():
+    """Tests skipping bleach for plain strings gives the same output."""
+    values = ["plain text", "tab\tand\nnewline", "a & b", "x\x00y",
+              "carriage\r\nreturn", "caf\u00e9 \u6f22", "1 > 0"]
+    cleaned = sanitize_input(dict(enumerate(values)), range(len(values)))
+
+    assert list(cleaned.values()) == [bleach.clean(v) for v in values]
+
+
 def test_valid_get_object(logged_in_client, note):
     """Tests valid get_object."""
     obj = get_object(Note, note.id)
@@ -64,6 +77,37 @@ def test_wrong_user_id_get_object(logged_in_client, note):
         obj = get_object(Note, note.id)
 
 
+def test_columns_get_object(logged_in_client, note):
+    """Tests get_object only loads the requested columns."""
+    statements = []
+
+    def on_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", on_execute)
+    try:
+        obj = get_object(Note, note.id, columns=["user_id"])
+    finally:
+        event.remove(db.engine, "before_cursor_execute", on_execute)
+
+    [statement] = [s for s in statements if "FROM notes" in s]
+    assert obj is note
+    assert "notes.user_id = ?" in statement
+    assert "notes.content" not in statement
+
+
+def test_other_user_get_object(logged_in_client, note):
+    """Tests get_object filters out rows owned by another user."""
+    other = User(name="other", email="other@example.com")
+    other.password = "123456"
+    other.save()
+    note.user_id = other.id
+    note.save()
+
+    with pytest.raises(NotFound, match="not found or unauthorized"):
+        get_object(Note, note.id)
+
+
 def test_none_get_object(logged_in_client):
     """Tests wrong user_id get_object."""
     with pytest.raises(Exception, match="not found or unauthorized"):
@@ -154,3 +198,43 @@ def test_invalid_edit_object(logged_in_client, note):
     description = exc_info.value.description
     assert "hacker_field" in description["data"]
     assert "Unknown field." in description["data"]["hacker_field"]
+
+
+def test_bulk_delete(app, user, task, note):
+    """Tests bulk_delete removes only the user's matching rows."""
+    other = User(name="other", email="other@example.com")
+    other.password = "123456"
+    other.save()
+    Note(title="other", content="test", background_color="BLUE",
+         user_id=other.id).save()
+
+    assert bulk_delete(Task, Task.completed.is_(False), user_id=user.id) == 0
+    assert bulk_delete(Task, Task.completed.is_(True), user_id=user.id) == 1
+    assert bulk_delete(Note, user_id=user.id) == 1
+
+    assert Task.query.count() == 0
+    assert Note.query.filter_by(user_id=other.id).count() == 1
+
+
+def test_unavailable_model_bulk_delete(app, user):
+    """Tests bulk_delete rejects unavailable models."""
+    with pytest.raises(NotFound, match="model is unavailable"):
+        bulk_delete(User, user_id=user.id)
+
+
+def test_collection_version(logged_in_client, user, note):
+    """Tests the collection version moves on every kind of write."""
+    last_modified, count = collection_version(Note, user.id)
+    assert (last_modified, count) == (note.updated_at, 1)
+
+    note.title = "changed"
+    note.save()
+    changed, _ = collection_version(Note, user.id)
+    assert changed > last_modified
+
+    note.delete()
+    deleted, count = collection_version(Note, user.id)
+    assert count == 0
+    assert deleted >= changed
+
+    assert collection_version(Task, user.id) == (None, 0)
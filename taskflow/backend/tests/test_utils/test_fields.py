@@ -0,0 +1,33 @@
+"""Module that contains sparse fieldset utils tests."""
+import pytest
+from werkzeug.exceptions import BadRequest
+from backend import db
+from backend.models import Note, User
+from backend.utils.fields import load_fields, parse_fields
+
+
+def test_parse_fields():
+    """Tests fields are split, stripped and deduplicated."""
+    assert parse_fields(Note, None) is None
+    assert parse_fields(Note, "") is None
+    assert parse_fields(Note, " title, id,title ,") == ["title", "id"]
+
+
+@pytest.mark.parametrize("value", ["secret", "title,user", "_password"])
+def test_parse_unknown_fields(value):
+    """Tests fields outside the model's public columns are rejected."""
+    with pytest.raises(BadRequest):
+        parse_fields(User if value == "_password" else Note, value)
+
+
+def test_load_fields(app, note):
+    """Tests only the requested columns are selected."""
+    query = load_fields(Note.query, Note, ["title"])
+    sql = str(query.statement.compile(db.engine))
+
+    assert "notes.title" in sql
+    assert "notes.id" in sql
+    assert "notes.content" not in sql
+
+    query = Note.query
+    assert load_fields(query, Note, None) is query
@@ -0,0 +1,27 @@
+"""Module that contains heatmap encoding tests."""
+from base64 import b64decode
+import pytest
+from backend.utils.heatmap import encode_bitset, encode_runs
+
+
+def test_encode_bitset_is_little_endian():
+    """Tests day i is bit i % 8 of byte i // 8."""
+    bits = 1 << 0 | 1 << 9 | 1 << 364
+
+    data = b64decode(encode_bitset(bits, 365))
+
+    assert len(data) == 46
+    assert data[0] == 1 and data[1] == 2 and data[45] == 16
+    assert int.from_bytes(data, "little") == bits
+
+
+@pytest.mark.parametrize("bits, days, runs", [
+    (0, 5, [5]),
+    (0b11111, 5, [0, 5]),
+    (0b00110, 5, [1, 2, 2]),
+    (0b10001, 5, [0, 1, 3, 1]),
+])
+def test_encode_runs(bits, days, runs):
+    """Tests runs alternate missed and completed days, missed first."""
+    assert encode_runs(bits, days) == runs
+    assert sum(runs) == days
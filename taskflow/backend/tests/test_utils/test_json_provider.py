@@ -0,0 +1,85 @@
+"""Module that contains JSON provider utils tests."""
+import json
+import pytest
+from datetime import datetime, date
+from backend.utils import json_provider
+from backend.utils.enums import Priority
+from backend.utils.json_provider import FastJSONProvider, default
+from backend.utils.serializers import format_enum
+
+PAYLOAD = {
+    "status": "success",
+    "data": {
+        "deadline": date(2025, 6, 30),
+        "completed_at": datetime(2025, 6, 30, 18, 30, 2),
+        "priority": format_enum(Priority.HIGH),
+        "counts": {1: 2},
+        "tags": ["a", "b"],
+        "amount": 1.5,
+        "empty": None
+    },
+    "message": ""
+}
+EXPECTED = {
+    "status": "success",
+    "data": {
+        "deadline": "2025-06-30",
+        "completed_at": "2025-06-30 18:30:02",
+        "priority": "HIGH",
+        "counts": {"1": 2},
+        "tags": ["a", "b"],
+        "amount": 1.5,
+        "empty": None
+    },
+    "message": ""
+}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def provider(request, app, monkeypatch):
+    """JSON provider using each available encoder."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_provider, "orjson", None)
+    return FastJSONProvider(app)
+
+
+def test_app_uses_fast_provider(app):
+    """Tests the app is configured with the fast JSON provider."""
+    assert isinstance(app.json, FastJSONProvider)
+
+
+def test_dumps_handles_dates_and_enums(provider):
+    """Tests dumps encodes dates and formatted enums with every encoder."""
+    assert json.loads(provider.dumps(PAYLOAD)) == EXPECTED
+
+
+def test_default_encodes_enums_by_name(app, monkeypatch):
+    """Tests enums without a native encoding are encoded by name."""
+    monkeypatch.setattr(json_provider, "orjson", None)
+    provider = FastJSONProvider(app)
+
+    assert default(Priority.HIGH) == format_enum(Priority.HIGH) == "HIGH"
+    assert json.loads(provider.dumps({"priority": Priority.HIGH})) \
+        == {"priority": "HIGH"}
+
+
+def test_dumps_sorts_keys(provider):
+    """Tests dumps keeps Flask's sorted key order."""
+    assert list(json.loads(provider.dumps({"b": 1, "a": 2}))) == ["a", "b"]
+
+
+def test_loads(provider):
+    """Tests loads parses strings and bytes."""
+    assert provider.loads('{"a": [1, 2]}') == {"a": [1, 2]}
+    assert provider.loads(b'{"a": null}') == {"a": None}
+
+
+def test_response(provider, app):
+    """Tests response returns a JSON response."""
+    with app.test_request_context():
+        response = provider.response(PAYLOAD)
+
+    assert response.mimetype == "application/json"
+    assert json.loads(response.get_data()) == EXPECTED
@@ -0,0 +1,137 @@
+"""Module that contains pagination utils tests."""
+import pytest
+from backend import db
+from datetime import datetime, date, timedelta
+from sqlalchemy import event
+from backend.models import Note, Transaction
+from backend.utils.enums import (
+    BackgroundColor, BudgetCategory, TransactionType
+)
+from backend.utils.pagination import encode_cursor, decode_cursor, paginate
+from werkzeug.exceptions import BadRequest
+
+
+def make_notes(user, count):
+    """Saves `count` notes with distinct updated_at values."""
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    notes = []
+    for i in range(count):
+        note = Note(
+            title=f"note {i}",
+            content="test",
+            background_color=BackgroundColor.BLUE,
+            user_id=user.id
+        )
+        note.updated_at = base + timedelta(minutes=i)
+        db.session.add(note)
+        notes.append(note)
+    db.session.commit()
+    return notes
+
+
+def test_cursor_round_trip():
+    """Tests a cursor decodes back to typed values."""
+    columns = [Note.updated_at, Note.id]
+    values = [datetime(2025, 1, 1, 12, 30, 5), "abc"]
+    assert decode_cursor(encode_cursor(values), columns) == values
+
+    columns = [Transaction.date, Transaction.id]
+    values = [date(2025, 1, 1), "abc"]
+    assert decode_cursor(encode_cursor(values), columns) == values
+
+
+def test_invalid_cursor_aborts(app):
+    """Tests a malformed cursor is rejected with 400."""
+    with pytest.raises(BadRequest, match="Invalid cursor"):
+        decode_cursor("not-a-cursor", [Note.updated_at, Note.id])
+
+
+def test_offset_pagination_is_default(app, user):
+    """Tests pagination without a cursor keeps the offset response."""
+    make_notes(user, 3)
+    query = Note.query.filter_by(user_id=user.id)
+    with app.test_request_context("/?per_page=2"):
+        data = paginate(query, [Note.updated_at, Note.id], "notes")
+
+    assert data["total"] == 3
+    assert data["pages"] == 2
+    assert data["current_page"] == 1
+    assert len(data["notes"]) == 2
+
+
+def test_keyset_pagination_walks_all_rows(app, user):
+    """Tests following next_cursor returns every row once, in order."""
+    notes = make_notes(user, 5)
+    expected = [n.id for n in sorted(
+        notes, key=lambda n: (n.updated_at, n.id), reverse=True)]
+
+    query = Note.query.filter_by(user_id=user.id)
+    seen = []
+    cursor = ""
+    while cursor is not None:
+        with app.test_request_context(f"/?per_page=2&cursor={cursor}"):
+            data = paginate(query, [Note.updated_at, Note.id], "notes")
+        assert "total" not in data
+        seen.extend(note["id"] for note in data["notes"])
+        cursor = data["next_cursor"]
+
+    assert seen == expected
+
+
+def test_keyset_pagination_on_date(app, user):
+    """Tests keyset pagination on transaction dates."""
+    for day in range(1, 4):
+        Transaction(
+            title="test",
+            amount=1.0,
+            type=TransactionType.EXPENSE,
+            date=date(2025, 1, day),
+            category=BudgetCategory.FOOD,
+            user_id=user.id
+        ).save()
+
+    query = Transaction.query.filter_by(user_id=user.id)
+    columns = [Transaction.date, Transaction.id]
+    with app.test_request_context("/?per_page=2&cursor="):
+        first = paginate(query, columns, "transactions")
+    with app.test_request_context(
+            f"/?per_page=2&cursor={first['next_cursor']}"):
+        second = paginate(query, columns, "transactions")
+
+    dates = [t["date"] for t in first["transactions"] +
+             second["transactions"]]
+    assert dates == ["2025-01-03", "2025-01-02", "2025-01-01"]
+    assert second["next_cursor"] is None
+
+
+def test_sparse_fields_limit_select_and_output(app, user):
+    """Tests ?fields= limits both the SELECT and the serialized items."""
+    make_notes(user, 3)
+    query = Note.query.filter_by(user_id=user.id)
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    db.session.expunge_all()
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        with app.test_request_context("/?per_page=2&cursor=&fields=title"):
+            data = paginate(query, [Note.updated_at, Note.id], "notes")
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+
+    assert [set(note) for note in data["notes"]] == [{"title"}] * 2
+    assert data["next_cursor"] is not None
+    select = next(s for s in statements if "FROM notes" in s)
+    assert "notes.content" not in select
+    assert "notes.title" in select
+    assert len(statements) == 1
+
+
+def test_sparse_fields_unknown_field_aborts(app, user):
+    """Tests an unknown field is rejected with 400."""
+    query = Note.query.filter_by(user_id=user.id)
+    with app.test_request_context("/?fields=title,_password"):
+        with pytest.raises(BadRequest, match="Unknown fields: _password"):
+            paginate(query, [Note.updated_at, Note.id], "notes")
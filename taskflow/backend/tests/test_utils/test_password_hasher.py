@@ -0,0 +1,91 @@
+"""Module that contains password hasher tests."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from flask_bcrypt import Bcrypt
+from backend.extensions import password_hasher
+from backend.utils.password_hasher import PasswordHasher
+
+
+def test_hash_and_check(app):
+    """Tests hashes made by the hasher verify."""
+    pw_hash = password_hasher.hash("secret")
+
+    assert isinstance(pw_hash, str)
+    assert password_hasher.check(pw_hash, "secret")
+    assert not password_hasher.check(pw_hash, "wrong")
+
+
+def test_concurrency_is_bounded(app, monkeypatch):
+    """Tests no more hashes run at once than the pool size."""
+    running, peak = [0], [0]
+    lock = threading.Lock()
+    hashpw = password_hasher.bcrypt.generate_password_hash
+
+    def record(password):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        try:
+            return hashpw(password)
+        finally:
+            with lock:
+                running[0] -= 1
+
+    monkeypatch.setattr(
+        password_hasher.bcrypt, "generate_password_hash", record)
+    with ThreadPoolExecutor(max_workers=6) as callers:
+        list(callers.map(password_hasher.hash, "abcdef"))
+
+    assert 1 <= peak[0] <= app.config["BCRYPT_POOL_SIZE"]
+
+
+def test_pool_size_from_config(app):
+    """Tests the pool size comes from BCRYPT_POOL_SIZE."""
+    assert password_hasher.pool_size == app.config["BCRYPT_POOL_SIZE"]
+
+
+def test_stats(app):
+    """Tests the hasher records queue depth and latency."""
+    hasher = PasswordHasher(Bcrypt(app))
+    app.config["BCRYPT_POOL_SIZE"] = 1
+    hasher.init_app(app)
+
+    with ThreadPoolExecutor(max_workers=4) as callers:
+        hashes = list(callers.map(hasher.hash, ["a", "b", "c", "d"]))
+
+    stats = hasher.stats()
+    assert len(set(hashes)) == 4
+    assert stats["pool_size"] == 1
+    assert stats["completed"] == 4
+    assert stats["queued"] == 0
+    assert stats["running"] == 0
+    assert stats["max_latency"] >= stats["mean_latency"] > 0
+    assert stats["max_wait"] >= stats["mean_wait"] >= 0
+
+
+def test_without_init_app_runs_unbounded(app):
+    """Tests a hasher that was not configured hashes without a limit."""
+    hasher = PasswordHasher(Bcrypt(app))
+
+    assert hasher.check(hasher.hash("secret"), "secret")
+    assert hasher.stats()["completed"] == 0
+
+
+def test_needs_rehash(app):
+    """Tests needs_rehash compares the hash cost and prefix."""
+    current = password_hasher.hash("secret")
+    costly = password_hasher.bcrypt.generate_password_hash(
+        "secret", rounds=5).decode("utf-8")
+    old_prefix = password_hasher.bcrypt.generate_password_hash(
+        "secret", prefix="2a").decode("utf-8")
+
+    assert password_hasher.rounds == app.config["BCRYPT_LOG_ROUNDS"]
+    assert not password_hasher.needs_rehash(current)
+    assert password_hasher.needs_rehash(costly)
+    assert password_hasher.needs_rehash(old_prefix)
+    assert password_hasher.needs_rehash("not a hash")
+    assert password_hasher.needs_rehash(None)
+
+    app.config["BCRYPT_LOG_ROUNDS"] = 5
+    assert password_hasher.needs_rehash(current)
+    assert not password_hasher.needs_rehash(costly)
@@ -0,0 +1,124 @@
+"""Module that contains response cache utils tests."""
+from datetime import datetime, timezone
+from redis import exceptions as redis_exceptions
+from sqlalchemy import update
+from backend import db
+from backend.extensions import response_cache
+from backend.models import Note, Task
+from backend.utils.response_cache import ResponseCache
+
+
+class FakeRedis():
+    """In-memory stand-in for the Redis client methods the cache uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, nx=False):
+        if not (nx and key in self.data):
+            self.data[key] = str(value).encode()
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1).encode()
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        return []
+
+
+class BrokenRedis():
+    """Redis client whose every call fails."""
+
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise redis_exceptions.ConnectionError("down")
+        return fail
+
+
+def test_local_get_set_invalidate(app, user, task):
+    """Tests a committed write hides entries cached before it."""
+    cache = ResponseCache()
+    key, body = cache.get(Task, user.id, "/tasks")
+    assert body is None
+
+    cache.set(key, b"cached")
+    assert cache.get(Task, user.id, "/tasks") == (key, b"cached")
+    assert cache.get(Note, user.id, "/tasks")[1] is None
+
+    task.title = "changed"
+    task.save()
+    assert cache.get(Task, user.id, "/tasks")[1] is None
+
+
+def test_local_versions_are_shared_by_workers(app, user, task):
+    """Tests a worker sees writes committed without its invalidation."""
+    worker = ResponseCache()
+    key, _ = worker.get(Task, user.id, "/tasks")
+    worker.set(key, b"cached")
+
+    db.session.execute(update(Task).values(
+        title="changed", updated_at=datetime.now(timezone.utc)))
+    db.session.commit()
+    worker.invalidate([("tasks", user.id)])
+
+    assert worker.get(Task, user.id, "/tasks")[1] is None
+
+
+def test_redis_tier(monkeypatch):
+    """Tests entries and versions live in Redis when it is configured."""
+    cache = ResponseCache()
+    cache.redis = FakeRedis()
+
+    key, _ = cache.get(Task, "user", "/tasks")
+    cache.set(key, b"cached")
+    assert cache.get(Task, "user", "/tasks")[1] == b"cached"
+    assert len(cache.local) == 0
+
+    cache.invalidate([("tasks", "user")])
+    assert cache.get(Task, "user", "/tasks")[1] is None
+
+
+def test_redis_errors_disable_caching():
+    """Tests a failing Redis makes every lookup a miss."""
+    cache = ResponseCache()
+    cache.redis = BrokenRedis()
+
+    key, body = cache.get(Task, "user", "/tasks")
+    cache.set(key, b"cached")
+    cache.invalidate([("tasks", "user")])
+
+    assert (key, body) == (None, None)
+
+
+def test_route_is_cached_until_write(auth_client, task, monkeypatch):
+    """Tests a cached first page is served until the user writes."""
+    first = auth_client.get("/api/v1/tasks/").get_json()
+
+    monkeypatch.setattr(Task, "query", None)
+    assert auth_client.get("/api/v1/tasks/").get_json() == first
+    monkeypatch.undo()
+
+    response = auth_client.patch(
+        f"/api/v1/tasks/{task.id}", json={"title": "changed"})
+    assert response.status_code == 200
+
+    tasks = auth_client.get("/api/v1/tasks/").get_json()["data"]["tasks"]
+    assert tasks[0]["title"] == "changed"
+
+
+def test_later_pages_are_not_cached(auth_client, task):
+    """Tests only first pages are stored."""
+    auth_client.get("/api/v1/tasks/?page=2")
+    auth_client.get("/api/v1/tasks/?cursor=abc")
+
+    assert len(response_cache.local) == 0
+    auth_client.get("/api/v1/tasks/?page=1")
+    assert len(response_cache.local) == 1
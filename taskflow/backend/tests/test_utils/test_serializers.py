@@ -0,0 +1,55 @@
+"""Module that contains serializers utils tests."""
+from datetime import datetime, date, timezone
+from backend import db
+from backend.models import Task, User
+from backend.utils.enums import Priority
+from backend.utils.serializers import (
+    format_datetime, format_date, format_enum, get_serializer)
+
+
+def test_formatters():
+    """Tests the value formatters."""
+    assert format_datetime(datetime(2025, 6, 30, 18, 30, 2, 999)) == \
+        "2025-06-30 18:30:02"
+    assert format_datetime(
+        datetime(2025, 6, 30, 18, 30, 2, tzinfo=timezone.utc)) == \
+        "2025-06-30 18:30:02"
+    assert format_date(date(2025, 6, 30)) == "2025-06-30"
+    assert format_enum(Priority.HIGH) == "HIGH"
+    assert format_enum("HIGH") == "HIGH"
+
+
+def test_serializer_is_cached():
+    """Tests the serializer is built once per model."""
+    assert get_serializer(Task) is get_serializer(Task)
+    assert get_serializer(Task) is not get_serializer(User)
+
+
+def test_serializer_field_order():
+    """Tests the serializer emits every column in a stable order."""
+    user = User(name="test", email="test@example.com")
+    user.password = "123456"
+
+    assert list(user.to_dict()) == [
+        "id", "created_at", "updated_at", "name", "email"]
+
+
+def test_serializer_keys_do_not_depend_on_load_state(app, task):
+    """Tests expired and loaded objects serialize to the same keys."""
+    loaded = task.to_dict()
+    db.session.expire(task)
+    expired = task.to_dict()
+
+    assert list(expired) == list(loaded)
+    assert expired == loaded
+    assert "completed_at" in expired
+    assert "password" not in expired
+
+
+def test_serializer_fields(task):
+    """Tests serializers can output a subset of the columns."""
+    serializer = get_serializer(Task, ["title", "id"])
+
+    assert serializer is get_serializer(Task, ["id", "title"])
+    assert serializer is not get_serializer(Task)
+    assert list(serializer(task)) == ["id", "title"]
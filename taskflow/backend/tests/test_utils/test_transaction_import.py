@@ -0,0 +1,80 @@
+"""Module that contains transaction import tests."""
+import io
+import pytest
+from datetime import date, timedelta
+from backend.models import Transaction
+from backend.utils.transaction_import import import_transactions
+
+HEADER = "title,description,amount,type,date,category\n"
+
+
+def make_csv(rows: int) -> io.StringIO:
+    """Returns a CSV stream of `rows` expenses."""
+    start = date(2025, 6, 1)
+    lines = [f"expense {i},,{i % 50 + 0.5},EXPENSE,"
+             f"{start + timedelta(days=i % 28)},FOOD\n"
+             for i in range(rows)]
+    return io.StringIO(HEADER + "".join(lines))
+
+
+def test_import_transactions(app, user):
+    """Tests every row is imported across several chunks."""
+    summary, errors = import_transactions(make_csv(5), user.id, chunk_size=2)
+
+    assert errors == []
+    assert summary["rows"] == 5
+    transactions = Transaction.query.filter_by(user_id=user.id).all()
+    assert len(transactions) == 5
+    assert transactions[0].description is None
+
+
+def test_import_transactions_reports_errors(app, user):
+    """Tests invalid rows are reported by row and nothing is kept."""
+    stream = io.StringIO(
+        HEADER
+        + "okay,,1,EXPENSE,2025-06-01,FOOD\n"
+        + "no,,1,EXPENSE,2025-06-01,FOOD\n"
+        + "okay,,1,SPENT,not-a-date,FOOD\n")
+    summary, errors = import_transactions(stream, user.id, chunk_size=2)
+
+    assert summary["rows"] == 0
+    assert [error["row"] for error in errors] == [2, 3]
+    assert set(errors[1]["errors"]) == {"type", "date"}
+    assert Transaction.query.count() == 0
+
+
+@pytest.mark.parametrize("bad_row", [
+    '"okay"x,,1,EXPENSE,2025-06-01,FOOD\n',
+    '"okay,,1,EXPENSE,2025-06-01,FOOD\n',
+])
+def test_import_transactions_reports_malformed_rows(app, user, bad_row):
+    """Tests malformed CSV is reported by row and nothing is kept."""
+    stream = io.StringIO(
+        HEADER
+        + "okay,,1,EXPENSE,2025-06-01,FOOD\n" * 2
+        + bad_row)
+    summary, errors = import_transactions(stream, user.id, chunk_size=2)
+
+    assert summary["rows"] == 0
+    assert [error["row"] for error in errors] == [3]
+    assert "Malformed CSV" in errors[0]["errors"]["_schema"][0]
+    assert Transaction.query.count() == 0
+
+
+@pytest.mark.parametrize("header, message", [
+    ("title,amount,type,date\n", "Missing columns: category"),
+    (HEADER.strip() + ",balance\n", "Unknown columns: balance"),
+])
+def test_import_transactions_checks_header(app, user, header, message):
+    """Tests a header with missing or unknown columns is rejected."""
+    with pytest.raises(ValueError, match=message):
+        import_transactions(io.StringIO(header), user.id)
+
+
+def test_large_import(app, user):
+    """Tests a 10,000 row import and its throughput summary."""
+    summary, errors = import_transactions(make_csv(10000), user.id)
+
+    assert errors == []
+    assert summary["rows"] == 10000
+    assert summary["rows_per_second"] > 0
@@ -0,0 +1,112 @@
+"""Module that contains unit of work utils tests."""
+from flask import abort
+from sqlalchemy import event
+from backend import db
+from backend.models import Note
+from backend.utils.db_helpers import bulk_delete
+from backend.utils.unit_of_work import (
+    CHANGES_KEY, _change_listeners, commit_or_flush, in_unit_of_work,
+    mark_changed, on_changes_committed)
+
+
+def add_note(user, title):
+    """Saves a note for the user."""
+    Note(
+        title=title,
+        content="test",
+        background_color="BLUE",
+        user_id=user.id
+    ).save()
+
+
+def test_outside_request_commits(app, monkeypatch):
+    """Tests commit_or_flush commits outside a request."""
+    calls = []
+    monkeypatch.setattr(db.session, "commit", lambda: calls.append(1))
+
+    assert not in_unit_of_work()
+    commit_or_flush()
+    assert calls == [1]
+
+
+def test_request_commits_once(app, client, user):
+    """Tests several saves in a request share one commit."""
+    @app.route("/uow/success")
+    def success():
+        assert in_unit_of_work()
+        add_note(user, "first")
+        add_note(user, "second")
+        return {"status": "success"}
+
+    commits = []
+
+    def on_commit(session):
+        commits.append(session)
+
+    event.listen(db.session, "after_commit", on_commit)
+    try:
+        response = client.get("/uow/success")
+    finally:
+        event.remove(db.session, "after_commit", on_commit)
+
+    assert response.status_code == 200
+    assert len(commits) == 1
+    assert Note.query.count() == 2
+
+
+def test_request_error_rolls_back(app, client, user):
+    """Tests staged changes are discarded when the request fails."""
+    @app.route("/uow/abort")
+    def aborted():
+        add_note(user, "first")
+        abort(400, description="Bad request")
+
+    @app.route("/uow/raise")
+    def raised():
+        add_note(user, "second")
+        raise RuntimeError("boom")
+
+    assert client.get("/uow/abort").status_code == 400
+    assert client.get("/uow/raise").status_code == 500
+    assert Note.query.count() == 0
+
+
+def test_commit_failure_returns_500(app, client, user, monkeypatch):
+    """Tests a failing commit turns the response into an error."""
+    @app.route("/uow/commit")
+    def commit():
+        add_note(user, "first")
+        monkeypatch.setattr(db.session, "commit", fail_commit)
+        return {"status": "success"}
+
+    def fail_commit():
+        raise Exception("DB commit failed")
+
+    response = client.get("/uow/commit")
+
+    assert response.status_code == 500
+    assert response.get_json()["message"] == "Internal server error"
+
+
+def test_committed_changes_reach_listeners(app, user):
+    """Tests listeners get the collections changed by a commit."""
+    received = []
+    on_changes_committed(received.append)
+    try:
+        add_note(user, "first")
+        bulk_delete(Note, user_id=user.id)
+    finally:
+        _change_listeners.remove(received.append)
+
+    assert received == [
+        {("notes", user.id)},
+        {("notes", user.id), ("tombstones", user.id)},
+    ]
+
+
+def test_rolled_back_changes_are_discarded(app, user):
+    """Tests a rollback forgets the changes of its transaction."""
+    mark_changed("notes", user.id)
+    db.session.rollback()
+
+    assert CHANGES_KEY not in db.session.info
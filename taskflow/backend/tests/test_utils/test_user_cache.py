@@ -0,0 +1,101 @@
+"""Module that contains user cache utils tests."""
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm.exc import DetachedInstanceError
+from backend import db
+from backend.extensions import user_cache
+from backend.models import User
+
+
+@pytest.fixture
+def statements(app):
+    """Collects the SQL statements executed during a test."""
+    executed = []
+
+    def on_execute(conn, cursor, statement, *args):
+        executed.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", on_execute)
+    yield executed
+    event.remove(db.engine, "before_cursor_execute", on_execute)
+
+
+def test_load_caches_user(user, statements):
+    """Tests only the first load queries the database."""
+    user_id = user.id
+    db.session.expunge_all()
+    first = user_cache.load(User, user_id)
+    second = user_cache.load(User, user_id)
+
+    assert len(statements) == 1
+    assert first is not second
+    assert second.id == user_id
+    assert second.email == "testemail@example.com"
+
+
+def test_cached_user_is_detached(user, statements):
+    """Tests cached users are readable without lazy loads."""
+    user_cache.load(User, user.id)
+    statements.clear()
+    cached = user_cache.load(User, user.id)
+
+    assert cached not in db.session
+    assert (cached.id, cached.name) == (user.id, "testuser")
+    assert cached.is_authenticated
+    assert statements == []
+    with pytest.raises(DetachedInstanceError):
+        cached.tasks
+
+
+def test_load_missing_user(app):
+    """Tests loading a missing user returns None."""
+    assert user_cache.load(User, "missing") is None
+
+
+def test_user_update_invalidates(user):
+    """Tests saving or deleting a user drops it from the cache."""
+    user_cache.load(User, user.id)
+    user.name = "renamed"
+    user.save()
+
+    assert user_cache.load(User, user.id).name == "renamed"
+
+    user.delete()
+    assert user_cache.load(User, user.id) is None
+
+
+class FakeRedis():
+    """In-memory stand-in for the Redis client methods the cache uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+def test_redis_tier(user, statements, monkeypatch):
+    """Tests users are shared through Redis when it is configured."""
+    monkeypatch.setattr(user_cache, "redis", FakeRedis())
+    user_id = user.id
+    created_at = user.created_at
+    db.session.expunge_all()
+
+    user_cache.load(User, user_id)
+    user_cache.local.clear()
+    statements.clear()
+    cached = user_cache.load(User, user_id)
+
+    assert statements == []
+    assert cached.created_at == created_at
+    assert "password" not in user_cache.redis.get(
+        user_cache.key_prefix + user_id)
+
+    user_cache.invalidate(user_id)
+    assert user_cache.redis.data == {}
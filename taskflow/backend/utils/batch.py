@@ -0,0 +1,175 @@
+"""Module that contains the batch operations helper."""
+from datetime import datetime, timezone
+from typing import Callable
+from flask import abort, current_app, request
+from flask_login import current_user
+from marshmallow import Schema, ValidationError
+from backend import db
+from .db_helpers import check_model, sanitize_input
+from .unit_of_work import commit_or_flush
+
+OPERATIONS = ("create", "update", "delete")
+MAX_BATCH_SIZE = 500
+
+
+def validate_operations(operations: object) -> list[dict]:
+    """
+    Checks the shape of a batch request.
+
+    Args:
+        operations (object): The JSON body, a list of operations like
+            {"op": "update", "id": "...", "data": {...}}.
+
+    Returns:
+        list[dict]: The operations.
+    """
+    limit = current_app.config.get("BATCH_MAX_SIZE", MAX_BATCH_SIZE)
+    if not isinstance(operations, list) or not operations:
+        abort(400, description="Expected a non-empty list of operations")
+    if len(operations) > limit:
+        abort(400, description=f"A batch can have at most {limit} operations")
+    return operations
+
+
+def check_operation(operation: object, seen_ids: set) -> dict | None:
+    """Returns the shape errors of one operation, None if it is valid."""
+    if not isinstance(operation, dict):
+        return {"_schema": ["Operation must be an object."]}
+    op = operation.get("op")
+    if op not in OPERATIONS:
+        return {"op": [f"Must be one of: {', '.join(OPERATIONS)}."]}
+    if op != "delete" and not isinstance(operation.get("data"), dict):
+        return {"data": ["Missing data."]}
+    if op == "create":
+        return None
+
+    obj_id = operation.get("id")
+    if not isinstance(obj_id, str) or not obj_id:
+        return {"id": ["Missing id."]}
+    if obj_id in seen_ids:
+        return {"id": ["Object appears more than once in the batch."]}
+    seen_ids.add(obj_id)
+    return None
+
+
+def apply_batch(
+    model: type,
+    keys: list[str],
+    schema: Schema,
+    operations: list = None,
+    snapshot: Callable[[object], object] = None,
+    on_change: Callable[[object, object], None] = None
+) -> tuple[list[dict], bool]:
+    """
+    Validates and applies a batch of create, update and delete operations.
+
+    Every operation is validated with the resource's schema first. If any
+    fails, nothing is applied. Otherwise the changes are written with a
+    single flush, so inserts, updates and deletes go out as executemany
+    statements inside the request's transaction.
+
+    Args:
+        model (type): The model class the operations apply to.
+        keys (list[str]): The writable fields of the model.
+        schema (Schema): The schema to validate the data with.
+        operations (list): The operations, defaults to the request's JSON.
+        snapshot (Callable): Returns the state `on_change` needs from an
+            object, called before and after each change.
+        on_change (Callable): Called after the flush with the old and new
+            snapshot of each changed object, None for a created or
+            deleted side.
+
+    Returns:
+        tuple[list[dict], bool]: The per-operation results and whether the
+            batch was applied.
+    """
+    check_model(model)
+    if operations is None:
+        operations = request.get_json(silent=True)
+    operations = validate_operations(operations)
+
+    seen_ids = set()
+    results = []
+    for index, operation in enumerate(operations):
+        errors = check_operation(operation, seen_ids)
+        results.append({"index": index,
+                        "op": operation.get("op")
+                        if isinstance(operation, dict) else None,
+                        "id": operation.get("id")
+                        if isinstance(operation, dict) else None,
+                        "errors": errors})
+
+    ids = [result["id"] for result in results
+           if result["errors"] is None and result["op"] != "create"]
+    objects = {}
+    if ids:
+        objects = {obj.id: obj for obj in model.query.filter(
+            model.id.in_(ids), model.user_id == current_user.id)}
+
+    planned = []
+    for result, operation in zip(results, operations):
+        if result["errors"] is not None:
+            continue
+        op = result["op"]
+        obj = objects.get(result["id"])
+        if op != "create" and obj is None:
+            result["errors"] = {"id": ["Object not found or unauthorized."]}
+            continue
+        if op == "delete":
+            planned.append((result, obj, None))
+            continue
+        try:
+            data = schema.load(operation["data"], partial=op == "update")
+        except ValidationError as e:
+            result["errors"] = e.messages
+            continue
+        fields = [key for key in keys if key in data]
+        planned.append((result, obj, sanitize_input(data, fields)))
+
+    if any(result["errors"] is not None for result in results):
+        return finish(results, applied=False), False
+
+    now = datetime.now(timezone.utc)
+    changes = []
+    try:
+        for result, obj, data in planned:
+            op = result["op"]
+            old = snapshot(obj) if snapshot and obj is not None else None
+            if op == "create":
+                obj = model(**data, user_id=current_user.id)
+                db.session.add(obj)
+                result["id"] = obj.id
+            elif op == "update":
+                for key, value in data.items():
+                    setattr(obj, key, value)
+                obj.updated_at = now
+            else:
+                db.session.delete(obj)
+            new = snapshot(obj) if snapshot and op != "delete" else None
+            changes.append((result, obj, old, new))
+    except ValueError as e:
+        db.session.rollback()
+        result["errors"] = {"_schema": [str(e)]}
+        return finish(results, applied=False), False
+
+    commit_or_flush()
+    for result, obj, old, new in changes:
+        if on_change:
+            on_change(old, new)
+        if result["op"] != "delete":
+            result["data"] = obj.to_dict()
+    return finish(results, applied=True), True
+
+
+def finish(results: list[dict], applied: bool) -> list[dict]:
+    """Sets the status of each result and drops empty error entries."""
+    for result in results:
+        errors = result.pop("errors")
+        if applied:
+            result["status"] = f"{result['op']}d"
+        elif errors is None:
+            result["status"] = "skipped"
+        else:
+            result["status"] = "error"
+            result["errors"] = errors
+    return results
@@ -0,0 +1,7 @@
+"""Module that contains date helpers."""
+from datetime import date, datetime, timezone
+
+
+def utc_today() -> date:
+    """Returns the current date in UTC."""
+    return datetime.now(timezone.utc).date()
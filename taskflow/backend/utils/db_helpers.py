@@ -2,14 +2,25 @@
 from flask import abort, request
 from flask_login import current_user
 from backend import db
-from backend.models import Task, Habit, Budget, Transaction, Note
+from backend.models import (Task, Habit, HabitCompletion, Budget, Transaction,
+                            Note, Tombstone)
+from backend.utils.logger import logger
+from backend.utils.unit_of_work import commit_or_flush, mark_changed
 import bleach
+import re
 from marshmallow import Schema
+from datetime import datetime
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import load_only
+
+# Characters bleach escapes or replaces. Strings without any are returned
+# unchanged by bleach.clean, so parsing them can be skipped.
+UNSAFE_CHARACTERS = re.compile(r"[<>&\x00-\x08\x0b-\x1f]")
 
 
 def check_model(model: type):
     """Checks if the model is available."""
-    Models = [Task, Habit, Budget, Transaction, Note]
+    Models = [Task, Habit, HabitCompletion, Budget, Transaction, Note]
     if model not in Models:
         abort(404, "This model is unavailable.")
 
@@ -28,7 +39,7 @@ def sanitize_input(data: dict, keys: list[str]) -> dict:
     sanitized = {}
     for key in keys:
         value = data.get(key)
-        if isinstance(value, str):
+        if isinstance(value, str) and UNSAFE_CHARACTERS.search(value):
             sanitized[key] = bleach.clean(value)
         else:
             sanitized[key] = value
@@ -36,21 +47,30 @@ def sanitize_input(data: dict, keys: list[str]) -> dict:
     return sanitized
 
 
-def get_object(model: type, obj_id: str) -> object:
+def get_object(model: type, obj_id: str, columns: list[str] = None) -> object:
     """
     Retrieves an object by ID and ensures it belongs to the current user.
 
+    Ownership is checked by the query itself, which filters on both the
+    object ID and the current user's ID.
+
     Args:
         model (type): The model class to query.
         obj_id (str): The ID of the object to retrieve.
+        columns (list[str]): Only load these columns, all if None. Other
+            columns are loaded on first access.
 
     Returns:
         object: The authorized object instance.
     """
     check_model(model)
-    obj = db.session.get(model, obj_id)
+    query = model.query.filter_by(id=obj_id, user_id=current_user.id)
+    if columns:
+        query = query.options(
+            load_only(*[getattr(model, column) for column in columns]))
+    obj = query.first()
 
-    if not obj or obj.user_id != current_user.id:
+    if not obj:
         abort(404, "object not found or unauthorized")
 
     return obj
@@ -121,13 +141,78 @@ def edit_object(
     if schema:
         from marshmallow import ValidationError
         try:
-            schema.load(data, partial=True)
+            data = schema.load(data, partial=True)
         except ValidationError as e:
             abort(400, {"status": "error",
                         "message": "Validation failed", "data": e.messages})
 
+    keys = [key for key in keys if key in data]
     data = sanitize_input(data, keys)
     for key in keys:
-        if key in data:
-            setattr(obj, key, data[key])
+        setattr(obj, key, data[key])
     return obj
+
+
+def bulk_delete(model: type, *criteria: object, user_id: str = None) -> int:
+    """
+    Deletes the user's objects matching the criteria in one statement.
+
+    The deleted IDs are returned by the DELETE itself and recorded as
+    tombstones for delta sync.
+
+    Args:
+        model (type): The model class to delete from.
+        *criteria (object): SQL expressions the deleted rows must match.
+        user_id (str): The owner of the rows, defaults to the current user.
+
+    Returns:
+        int: The number of deleted rows.
+    """
+    check_model(model)
+    user_id = user_id or current_user.id
+    statement = delete(model).where(
+        model.user_id == user_id, *criteria).returning(model.id)
+
+    try:
+        deleted_ids = db.session.execute(statement).scalars().all()
+        Tombstone.record(model.__tablename__, user_id, deleted_ids)
+        if deleted_ids:
+            mark_changed(model.__tablename__, user_id)
+        commit_or_flush()
+        return len(deleted_ids)
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"[{model.__name__}] Bulk delete failed: "
+                     f"{str(e.orig) if hasattr(e, 'orig') else e}")
+        raise
+
+
+def collection_version(model: type, user_id: str) -> tuple[datetime, int]:
+    """
+    Returns a cheap version of a user's collection of objects.
+
+    Any create or update moves the latest `updated_at`, and any delete
+    changes the count and leaves a newer tombstone. The three values are
+    read with one aggregate query over the per-user updated_at index.
+
+    Args:
+        model (type): The model class of the collection.
+        user_id (str): The owner of the collection.
+
+    Returns:
+        tuple[datetime, int]: The time of the last change, None for a
+            collection that never had objects, and the number of objects.
+    """
+    check_model(model)
+    last_deleted = select(func.max(Tombstone.updated_at)).where(
+        Tombstone.user_id == user_id,
+        Tombstone.resource == model.__tablename__
+    ).scalar_subquery()
+    last_updated, count, last_deleted = db.session.execute(
+        select(func.max(model.updated_at), func.count(), last_deleted)
+        .where(model.user_id == user_id)
+    ).one()
+
+    last_modified = max(filter(None, (last_updated, last_deleted)),
+                        default=None)
+    return last_modified, count
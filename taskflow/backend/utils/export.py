@@ -0,0 +1,93 @@
+"""Module that contains the streaming export helpers."""
+import csv
+import io
+import zlib
+from typing import Callable, Iterable, Iterator
+from sqlalchemy import select
+from ..extensions import db
+from .serializers import get_serializer, public_fields
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+CHUNK_SIZE = 64 * 1024
+
+
+def export_rows(models: list[type], user_id: str,
+                batch_size: int = 1000) -> Iterator[tuple[str, dict]]:
+    """
+    Yields every object of a user as (table name, serialized dict) pairs.
+
+    Rows are fetched `batch_size` at a time with `yield_per`, which streams
+    them from a server-side cursor where the driver supports one, so only
+    one batch is held in memory at a time. Rows are ordered on the
+    (user_id, updated_at) index every exported table has.
+
+    Args:
+        models (list[type]): The models to export, in order.
+        user_id (str): The id of the user.
+        batch_size (int): The number of rows fetched per round trip.
+    """
+    for model in models:
+        serialize = get_serializer(model)
+        statement = select(model).where(
+            model.user_id == user_id
+        ).order_by(model.updated_at, model.id).execution_options(
+            yield_per=batch_size)
+        for obj in db.session.scalars(statement):
+            yield model.__tablename__, serialize(obj)
+
+
+def ndjson_lines(rows: Iterable[tuple[str, dict]],
+                 dumps: Callable[[object], str]) -> Iterator[str]:
+    """Yields one JSON line per row, tagged with its resource."""
+    for resource, data in rows:
+        yield dumps({"resource": resource, "data": data}) + "\n"
+
+
+def csv_lines(rows: Iterable[tuple[str, dict]],
+              models: list[type]) -> Iterator[str]:
+    """
+    Yields the rows as CSV lines under a single header.
+
+    The header is a resource column followed by the fields of every model,
+    so each row leaves the fields of the other models empty.
+    """
+    fields = list(dict.fromkeys(
+        field for model in models for field in public_fields(model)))
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=["resource", *fields])
+
+    writer.writeheader()
+    for resource, data in rows:
+        writer.writerow({"resource": resource, **data})
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+def chunked(lines: Iterable[str], size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Joins lines into encoded chunks of about `size` bytes."""
+    chunk = []
+    length = 0
+    for line in lines:
+        chunk.append(line)
+        length += len(line)
+        if length >= size:
+            yield "".join(chunk).encode()
+            chunk = []
+            length = 0
+    if chunk:
+        yield "".join(chunk).encode()
+
+
+def gzipped(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Compresses a stream of chunks into a gzip stream on the fly."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,46 @@
+"""Module that contains sparse fieldset helpers."""
+from flask import abort
+from sqlalchemy.orm import Query, load_only
+from .serializers import public_fields
+
+
+def parse_fields(model: type, value: str | None) -> list[str] | None:
+    """
+    Parses a comma separated list of fields of a model.
+
+    Args:
+        model (type): The model the fields belong to.
+        value (str | None): The requested fields, like 'id,title'.
+
+    Returns:
+        list[str] | None: The fields, None when none were requested.
+    """
+    if not value:
+        return None
+
+    fields = list(dict.fromkeys(
+        field.strip() for field in value.split(",") if field.strip()))
+    unknown = [field for field in fields
+               if field not in public_fields(model)]
+    if unknown:
+        abort(400, description=f"Unknown fields: {', '.join(unknown)}")
+    return fields or None
+
+
+def load_fields(query: Query, model: type,
+                fields: list[str] | None) -> Query:
+    """
+    Limits a query's SELECT to the given fields of its model.
+
+    Args:
+        query (Query): The query to limit.
+        model (type): The model the query loads.
+        fields (list[str] | None): The fields to load, all if None.
+
+    Returns:
+        Query: The query, loading only the fields and the primary key.
+    """
+    if not fields:
+        return query
+    return query.options(
+        load_only(*[getattr(model, field) for field in fields]))
@@ -0,0 +1,47 @@
+"""
+Module that contains the habit heatmap encodings.
+
+A heatmap row is a bitset over a window of days, where bit i is set when
+the habit was completed on the i-th day of the window. Rows are sent either
+as a base64 bitmap or as run lengths, whichever suits the client.
+"""
+from base64 import b64encode
+from itertools import groupby
+
+
+def encode_bitset(bits: int, days: int) -> str:
+    """
+    Encodes a bitset as base64, one bit per day.
+
+    Args:
+        bits (int): The bitset, bit i standing for day i of the window.
+        days (int): The number of days in the window.
+
+    Returns:
+        str: The base64 of the little-endian bytes, so day i is bit
+            `i % 8` of byte `i // 8`.
+    """
+    return b64encode(bits.to_bytes((days + 7) // 8, "little")).decode()
+
+
+def encode_runs(bits: int, days: int) -> list[int]:
+    """
+    Encodes a bitset as run lengths.
+
+    Args:
+        bits (int): The bitset, bit i standing for day i of the window.
+        days (int): The number of days in the window.
+
+    Returns:
+        list[int]: The lengths of alternating runs of missed and completed
+            days, starting with missed days, so the first run may be 0.
+    """
+    flags = format(bits, f"0{days}b")[::-1]
+    runs = [len(list(run)) for _, run in groupby(flags)]
+    return runs if flags.startswith("0") else [0] + runs
+
+
+HEATMAP_ENCODINGS = {
+    "bitset": encode_bitset,
+    "rle": encode_runs,
+}
@@ -0,0 +1,77 @@
+"""Module that contains the JSON provider."""
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+from .serializers import format_datetime, format_date
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def default(value: Any) -> Any:
+    """
+    Encodes values the JSON encoders do not handle natively.
+
+    Datetimes, dates and enum members use the same formats as `to_dict`,
+    so enums are encoded by name like `format_enum` does. orjson encodes
+    enum members natively, by value, without calling this, so responses
+    should hold enums already formatted by `to_dict` or `format_enum`.
+    """
+    if isinstance(value, datetime):
+        return format_datetime(value)
+    if isinstance(value, date):
+        return format_date(value)
+    if isinstance(value, Enum):
+        return value.name
+    return DefaultJSONProvider.default(value)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that uses orjson when it is installed.
+
+    Falls back to the standard library encoder when orjson is missing or
+    when a caller passes options only `json.dumps` understands.
+    """
+    default = staticmethod(default)
+
+    @property
+    def fast(self) -> bool:
+        """Returns True when the fast encoder is available."""
+        return orjson is not None
+
+    def encode(self, obj: Any, indent: bool = False) -> bytes:
+        """Encodes an object to UTF-8 JSON bytes with orjson."""
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serializes data as a JSON string."""
+        if not self.fast or set(kwargs) - {"indent", "separators"}:
+            return super().dumps(obj, **kwargs)
+        return self.encode(obj, indent=bool(kwargs.get("indent"))).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserializes data from a JSON string or bytes."""
+        if not self.fast or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Serializes the arguments into a JSON `Response`."""
+        if not self.fast:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) \
+            or self.compact is False
+        return self._app.response_class(
+            self.encode(obj, indent=indent) + b"\n", mimetype=self.mimetype)
@@ -0,0 +1,118 @@
+"""Module that contains pagination utils."""
+import base64
+import json
+from datetime import date, datetime
+from flask import abort, request
+from sqlalchemy import Date, DateTime, tuple_
+from sqlalchemy.orm import Query
+from .fields import load_fields, parse_fields
+from .serializers import get_serializer
+
+
+def encode_cursor(values: list) -> str:
+    """
+    Encodes the sort key of the last row of a page into an opaque cursor.
+
+    Args:
+        values (list): The sort key values of the last row.
+
+    Returns:
+        str: A URL-safe cursor string.
+    """
+    raw = [v.isoformat() if isinstance(v, (date, datetime)) else v
+           for v in values]
+    payload = json.dumps(raw, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: list) -> list:
+    """
+    Decodes a cursor back into typed sort key values.
+
+    Args:
+        cursor (str): The cursor produced by `encode_cursor`.
+        columns (list): The columns the cursor was built from.
+
+    Returns:
+        list: The sort key values, converted to the columns' Python types.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(raw, list) or len(raw) != len(columns):
+            raise ValueError("cursor does not match the sort key")
+
+        values = []
+        for column, value in zip(columns, raw):
+            if isinstance(column.type, DateTime):
+                value = datetime.fromisoformat(value)
+            elif isinstance(column.type, Date):
+                value = date.fromisoformat(value)
+            values.append(value)
+        return values
+    except (ValueError, TypeError):
+        abort(400, description="Invalid cursor")
+
+
+def paginate(query: Query, order_by: list, items_key: str) -> dict:
+    """
+    Paginates a query using the request's pagination arguments.
+
+    Offset pagination (`?page=`) is used by default. Passing `?cursor=`
+    (empty for the first page) switches to keyset pagination on the
+    `order_by` columns, which are sorted in descending order and must end
+    with a unique column. Keyset pages skip the total count.
+
+    `?fields=` limits both the selected columns and the serialized output
+    to the given fields of the query's model.
+
+    Args:
+        query (Query): The filtered query to paginate.
+        order_by (list): The sort key columns, most significant first.
+        items_key (str): The key the serialized items are returned under.
+
+    Returns:
+        dict: The page of serialized items and its pagination metadata.
+    """
+    per_page = request.args.get("per_page", 12, type=int)
+    model = query.column_descriptions[0]["entity"]
+    fields = parse_fields(model, request.args.get("fields"))
+    serialize = get_serializer(model, fields)
+    if fields:
+        query = load_fields(
+            query, model, fields + [column.key for column in order_by])
+    query = query.order_by(*[column.desc() for column in order_by])
+
+    if "cursor" not in request.args:
+        page = request.args.get("page", 1, type=int)
+        pagination = query.paginate(page=page, per_page=per_page,
+                                    error_out=False)
+        return {
+            items_key: [serialize(item) for item in pagination.items],
+            "total": pagination.total,
+            "pages": pagination.pages,
+            "current_page": pagination.page,
+            "per_page": pagination.per_page
+        }
+
+    per_page = max(per_page, 1)
+    cursor = request.args.get("cursor")
+    if cursor:
+        values = decode_cursor(cursor, order_by)
+        query = query.filter(tuple_(*order_by) < tuple_(*values))
+
+    items = query.limit(per_page + 1).all()
+    has_more = len(items) > per_page
+    items = items[:per_page]
+
+    next_cursor = None
+    if has_more:
+        last = items[-1]
+        next_cursor = encode_cursor(
+            [getattr(last, column.key) for column in order_by])
+
+    return {
+        items_key: [serialize(item) for item in items],
+        "next_cursor": next_cursor,
+        "per_page": per_page
+    }
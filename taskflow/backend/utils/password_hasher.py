@@ -0,0 +1,129 @@
+"""Module that contains the password hasher."""
+import os
+import time
+from threading import BoundedSemaphore, Lock
+from typing import Callable
+from flask import Flask, current_app
+from flask_bcrypt import Bcrypt
+
+
+class PasswordHasher():
+    """
+    Runs bcrypt hashing and verification with bounded concurrency.
+
+    bcrypt releases the GIL while it hashes, so a semaphore caps how many
+    hashes run at once instead of letting every request thread compete
+    for the CPU. Hashes run on the calling thread, which would wait for
+    the result anyway. Other requests keep being served while logins wait
+    for a free slot. Queue depth and hash latency are tracked in `stats`.
+    """
+
+    def __init__(self, bcrypt: Bcrypt) -> None:
+        """
+        Creates a hasher that is configured by `init_app`.
+
+        Args:
+            bcrypt (Bcrypt): The extension holding the bcrypt settings.
+        """
+        self.bcrypt = bcrypt
+        self.pool_size = os.cpu_count() or 1
+        self.slots = None
+        self._lock = Lock()
+        self._reset_stats()
+
+    def init_app(self, app: Flask) -> None:
+        """Sizes the concurrency limit from the app config."""
+        self.pool_size = app.config.get("BCRYPT_POOL_SIZE") \
+            or os.cpu_count() or 1
+        self.slots = BoundedSemaphore(self.pool_size)
+        self._reset_stats()
+
+    def hash(self, password: str) -> str:
+        """Returns the bcrypt hash of a password."""
+        return self._run(
+            self.bcrypt.generate_password_hash, password).decode("utf-8")
+
+    def check(self, pw_hash: str, password: str) -> bool:
+        """Returns True if the password matches the hash."""
+        return self._run(self.bcrypt.check_password_hash, pw_hash, password)
+
+    @property
+    def rounds(self) -> int:
+        """Returns the bcrypt cost new hashes are made with."""
+        return current_app.config.get("BCRYPT_LOG_ROUNDS", 12)
+
+    def needs_rehash(self, pw_hash: str) -> bool:
+        """
+        Checks if a hash was made with another cost or algorithm version.
+
+        Args:
+            pw_hash (str): A bcrypt hash, like '$2b$12$<salt and digest>'.
+
+        Returns:
+            bool: True if the hash should be replaced with a new one.
+        """
+        try:
+            _, prefix, cost, _ = pw_hash.split("$")
+            return int(cost) != self.rounds or \
+                prefix != current_app.config.get("BCRYPT_HASH_PREFIX", "2b")
+        except (AttributeError, ValueError):
+            return True
+
+    def stats(self) -> dict:
+        """
+        Returns the hashing metrics.
+
+        Returns:
+            dict: Concurrency limit, hashes queued and running, completed
+                hashes, and the mean and max seconds spent waiting and
+                hashing.
+        """
+        with self._lock:
+            count = self._completed
+            return {
+                "pool_size": self.pool_size,
+                "queued": self._queued,
+                "running": self._running,
+                "completed": count,
+                "mean_wait": self._wait_total / count if count else 0.0,
+                "max_wait": self._wait_max,
+                "mean_latency": self._hash_total / count if count else 0.0,
+                "max_latency": self._hash_max,
+            }
+
+    def _run(self, func: Callable, *args) -> object:
+        """Runs a bcrypt call once a slot is free, recording its timings."""
+        if self.slots is None:
+            return func(*args)
+        submitted_at = time.perf_counter()
+        with self._lock:
+            self._queued += 1
+        with self.slots:
+            started_at = time.perf_counter()
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+            try:
+                return func(*args)
+            finally:
+                finished_at = time.perf_counter()
+                wait = started_at - submitted_at
+                latency = finished_at - started_at
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+                    self._wait_total += wait
+                    self._wait_max = max(self._wait_max, wait)
+                    self._hash_total += latency
+                    self._hash_max = max(self._hash_max, latency)
+
+    def _reset_stats(self) -> None:
+        """Clears the recorded metrics."""
+        with self._lock:
+            self._queued = 0
+            self._running = 0
+            self._completed = 0
+            self._wait_total = 0.0
+            self._wait_max = 0.0
+            self._hash_total = 0.0
+            self._hash_max = 0.0
@@ -0,0 +1,124 @@
+"""Module that contains the response cache."""
+import time
+from typing import Iterable
+from flask import Flask
+from redis import exceptions as redis_exceptions
+from .cache import LRUCache
+from .logger import logger
+
+
+class ResponseCache():
+    """
+    Read-through cache of rendered JSON responses.
+
+    Entries are keyed by user, collection version and request, and kept
+    in Redis when configured, or in an in-process LRU otherwise. Entries
+    rendered before a committed write are never read again and expire
+    with their TTL, since the write changes the collection's version.
+
+    With Redis, each (collection, user) pair has a version counter shared
+    by every worker, and bumped after each commit. Without it, versions
+    are read from the database with `collection_version`, so a worker sees
+    the writes committed by the others.
+    """
+
+    def __init__(self) -> None:
+        """Creates a cache that is configured by `init_app`."""
+        self.local = LRUCache()
+        self.redis = None
+        self.ttl = 60
+        self.key_prefix = "taskflow:response:"
+
+    def init_app(self, app: Flask) -> None:
+        """Configures the cache from the app config."""
+        from .unit_of_work import on_changes_committed
+        self.ttl = app.config.get("RESPONSE_CACHE_TTL", 60)
+        self.local = LRUCache(
+            maxsize=app.config.get("RESPONSE_CACHE_SIZE", 1024),
+            ttl=self.ttl)
+        self.redis = app.config.get("RESPONSE_CACHE_REDIS")
+        on_changes_committed(self.invalidate)
+
+    def get(self, model: type, user_id: str,
+            request_key: str) -> tuple[str | None, bytes | None]:
+        """
+        Looks up a cached response.
+
+        Args:
+            model (type): The model class of the collection.
+            user_id (str): The user the response belongs to.
+            request_key (str): The path and query string of the request.
+
+        Returns:
+            tuple[str | None, bytes | None]: The entry key, to store a
+                response under on a miss, and the cached body, if any. The
+                key is None when the cache is unavailable.
+        """
+        version = self.version(model, user_id)
+        if version is None:
+            return None, None
+        key = (f"{self.key_prefix}{user_id}:{model.__tablename__}:{version}:"
+               f"{request_key}")
+        if self.redis is not None:
+            try:
+                return key, self.redis.get(key)
+            except redis_exceptions.RedisError as e:
+                logger.warning(f"Response cache read failed: {e}")
+                return key, None
+        return key, self.local.get(key)
+
+    def set(self, key: str | None, body: bytes) -> None:
+        """Caches a response body under a key returned by `get`."""
+        if key is None:
+            return
+        if self.redis is not None:
+            try:
+                self.redis.setex(key, self.ttl, body)
+            except redis_exceptions.RedisError as e:
+                logger.warning(f"Response cache write failed: {e}")
+            return
+        self.local.set(key, body)
+
+    def version(self, model: type, user_id: str) -> str | None:
+        """
+        Returns the version of a user's collection, None if unavailable.
+
+        A missing Redis counter starts at the current time in nanoseconds,
+        so a version lost to an eviction or restart never repeats an old
+        one.
+        """
+        if self.redis is None:
+            from .db_helpers import collection_version
+            last_modified, count = collection_version(model, user_id)
+            return f"{last_modified}:{count}"
+        key = f"{self.key_prefix}version:{user_id}:{model.__tablename__}"
+        try:
+            version = self.redis.get(key)
+            if version is None:
+                self.redis.set(key, time.time_ns(), nx=True)
+                version = self.redis.get(key)
+            return str(int(version))
+        except redis_exceptions.RedisError as e:
+            logger.warning(f"Response cache version read failed: {e}")
+            return None
+
+    def invalidate(self, changes: Iterable[tuple[str, str]]) -> None:
+        """
+        Bumps the Redis versions of changed collections.
+
+        Database versions change with the rows, so there is nothing to do
+        without Redis.
+
+        Args:
+            changes (Iterable[tuple[str, str]]): The (table name, user id)
+                pairs changed by a committed transaction.
+        """
+        if self.redis is None:
+            return
+        try:
+            pipeline = self.redis.pipeline()
+            for resource, user_id in changes:
+                pipeline.incr(f"{self.key_prefix}version:{user_id}:{resource}")
+            pipeline.execute()
+        except redis_exceptions.RedisError as e:
+            logger.warning(f"Response cache invalidation failed: {e}")
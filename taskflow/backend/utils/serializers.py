@@ -0,0 +1,102 @@
+"""Module that contains the model serializers."""
+from datetime import date, datetime
+from enum import Enum
+from typing import Callable
+from sqlalchemy import Date, DateTime, Enum as SqlEnum, inspect
+
+LEADING_FIELDS = ("id", "created_at", "updated_at")
+
+_serializers: dict[tuple, Callable[[object], dict]] = {}
+
+
+def format_datetime(value: datetime) -> str:
+    """Formats a datetime as 'YYYY-MM-DD HH:MM:SS', ignoring its timezone."""
+    if value.tzinfo is not None:
+        value = value.replace(tzinfo=None)
+    return value.isoformat(" ", "seconds")
+
+
+def format_date(value: date) -> str:
+    """Formats a date as 'YYYY-MM-DD'."""
+    return value.isoformat()
+
+
+def format_enum(value: Enum | str) -> str:
+    """Returns an enum's name, or the name itself before it is loaded."""
+    return value.name if isinstance(value, Enum) else value
+
+
+def column_converter(column_type: object) -> Callable | None:
+    """Returns the converter for values of a column type, if any."""
+    if isinstance(column_type, DateTime):
+        return format_datetime
+    if isinstance(column_type, Date):
+        return format_date
+    if isinstance(column_type, SqlEnum):
+        return format_enum
+    return None
+
+
+def public_fields(model: type) -> list[str]:
+    """Returns the names of a model's serialized columns."""
+    return [attr.key for attr in inspect(model).column_attrs
+            if not attr.key.startswith("_")]
+
+
+def build_serializer(
+    model: type,
+    fields: tuple[str, ...] = None
+) -> Callable[[object], dict]:
+    """
+    Builds a serializer for a model from its column metadata.
+
+    Private columns (prefixed with '_', such as the password hash) are
+    skipped. The output has every other column, or only `fields` when
+    given, in a fixed order: id and timestamps first, then the model's
+    columns as declared.
+
+    Args:
+        model (type): The mapped model class.
+        fields (tuple[str, ...]): The columns to output, all if None.
+
+    Returns:
+        Callable: A function that turns an instance into a dict.
+    """
+    attrs = [attr for attr in inspect(model).column_attrs
+             if not attr.key.startswith("_")
+             and (fields is None or attr.key in fields)]
+    attrs.sort(key=lambda attr: (
+        LEADING_FIELDS.index(attr.key) if attr.key in LEADING_FIELDS
+        else len(LEADING_FIELDS)))
+    fields = tuple((attr.key, column_converter(attr.columns[0].type))
+                   for attr in attrs)
+
+    def serialize(obj: object) -> dict:
+        state = obj.__dict__
+        data = {}
+        for key, convert in fields:
+            value = state[key] if key in state else getattr(obj, key)
+            if value is not None and convert is not None:
+                value = convert(value)
+            data[key] = value
+        return data
+
+    return serialize
+
+
+def get_serializer(
+    model: type,
+    fields: list[str] = None
+) -> Callable[[object], dict]:
+    """
+    Returns the serializer of a model, building it on first use.
+
+    Args:
+        model (type): The mapped model class.
+        fields (list[str]): The columns to output, all if None.
+    """
+    key = (model, tuple(sorted(fields)) if fields else None)
+    serializer = _serializers.get(key)
+    if serializer is None:
+        serializer = _serializers[key] = build_serializer(model, key[1])
+    return serializer
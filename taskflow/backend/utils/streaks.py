@@ -0,0 +1,18 @@
+"""Module that contains the streak reset run before reads."""
+from flask_login import current_user
+from backend import db
+from ..models.habit import Habit
+
+
+def reset_current_user_streaks() -> None:
+    """
+    Resets the current user's broken streaks before a route reads them.
+
+    Registered as a `before_request` hook on the blueprints that serve
+    habits. A reset is committed right away, so the cached responses and
+    dashboard stats it invalidates are refreshed before the route runs.
+    """
+    if not current_user.is_authenticated:
+        return
+    if Habit.reset_broken_streaks(current_user.id):
+        db.session.commit()
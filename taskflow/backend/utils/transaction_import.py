@@ -0,0 +1,158 @@
+"""Module that contains the CSV transaction import."""
+import csv
+import time
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Iterator, TextIO
+from uuid import uuid4
+from marshmallow import ValidationError
+from sqlalchemy import insert
+from backend import db
+from ..models import Budget, Transaction
+from ..schemas.transaction_schema import TransactionSchema
+from .db_helpers import sanitize_input
+from .logger import logger
+from .unit_of_work import commit_or_flush, mark_changed
+
+IMPORT_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 50
+
+transactions_schema = TransactionSchema(many=True)
+
+
+def open_reader(stream: TextIO) -> csv.DictReader:
+    """
+    Opens a CSV stream of transactions and checks its header.
+
+    Malformed quoting is an error rather than being read leniently.
+
+    Raises:
+        ValueError: If the header is malformed, misses required fields or
+            has unknown columns.
+    """
+    reader = csv.DictReader(stream, strict=True)
+    try:
+        header = reader.fieldnames or []
+    except csv.Error as e:
+        raise ValueError(f"Malformed CSV header: {e}") from e
+    fields = TransactionSchema().fields
+    missing = [name for name, field in fields.items()
+               if field.required and name not in header]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+    unknown = [name for name in header if name not in fields]
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+    return reader
+
+
+def read_chunks(reader: csv.DictReader, size: int) -> Iterator[list[dict]]:
+    """
+    Yields the rows of a CSV reader in lists of at most `size` rows.
+
+    When a row is malformed, the rows read before it are yielded first and
+    the `csv.Error` is raised after them, so callers can tell its number.
+    """
+    while True:
+        chunk = []
+        error = None
+        try:
+            chunk.extend(islice(reader, size))
+        except csv.Error as e:
+            error = e
+        if chunk:
+            yield [{key: value for key, value in row.items() if value != ""}
+                   for row in chunk]
+        if error is not None:
+            raise error
+        if not chunk:
+            return
+
+
+def import_transactions(
+    stream: TextIO,
+    user_id: str,
+    chunk_size: int = IMPORT_CHUNK_SIZE
+) -> tuple[dict, list[dict]]:
+    """
+    Imports a user's transactions from a CSV stream.
+
+    The stream is read and validated `chunk_size` rows at a time, and each
+    valid chunk is written with one executemany INSERT, so memory use does
+    not grow with the file. Budgets are reconciled once at the end instead
+    of being adjusted per row. The import is all-or-nothing: if any row is
+    invalid or malformed nothing is kept, and the first errors are
+    reported by row number, counting from 1 after the header.
+
+    Args:
+        stream (TextIO): The CSV text. The header names the transaction
+            fields: title, description, amount, type, date and category.
+        user_id (str): The id of the user that owns the transactions.
+        chunk_size (int): The number of rows validated and inserted at once.
+
+    Returns:
+        tuple[dict, list[dict]]: The import summary (rows, seconds and rows
+            per second) and the row errors, empty when it succeeded.
+
+    Raises:
+        ValueError: If the header is malformed, misses required fields or
+            has unknown columns.
+    """
+    start = time.perf_counter()
+    reader = open_reader(stream)
+    keys = list(TransactionSchema().fields)
+    imported = 0
+    read = 0
+    errors = []
+    try:
+        try:
+            for chunk in read_chunks(reader, chunk_size):
+                first_row = read + 1
+                read += len(chunk)
+                try:
+                    rows = transactions_schema.load(chunk)
+                except ValidationError as e:
+                    errors.extend(
+                        {"row": first_row + index, "errors": messages}
+                        for index, messages in e.messages.items())
+                    if len(errors) >= MAX_REPORTED_ERRORS:
+                        break
+                    continue
+                if errors:
+                    continue
+
+                now = datetime.now(timezone.utc)
+                db.session.execute(insert(Transaction), [
+                    {**sanitize_input(row, keys), "id": str(uuid4()),
+                     "user_id": user_id, "created_at": now,
+                     "updated_at": now}
+                    for row in rows
+                ])
+                imported += len(rows)
+        except csv.Error as e:
+            errors.append({"row": read + 1,
+                           "errors": {"_schema": [f"Malformed CSV: {e}"]}})
+
+        if errors:
+            db.session.rollback()
+            return {"rows": 0}, errors[:MAX_REPORTED_ERRORS]
+
+        if imported:
+            mark_changed(Transaction.__tablename__, user_id)
+            Budget.reconcile(user_id)
+        commit_or_flush()
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"[{Transaction.__name__}] Import failed: "
+                     f"{str(e.orig) if hasattr(e, 'orig') else e}")
+        raise
+
+    seconds = time.perf_counter() - start
+    summary = {
+        "rows": imported,
+        "seconds": round(seconds, 3),
+        "rows_per_second": round(imported / seconds) if seconds else imported,
+    }
+    logger.info(f"User {user_id} imported {imported} transactions "
+                f"({summary['rows_per_second']} rows/s)")
+    return summary, []
@@ -0,0 +1,140 @@
+"""Module that contains the request-scoped unit of work."""
+from itertools import chain
+from typing import Callable
+from flask import Flask, Response, g, has_request_context
+from sqlalchemy import event
+from backend.extensions import db
+from .response import json_response
+from .logger import logger
+
+CHANGES_KEY = "changed_collections"
+UNTRACKED_CHANGES_KEY = "untracked_collections"
+
+_change_listeners: list[Callable[[set[tuple[str, str]]], None]] = []
+
+
+def register_unit_of_work(app: Flask) -> None:
+    """
+    Unit of work registration.
+
+    Changes staged during a request are committed once after the view
+    returns a successful response, and rolled back otherwise.
+    """
+    @app.before_request
+    def begin_unit_of_work():
+        """Marks the request as running inside a unit of work."""
+        g.unit_of_work = True
+
+    @app.after_request
+    def finish_unit_of_work(response: Response) -> Response:
+        """Commits the request's changes, or rolls them back on errors."""
+        if not g.pop("unit_of_work", False):
+            return response
+
+        if response.status_code >= 400:
+            db.session.rollback()
+            return response
+
+        try:
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Unit of work commit failed: "
+                         f"{str(e.orig) if hasattr(e, 'orig') else e}")
+            logger.debug(f"Full SQL Error: {e}")
+            response = json_response(
+                status="error",
+                message="Internal server error"
+            )
+            response.status_code = 500
+        return response
+
+    @app.teardown_request
+    def discard_unit_of_work(exc: BaseException | None) -> None:
+        """Rolls back changes left over by an unhandled exception."""
+        if g.pop("unit_of_work", False) or exc is not None:
+            db.session.rollback()
+
+
+def in_unit_of_work() -> bool:
+    """Returns True when a request-scoped unit of work is active."""
+    return has_request_context() and g.get("unit_of_work", False)
+
+
+def commit_or_flush() -> None:
+    """
+    Commits the session, or only flushes it inside a unit of work.
+
+    Inside a request the flush sends the staged changes to the database,
+    so errors surface where they happen, and the unit of work commits
+    them at the end of the request. Outside a request, such as in the
+    console or tests, the changes are committed right away.
+    """
+    if in_unit_of_work():
+        db.session.flush()
+    else:
+        db.session.commit()
+
+
+def mark_changed(resource: str, user_id: str, tracked: bool = False) -> None:
+    """
+    Records that a user's collection changed in the current transaction.
+
+    ORM writes are recorded by the session automatically. Statements run
+    with `db.session.execute`, like bulk deletes, must call this.
+
+    Args:
+        resource (str): The table name of the collection.
+        user_id (str): The owner of the changed rows.
+        tracked (bool): Whether the statement reports the rows it changed
+            itself. Untracked changes make data derived from the rows, like
+            the dashboard stats, be recomputed.
+    """
+    db.session.info.setdefault(CHANGES_KEY, set()).add((resource, user_id))
+    if not tracked:
+        db.session.info.setdefault(UNTRACKED_CHANGES_KEY, set()).add(
+            (resource, user_id))
+
+
+def on_changes_committed(
+    listener: Callable[[set[tuple[str, str]]], None]
+) -> None:
+    """
+    Registers a function called after each commit that changed data.
+
+    The listener gets the set of (table name, user id) pairs changed by
+    the committed transaction.
+    """
+    if listener not in _change_listeners:
+        _change_listeners.append(listener)
+
+
+@event.listens_for(db.session, "after_flush")
+def collect_changes(session, flush_context) -> None:
+    """Records the collections touched by the flushed objects."""
+    changes = session.info.setdefault(CHANGES_KEY, set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        user_id = getattr(obj, "user_id", None)
+        if user_id:
+            changes.add((obj.__tablename__, user_id))
+
+
+@event.listens_for(db.session, "after_commit")
+def publish_changes(session) -> None:
+    """Passes the committed changes to the registered listeners."""
+    session.info.pop(UNTRACKED_CHANGES_KEY, None)
+    changes = session.info.pop(CHANGES_KEY, None)
+    if not changes:
+        return
+    for listener in _change_listeners:
+        try:
+            listener(changes)
+        except Exception as e:
+            logger.error(f"Change listener {listener.__name__} failed: {e}")
+
+
+@event.listens_for(db.session, "after_rollback")
+def discard_changes(session) -> None:
+    """Forgets the changes of a rolled back transaction."""
+    session.info.pop(CHANGES_KEY, None)
+    session.info.pop(UNTRACKED_CHANGES_KEY, None)
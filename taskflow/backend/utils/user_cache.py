@@ -0,0 +1,122 @@
+"""Module that contains the cache used to load logged in users."""
+import json
+from datetime import date, datetime
+from flask import Flask
+from redis import exceptions as redis_exceptions
+from sqlalchemy import Date, DateTime, inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from .cache import LRUCache
+from .logger import logger
+
+
+class UserCache():
+    """
+    Short-lived cache of users loaded by Flask-Login.
+
+    Users are cached as a dict of their public column values, in an
+    in-process LRU and, when configured, in Redis. Every lookup returns a
+    new detached instance, so reading its columns never queries the
+    database. Relationships are not loaded and cannot be used on it.
+    """
+
+    def __init__(self) -> None:
+        """Creates a cache that is configured by `init_app`."""
+        self.local = LRUCache()
+        self.redis = None
+        self.ttl = 60
+        self.key_prefix = "taskflow:user:"
+
+    def init_app(self, app: Flask) -> None:
+        """Configures the cache from the app config."""
+        self.ttl = app.config.get("USER_CACHE_TTL", 60)
+        self.local = LRUCache(
+            maxsize=app.config.get("USER_CACHE_SIZE", 1024), ttl=self.ttl)
+        self.redis = app.config.get("USER_CACHE_REDIS")
+
+    def load(self, model: type, user_id: str) -> object:
+        """
+        Returns a detached user, loading it from the database on a miss.
+
+        Args:
+            model (type): The user model class.
+            user_id (str): The id of the user.
+
+        Returns:
+            object: A detached user instance, or None if it does not exist.
+        """
+        values = self.local.get(user_id)
+        if values is None:
+            values = self._redis_get(model, user_id)
+            if values is None:
+                from backend.extensions import db
+                user = db.session.get(model, user_id)
+                if user is None:
+                    return None
+                values = self.snapshot(user)
+                self._redis_set(user_id, values)
+            self.local.set(user_id, values)
+
+        return self.detached(model, values)
+
+    def invalidate(self, user_id: str) -> None:
+        """Removes a user from every cache tier."""
+        self.local.delete(user_id)
+        if self.redis is not None:
+            try:
+                self.redis.delete(self.key_prefix + user_id)
+            except redis_exceptions.RedisError as e:
+                logger.warning(f"User cache invalidation failed: {e}")
+
+    @staticmethod
+    def snapshot(user: object) -> dict:
+        """Returns the public column values of a user."""
+        return {attr.key: getattr(user, attr.key)
+                for attr in inspect(type(user)).column_attrs
+                if not attr.key.startswith("_")}
+
+    @staticmethod
+    def detached(model: type, values: dict) -> object:
+        """Builds a detached instance holding the given column values."""
+        user = model.__mapper__.class_manager.new_instance()
+        for key, value in values.items():
+            set_committed_value(user, key, value)
+        make_transient_to_detached(user)
+        return user
+
+    def _redis_get(self, model: type, user_id: str) -> dict | None:
+        """Returns a user's cached values from Redis, if any."""
+        if self.redis is None:
+            return None
+        try:
+            raw = self.redis.get(self.key_prefix + user_id)
+        except redis_exceptions.RedisError as e:
+            logger.warning(f"User cache read failed: {e}")
+            return None
+        if raw is None:
+            return None
+
+        values = json.loads(raw)
+        for attr in inspect(model).column_attrs:
+            value = values.get(attr.key)
+            if value is None:
+                continue
+            column_type = attr.columns[0].type
+            if isinstance(column_type, DateTime):
+                values[attr.key] = datetime.fromisoformat(value)
+            elif isinstance(column_type, Date):
+                values[attr.key] = date.fromisoformat(value)
+        return values
+
+    def _redis_set(self, user_id: str, values: dict) -> None:
+        """Caches a user's values in Redis."""
+        if self.redis is None:
+            return
+        raw = json.dumps({
+            key: value.isoformat() if isinstance(value, date) else value
+            for key, value in values.items()
+        })
+        try:
+            self.redis.setex(self.key_prefix + user_id, self.ttl, raw)
+        except redis_exceptions.RedisError as e:
+            logger.warning(f"User cache write failed: {e}")
@@ -6,6 +6,10 @@ from backend.models.user import User
 from backend.models.task import Task
 from backend.models.note import Note
 from backend.models.habit import Habit
+from backend.models.budget import Budget
+from backend.models.tombstone import Tombstone
+from backend.models.user_stats import UserStats
+from backend.utils.transaction_import import import_transactions
 from backend.app import app
 from datetime import datetime
 from backend.utils.coverters import string_to_bool
@@ -268,6 +272,81 @@ class TaskflowShell(cmd.Cmd):
             except Exception as e:
                 print(f"(ERROR) ** Failed to fetch instances of the class: {e} **")
 
+    def do_reconcile(self, arg):
+        """Recalculates the spent amount of budgets from their transactions.
+        Usage: reconcile [user_id]"""
+        args = shlex.split(arg)
+        user_id = args[0] if args else None
+        with app.app_context():
+            try:
+                Budget.reconcile(user_id)
+                target = f"user {user_id}" if user_id else "all users"
+                print(f"(INFO) ** Budgets reconciled for {target} **")
+            except Exception as e:
+                print(f"(ERROR) ** Failed to reconcile budgets: {e} **")
+
+    def do_rebuild_stats(self, arg):
+        """Recomputes the dashboard statistics of users.
+        Usage: rebuild_stats [user_id]"""
+        args = shlex.split(arg)
+        user_id = args[0] if args else None
+        with app.app_context():
+            try:
+                count = UserStats.rebuild(user_id)
+                print(f"(INFO) ** Stats rebuilt for {count} users **")
+            except Exception as e:
+                print(f"(ERROR) ** Failed to rebuild stats: {e} **")
+
+    def do_rebuild_streaks(self, arg):
+        """Recomputes habit streaks from their completion history.
+        Usage: rebuild_streaks [user_id]"""
+        args = shlex.split(arg)
+        user_id = args[0] if args else None
+        with app.app_context():
+            try:
+                count = Habit.rebuild_streaks(user_id)
+                print(f"(INFO) ** Streaks changed for {count} habits **")
+            except Exception as e:
+                print(f"(ERROR) ** Failed to rebuild streaks: {e} **")
+
+    def do_prune_tombstones(self, arg):
+        """Deletes sync tombstones older than the retention window.
+        Usage: prune_tombstones"""
+        with app.app_context():
+            try:
+                count = Tombstone.prune()
+                print(f"(INFO) ** Pruned {count} tombstones **")
+            except Exception as e:
+                print(f"(ERROR) ** Failed to prune tombstones: {e} **")
+
+    def do_import_transactions(self, arg):
+        """Imports a user's transactions from a CSV file.
+        Usage: import_transactions <user_id> <path> [chunk_size]"""
+        args = shlex.split(arg)
+        if len(args) < 2:
+            print("(ERROR) ** Usage: import_transactions <user_id> <path> "
+                  "[chunk_size] **")
+            return
+        user_id, path = args[0], args[1]
+        with app.app_context():
+            try:
+                chunk_size = int(args[2]) if len(args) > 2 else \
+                    app.config.get("IMPORT_CHUNK_SIZE", 1000)
+                with open(path, newline="", encoding="utf-8-sig") as stream:
+                    summary, errors = import_transactions(
+                        stream, user_id, chunk_size)
+                for error in errors:
+                    print(f"(ERROR) ** Row {error['row']}: "
+                          f"{error['errors']} **")
+                if errors:
+                    print("(ERROR) ** Nothing was imported **")
+                    return
+                print(f"(INFO) ** Imported {summary['rows']} transactions in "
+                      f"{summary['seconds']} s "
+                      f"({summary['rows_per_second']} rows/s) **")
+            except Exception as e:
+                print(f"(ERROR) ** Failed to import transactions: {e} **")
+
 
 if __name__ == "__main__":
     try:
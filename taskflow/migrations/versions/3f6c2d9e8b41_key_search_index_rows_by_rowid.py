@@ -0,0 +1,105 @@
+"""key search index rows by rowid
+
+Revision ID: 3f6c2d9e8b41
+Revises: 8a8b15eb2315
+Create Date: 2026-10-18 05:55:12.204318
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '3f6c2d9e8b41'
+down_revision = '8a8b15eb2315'
+branch_labels = None
+depends_on = None
+
+# (resource, table, title column, body column)
+SOURCES = [
+    ("notes", "notes", "title", "content"),
+    ("tasks", "tasks", "title", "description"),
+]
+MATCH_OLD = "search_index MATCH 'object_id : \"' || old.id || '\"'"
+OLD_ROWID = "(SELECT id FROM search_index_keys WHERE object_id = old.id)"
+
+
+def drop_index():
+    for resource, table, title, body in SOURCES:
+        for action in ("insert", "update", "delete"):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_search_{action}")
+    op.execute("DROP TABLE IF EXISTS search_index")
+    op.execute("DROP TABLE IF EXISTS search_index_keys")
+
+
+def upgrade():
+    if op.get_context().dialect.name != "sqlite":
+        return
+    drop_index()
+    op.execute(
+        "CREATE TABLE search_index_keys ("
+        "id INTEGER PRIMARY KEY, object_id VARCHAR(36) NOT NULL UNIQUE)")
+    op.execute(
+        "CREATE VIRTUAL TABLE search_index USING fts5("
+        "title, body, user_id, object_id UNINDEXED, resource UNINDEXED, "
+        "tokenize='unicode61 remove_diacritics 2')")
+    for resource, table, title, body in SOURCES:
+        op.execute(
+            f"CREATE TRIGGER {table}_search_insert "
+            f"AFTER INSERT ON {table} BEGIN "
+            "INSERT INTO search_index_keys (object_id) VALUES (new.id); "
+            "INSERT INTO search_index "
+            "(rowid, title, body, user_id, object_id, resource) VALUES "
+            f"(last_insert_rowid(), new.{title}, new.{body}, new.user_id, "
+            f"new.id, '{resource}'); END")
+        op.execute(
+            f"CREATE TRIGGER {table}_search_update "
+            f"AFTER UPDATE OF {title}, {body}, user_id ON {table} "
+            f"BEGIN UPDATE search_index SET title = new.{title}, "
+            f"body = new.{body}, user_id = new.user_id "
+            f"WHERE rowid = {OLD_ROWID}; END")
+        op.execute(
+            f"CREATE TRIGGER {table}_search_delete "
+            f"AFTER DELETE ON {table} BEGIN "
+            f"DELETE FROM search_index WHERE rowid = {OLD_ROWID}; "
+            "DELETE FROM search_index_keys WHERE object_id = old.id; END")
+        op.execute(
+            f"INSERT INTO search_index_keys (object_id) SELECT id FROM {table}")
+        op.execute(
+            "INSERT INTO search_index "
+            "(rowid, title, body, user_id, object_id, resource) "
+            f"SELECT search_index_keys.id, {table}.{title}, {table}.{body}, "
+            f"{table}.user_id, {table}.id, '{resource}' FROM {table} "
+            f"JOIN search_index_keys ON search_index_keys.object_id "
+            f"= {table}.id")
+
+
+def downgrade():
+    if op.get_context().dialect.name != "sqlite":
+        return
+    drop_index()
+    op.execute(
+        "CREATE VIRTUAL TABLE search_index USING fts5("
+        "title, body, user_id, object_id, resource UNINDEXED, "
+        "tokenize='unicode61 remove_diacritics 2')")
+    for resource, table, title, body in SOURCES:
+        op.execute(
+            f"CREATE TRIGGER {table}_search_insert "
+            f"AFTER INSERT ON {table} BEGIN INSERT INTO search_index "
+            "(title, body, user_id, object_id, resource) VALUES "
+            f"(new.{title}, new.{body}, new.user_id, new.id, "
+            f"'{resource}'); END")
+        op.execute(
+            f"CREATE TRIGGER {table}_search_update "
+            f"AFTER UPDATE OF {title}, {body}, user_id ON {table} "
+            f"BEGIN UPDATE search_index SET title = new.{title}, "
+            f"body = new.{body}, user_id = new.user_id "
+            f"WHERE {MATCH_OLD}; END")
+        op.execute(
+            f"CREATE TRIGGER {table}_search_delete "
+            f"AFTER DELETE ON {table} BEGIN "
+            f"DELETE FROM search_index WHERE {MATCH_OLD}; END")
+        op.execute(
+            "INSERT INTO search_index "
+            "(title, body, user_id, object_id, resource) "
+            f"SELECT {title}, {body}, user_id, id, '{resource}' "
+            f"FROM {table}")
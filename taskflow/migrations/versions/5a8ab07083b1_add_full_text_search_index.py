@@ -0,0 +1,71 @@
+"""add full text search index
+
+Revision ID: 5a8ab07083b1
+Revises: c30c18b0189e
+Create Date: 2026-10-18 05:12:10.418302
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5a8ab07083b1'
+down_revision = 'c30c18b0189e'
+branch_labels = None
+depends_on = None
+
+# (resource, table, title column, body column)
+SOURCES = [
+    ("notes", "notes", "title", "content"),
+    ("tasks", "tasks", "title", "description"),
+]
+MATCH_OLD = "search_index MATCH 'object_id : \"' || old.id || '\"'"
+
+
+def upgrade():
+    dialect = op.get_context().dialect.name
+    if dialect == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+            "title, body, user_id, object_id, resource UNINDEXED, "
+            "tokenize='unicode61 remove_diacritics 2')")
+        for resource, table, title, body in SOURCES:
+            op.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {table}_search_insert "
+                f"AFTER INSERT ON {table} BEGIN INSERT INTO search_index "
+                "(title, body, user_id, object_id, resource) VALUES "
+                f"(new.{title}, new.{body}, new.user_id, new.id, "
+                f"'{resource}'); END")
+            op.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {table}_search_update "
+                f"AFTER UPDATE OF {title}, {body}, user_id ON {table} "
+                f"BEGIN UPDATE search_index SET title = new.{title}, "
+                f"body = new.{body}, user_id = new.user_id "
+                f"WHERE {MATCH_OLD}; END")
+            op.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {table}_search_delete "
+                f"AFTER DELETE ON {table} BEGIN "
+                f"DELETE FROM search_index WHERE {MATCH_OLD}; END")
+            op.execute(
+                "INSERT INTO search_index "
+                "(title, body, user_id, object_id, resource) "
+                f"SELECT {title}, {body}, user_id, id, '{resource}' "
+                f"FROM {table}")
+    elif dialect == "postgresql":
+        for resource, table, title, body in SOURCES:
+            op.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_search ON {table} "
+                f"USING gin (to_tsvector('english', coalesce({title}, '') "
+                f"|| ' ' || coalesce({body}, '')))")
+
+
+def downgrade():
+    dialect = op.get_context().dialect.name
+    if dialect == "sqlite":
+        for resource, table, title, body in SOURCES:
+            for action in ("insert", "update", "delete"):
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_search_{action}")
+        op.execute("DROP TABLE IF EXISTS search_index")
+    elif dialect == "postgresql":
+        for resource, table, title, body in SOURCES:
+            op.execute(f"DROP INDEX IF EXISTS ix_{table}_search")